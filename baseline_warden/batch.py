@@ -0,0 +1,224 @@
+"""Batch scanning of many local repositories with one shared Baseline index.
+
+The lock is loaded and indexed once per ``bw scan-many`` invocation. Worker
+processes receive the index once through the pool initializer and reuse it
+read-only for every repository they scan.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tomllib
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from .config import BaselineWardenConfig, ConflictStrategy, load_config
+from .detect import SuppressionIndex, collect_detections
+from .evaluate.policy import EvaluationSummary, evaluate_detections
+from .evaluate.resolve import BaselineIndex
+from .outputs.json import write_json
+
+DEFAULT_CONFIG_NAME = "baseline-warden.toml"
+
+
+class ManifestRepository(BaseModel):
+    path: Path
+    name: Optional[str] = None
+    config: Optional[Path] = Field(
+        default=None,
+        description="Config path relative to the repository; defaults to baseline-warden.toml when present.",
+    )
+
+    @property
+    def display_name(self) -> str:
+        return self.name or self.path.name
+
+
+class ManifestScanOptions(BaseModel):
+    workers: int = Field(default_factory=lambda: os.cpu_count() or 1)
+    out_dir: Path = Path("bw-reports")
+    conflict_strategy: ConflictStrategy = Field(
+        "first",
+        description="How the shared index resolves BCD keys listed by several features.",
+    )
+
+
+class ScanManifest(BaseModel):
+    scan: ManifestScanOptions = Field(default_factory=ManifestScanOptions)
+    repos: List[ManifestRepository] = Field(default_factory=list)
+
+
+@dataclass
+class RepositoryResult:
+    name: str
+    path: Path
+    report_path: Optional[Path] = None
+    summary: Optional[EvaluationSummary] = None
+    detections: int = 0
+    error: Optional[str] = None
+
+    @property
+    def failed(self) -> bool:
+        return self.summary is not None and self.summary.has_failures()
+
+
+@dataclass
+class BatchResult:
+    repositories: List[RepositoryResult] = field(default_factory=list)
+    rollup_path: Optional[Path] = None
+
+    @property
+    def has_failures(self) -> bool:
+        return any(result.failed for result in self.repositories)
+
+    @property
+    def has_errors(self) -> bool:
+        return any(result.error for result in self.repositories)
+
+
+def load_manifest(path: Path) -> ScanManifest:
+    """Load a manifest, resolving relative paths against its directory."""
+
+    manifest = ScanManifest.model_validate(tomllib.loads(path.read_text()))
+    base = path.parent
+    for repo in manifest.repos:
+        if not repo.path.is_absolute():
+            repo.path = (base / repo.path).resolve()
+    if not manifest.scan.out_dir.is_absolute():
+        manifest.scan.out_dir = base / manifest.scan.out_dir
+    names = Counter(repo.display_name for repo in manifest.repos)
+    duplicates = sorted(name for name, count in names.items() if count > 1)
+    if duplicates:
+        raise ValueError(f"Duplicate repository names in manifest: {', '.join(duplicates)}; set `name` explicitly")
+    return manifest
+
+
+def _repository_config(repo: ManifestRepository) -> BaselineWardenConfig:
+    config_path = repo.path / (repo.config or DEFAULT_CONFIG_NAME)
+    if config_path.exists():
+        return load_config(config_path)
+    if repo.config:
+        raise FileNotFoundError(f"Config not found: {config_path}")
+    return BaselineWardenConfig()
+
+
+def scan_repository(repo: ManifestRepository, index: BaselineIndex, out_dir: Path) -> RepositoryResult:
+    """Scan one repository with a prebuilt index and write its ``report.json``."""
+
+    result = RepositoryResult(name=repo.display_name, path=repo.path)
+    try:
+        if not repo.path.is_dir():
+            raise FileNotFoundError(f"Repository not found: {repo.path}")
+        config = _repository_config(repo)
+        suppressions: Dict[Path, SuppressionIndex] = {}
+        html_keys = index.html_keys(exhaustive=config.include.exhaustive)
+        detections = collect_detections(repo.path, config, suppressions=suppressions, html_keys=html_keys)
+        findings, summary = evaluate_detections(index, detections, config, suppressions=suppressions)
+        report_dir = out_dir / result.name
+        report_dir.mkdir(parents=True, exist_ok=True)
+        report_path = report_dir / "report.json"
+        write_json(findings, summary, report_path)
+    except Exception as exc:  # noqa: BLE001 - one broken repo must not abort the batch
+        result.error = f"{type(exc).__name__}: {exc}"
+        return result
+    result.report_path = report_path
+    result.summary = summary
+    result.detections = len(detections)
+    return result
+
+
+_WORKER_INDEX: Optional[BaselineIndex] = None
+
+
+def _init_worker(index: BaselineIndex) -> None:
+    global _WORKER_INDEX
+    _WORKER_INDEX = index
+
+
+def _scan_in_worker(repo: ManifestRepository, out_dir: Path) -> RepositoryResult:
+    assert _WORKER_INDEX is not None, "worker initializer did not run"
+    return scan_repository(repo, _WORKER_INDEX, out_dir)
+
+
+def scan_many(
+    manifest: ScanManifest,
+    index: BaselineIndex,
+    *,
+    workers: Optional[int] = None,
+) -> BatchResult:
+    """Scan every manifest repository and write per-repo reports plus ``rollup.json``."""
+
+    out_dir = manifest.scan.out_dir
+    out_dir.mkdir(parents=True, exist_ok=True)
+    worker_count = max(1, min(workers or manifest.scan.workers, len(manifest.repos) or 1))
+
+    if worker_count == 1:
+        results = [scan_repository(repo, index, out_dir) for repo in manifest.repos]
+    else:
+        with ProcessPoolExecutor(max_workers=worker_count, initializer=_init_worker, initargs=(index,)) as pool:
+            results = list(pool.map(_scan_in_worker, manifest.repos, [out_dir] * len(manifest.repos)))
+
+    batch = BatchResult(repositories=results)
+    batch.rollup_path = out_dir / "rollup.json"
+    write_rollup(batch, batch.rollup_path)
+    return batch
+
+
+def write_rollup(batch: BatchResult, path: Path) -> None:
+    outcomes: Counter = Counter()
+    statuses: Counter = Counter()
+    total = 0
+    repositories: List[Dict[str, Any]] = []
+    for result in batch.repositories:
+        entry: Dict[str, Any] = {
+            "name": result.name,
+            "path": str(result.path),
+            "report": str(result.report_path) if result.report_path else None,
+            "error": result.error,
+        }
+        if result.summary is not None:
+            total += result.summary.total
+            outcomes.update(result.summary.outcomes)
+            statuses.update(result.summary.statuses)
+            entry.update(
+                {
+                    "failed": result.failed,
+                    "total": result.summary.total,
+                    "outcomes": result.summary.outcomes,
+                    "statuses": result.summary.statuses,
+                }
+            )
+        repositories.append(entry)
+
+    data = {
+        "version": "1",
+        "generated_at": datetime.now(UTC).isoformat(),
+        "summary": {
+            "repositories": len(batch.repositories),
+            "failed": sum(1 for result in batch.repositories if result.failed),
+            "errors": sum(1 for result in batch.repositories if result.error),
+            "total": total,
+            "outcomes": outcomes,
+            "statuses": statuses,
+        },
+        "repositories": repositories,
+    }
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+__all__ = [
+    "BatchResult",
+    "ManifestRepository",
+    "RepositoryResult",
+    "ScanManifest",
+    "load_manifest",
+    "scan_many",
+    "scan_repository",
+]
@@ -2,29 +2,43 @@
 
 from __future__ import annotations
 
+import cProfile
+import json
+from datetime import date
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 import typer
 
 import httpx
 
+from .batch import load_manifest, scan_many as run_scan_many
 from .config import BaselineWardenConfig, load_config
-from .index.build import (
-    assemble_lock_features,
-    build_web_features_index,
-    fetch_web_features_dataset,
-)
-from .detect import collect_detections
-from .evaluate.policy import evaluate_detections
-from .evaluate.resolve import build_index
-from .index.cache import BaselineLock, compute_sha256, get_cache_dir, load_lock, write_lock
+from .index.build import build_lock, fetch_web_features_dataset
+from .detect import ScanStrings, SuppressionIndex, collect_detections
+from .evaluate.baseline import BaselineDiff, diff_findings, load_baseline_report
+from .evaluate.cache import EVALUATIONS_DIR, EvaluationCache, evaluate_with_cache, policy_hash
+from .evaluate.policy import EvaluationSummary, Finding, compile_policy, evaluate_detections, summarize_findings
+from .evaluate.rollup import GROUP_BY_CHOICES, FindingRollup, rollup_findings
+from .evaluate.resolve import CONFLICT_STRATEGIES, build_index, index_stats
+from .index.cache import BaselineLock, compute_sha256, get_cache_dir, load_lock, lock_digest, read_lock_payload, write_lock
+from .index.diff import diff_locks, load_detection_index, write_detection_index
 from .index.fetch import fetch_features
+from .index.offline import load_bundle, load_local_sources, write_bundle
 from .outputs.gh_annotations import emit_annotations
-from .outputs.json import write_json
+from .outputs.html import HTML_REPORT_DIR, write_html
+from .outputs.json import write_json, write_jsonl
+from .outputs.sarif import write_sarif
 from .outputs.table import render_console
+from .memory import MemoryTracker
+from .profiling import ScanProfiler, trace_enabled
+from .workspace import evaluate_workspace
 
 app = typer.Typer(help="Baseline compatibility gate for web projects.")
+lock_app = typer.Typer(help="Inspect Baseline lock snapshots.")
+app.add_typer(lock_app, name="lock")
+index_app = typer.Typer(help="Inspect the in-memory Baseline index built from a lock.")
+app.add_typer(index_app, name="index")
 
 DEFAULT_CONFIG_PATH = Path("baseline-warden.toml")
 DEFAULT_LOCK_PATH = Path("baseline.lock.json")
@@ -32,7 +46,8 @@ DEFAULT_LOCK_PATH = Path("baseline.lock.json")
 
 def _load_config(path: Path) -> BaselineWardenConfig:
     if not path.exists():
-        raise typer.Exit(code=2, message=f"Config not found: {path}")
+        typer.echo(f"Config not found: {path}", err=True)
+        raise typer.Exit(code=2)
     return load_config(path)
 
 
@@ -41,13 +56,80 @@ def sync(
     lock: bool = typer.Option(False, "--lock", help="Persist resolved Baseline data to baseline.lock.json."),
     out_path: Path = typer.Option(DEFAULT_LOCK_PATH, "--lock-path", help="Path to the lock snapshot."),
     refresh: bool = typer.Option(False, "--refresh", help="Ignore caches and refetch remote datasets."),
+    compact: bool = typer.Option(False, "--compact", help="Write the lock without indentation."),
+    from_web_features: Optional[Path] = typer.Option(
+        None,
+        "--from",
+        help="Build offline from a local web-features data.json (requires --from-status).",
+    ),
+    from_status: Optional[Path] = typer.Option(
+        None,
+        "--from-status",
+        help="Local Web Status export (sync cache file or API response) for offline builds.",
+    ),
+    bundle: Optional[Path] = typer.Option(
+        None,
+        "--bundle",
+        help="Build offline from a tarball holding web-features.json and webstatus.json.",
+    ),
+    write_bundle_path: Optional[Path] = typer.Option(
+        None,
+        "--write-bundle",
+        help="After an online sync, bundle the fetched datasets into this tarball.",
+    ),
 ) -> None:
-    """Fetch Baseline data and optionally persist a lock snapshot."""
+    """Fetch Baseline data and optionally persist a lock snapshot.
 
-    if not lock:
+    With --from/--from-status or --bundle, the lock is built from local files
+    without network access.
+    """
+
+    offline = bool(from_web_features or from_status or bundle)
+    if write_bundle_path and (offline or not lock):
+        # Only an online sync fetches the datasets that go into a bundle.
+        typer.echo("--write-bundle needs an online sync with --lock.", err=True)
+        raise typer.Exit(code=2)
+    if offline:
+        snapshot = _offline_snapshot(from_web_features, from_status, bundle)
+    elif not lock:
         typer.echo("Sync is stubbed in the MVP scaffold; use --lock to generate a placeholder lock file.")
         raise typer.Exit(code=0)
+    else:
+        snapshot = _online_snapshot(refresh=refresh, write_bundle_path=write_bundle_path)
+
+    digest = write_lock(out_path, snapshot, compact=compact)
 
+    typer.echo(
+        "Created Baseline lock file at "
+        f"{out_path} ({snapshot.feature_count} features; generated_at={snapshot.generated_at.isoformat()}; "
+        f"digest={digest})"
+    )
+
+
+def _offline_snapshot(
+    from_web_features: Optional[Path],
+    from_status: Optional[Path],
+    bundle: Optional[Path],
+) -> BaselineLock:
+    if bundle and (from_web_features or from_status):
+        typer.echo("Use either --bundle or --from/--from-status, not both.", err=True)
+        raise typer.Exit(code=2)
+    if not bundle and not (from_web_features and from_status):
+        typer.echo("Offline sync needs both --from and --from-status.", err=True)
+        raise typer.Exit(code=2)
+    for path in (bundle, from_web_features, from_status):
+        if path is not None and not path.exists():
+            typer.echo(f"File not found: {path}", err=True)
+            raise typer.Exit(code=2)
+    try:
+        sources = load_bundle(bundle) if bundle else load_local_sources(from_web_features, from_status)  # type: ignore[arg-type]
+    except ValueError as exc:
+        typer.echo(f"Invalid offline dataset: {exc}", err=True)
+        raise typer.Exit(code=2)
+    return build_lock(sources.dataset, sources.baseline, metadata=sources.metadata)
+
+
+def _online_snapshot(*, refresh: bool, write_bundle_path: Optional[Path]) -> BaselineLock:
     cache_dir = get_cache_dir()
     cache_dir.mkdir(parents=True, exist_ok=True)
     web_features_cache = cache_dir / "web-features.json"
@@ -55,12 +137,11 @@ def sync(
 
     try:
         dataset = fetch_web_features_dataset(cache_path=web_features_cache, force_refresh=refresh)
-        index = build_web_features_index(dataset)
         baseline_result = fetch_features(cache_path=baseline_cache, force_refresh=refresh)
-    except httpx.HTTPError as exc:  # pragma: no cover - network failure
-        raise typer.Exit(code=1, message=f"Failed to fetch Baseline data: {exc}")
+    except httpx.HTTPError as exc:
+        typer.echo(f"Failed to fetch Baseline data: {exc}", err=True)
+        raise typer.Exit(code=1)
 
-    lock_entries = assemble_lock_features(index=index, baseline_features=baseline_result.features)
     lock_metadata = {
         "web_features": {
             "cache_path": str(web_features_cache),
@@ -72,13 +153,57 @@ def sync(
             "total": baseline_result.total,
         },
     }
-    snapshot = BaselineLock(features=lock_entries, metadata=lock_metadata)
-    write_lock(out_path, snapshot)
+    if write_bundle_path:
+        write_bundle(write_bundle_path, web_features_cache, baseline_cache)
+        typer.echo(f"Wrote offline bundle to {write_bundle_path}")
+    return build_lock(dataset, baseline_result, metadata=lock_metadata)
 
-    typer.echo(
-        "Created Baseline lock file at "
-        f"{out_path} ({snapshot.feature_count} features; generated_at={snapshot.generated_at.isoformat()})"
-    )
+
+def _emit_output(
+    fmt: str,
+    findings: List[Finding],
+    summary: EvaluationSummary,
+    *,
+    root: Path,
+    summary_only: bool,
+    rollup: Optional[FindingRollup],
+    diff: Optional[BaselineDiff],
+    annotation_limit: int,
+    strings: ScanStrings,
+) -> None:
+    # Reports keep every finding so they can serve as the next baseline; the
+    # console and annotations only show what is new.
+    resolved = diff.resolved if diff else None
+    baseline = diff.summary_record() if diff else None
+    if fmt == "console":
+        if diff is not None:
+            rollup = rollup_findings(diff.new, rollup.group_by, strings=strings) if rollup else None
+            findings, summary = diff.new, summarize_findings(diff.new)
+        render_console(findings, summary, root=root, summary_only=summary_only, rollup=rollup)
+    elif fmt == "json":
+        report_path = Path("report.json")
+        write_json(findings, summary, report_path, rollup=rollup, resolved=resolved, baseline=baseline, strings=strings)
+        typer.echo(f" Wrote JSON report to {report_path}")
+    elif fmt == "jsonl":
+        report_path = Path("report.jsonl")
+        sidecar = write_jsonl(
+            findings, summary, report_path, rollup=rollup, resolved=resolved, baseline=baseline, strings=strings
+        )
+        typer.echo(f" Wrote JSON Lines report to {report_path} (summary: {sidecar})")
+    elif fmt == "sarif":
+        report_path = Path("report.sarif")
+        result_count = write_sarif(findings, summary, report_path, strings=strings)
+        typer.echo(f" Wrote SARIF report to {report_path} ({result_count} results)")
+    elif fmt == "html":
+        html_report = write_html(findings, summary, HTML_REPORT_DIR, strings=strings)
+        typer.echo(
+            f" Wrote HTML report to {html_report.index_path} "
+            f"({html_report.findings} findings in {html_report.shards} shards)"
+        )
+    elif fmt == "gh-annotations":
+        emit_annotations(diff.new if diff else findings, limit=annotation_limit, strings=strings)
+    else:
+        typer.echo(f" Unknown output format '{fmt}' ignored.")
 
 
 @app.command()
@@ -88,6 +213,11 @@ def scan(
     ci: bool = typer.Option(False, "--ci", help="Enable CI-friendly behavior (non-zero exit on limited features)."),
     dry_run: bool = typer.Option(False, "--dry-run", help="Run detectors without policy enforcement."),
     summary_only: bool = typer.Option(False, "--summary-only", help="Show only summary lines for console output."),
+    group_by: Optional[str] = typer.Option(
+        None,
+        "--group-by",
+        help="Aggregate findings per feature, file, or bcd-key instead of one row per occurrence.",
+    ),
     paths: Optional[List[str]] = typer.Option(
         None,
         "--paths",
@@ -98,6 +228,62 @@ def scan(
         "--lock-path",
         help="Path to baseline.lock.json produced by `bw sync --lock`.",
     ),
+    baseline_report: Optional[Path] = typer.Option(
+        None,
+        "--baseline-report",
+        help="Previous report.json; only findings that are new since it are reported and gated.",
+    ),
+    as_of: Optional[str] = typer.Option(
+        None,
+        "--as-of",
+        help="Reference date (YYYY-MM-DD) for policy.newly_min_age_months; defaults to today.",
+    ),
+    workspace: bool = typer.Option(
+        False,
+        "--workspace",
+        help="Apply nested baseline-warden.toml files to the directories that contain them.",
+    ),
+    detection_index: Optional[Path] = typer.Option(
+        None,
+        "--detection-index",
+        help="Write a BCD key -> files index for `bw lock diff --detection-index` (implies --exhaustive).",
+    ),
+    exhaustive: bool = typer.Option(
+        False,
+        "--exhaustive",
+        help="Emit every HTML attribute key, including ones the lock does not map.",
+    ),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Record per-stage and per-file timings (also enabled by BW_TRACE=1).",
+    ),
+    profile_path: Path = typer.Option(
+        Path("profile.json"),
+        "--profile-path",
+        help="Where to write the timing report when profiling.",
+    ),
+    pstats_path: Optional[Path] = typer.Option(
+        None,
+        "--pstats",
+        help="Also run cProfile and dump pstats data to this path.",
+    ),
+    memory_report: bool = typer.Option(
+        False,
+        "--memory-report",
+        help="Trace heap and RSS per stage and print peak memory per 10k files and per detection.",
+    ),
+    annotation_limit: Optional[int] = typer.Option(
+        None,
+        "--annotation-limit",
+        min=0,
+        help="Maximum number of GitHub annotations (default: output.annotation_limit, 50).",
+    ),
+    no_eval_cache: bool = typer.Option(
+        False,
+        "--no-eval-cache",
+        help="Evaluate every detection instead of reusing cached findings for unchanged files.",
+    ),
 ) -> None:
     """Scan configured paths for non-Baseline features."""
 
@@ -109,17 +295,84 @@ def scan(
         )
         raise typer.Exit(code=2)
 
+    group_by = group_by or cfg.output.group_by
+    if group_by and group_by not in GROUP_BY_CHOICES:
+        typer.echo(
+            f"Unknown --group-by '{group_by}'; expected one of {', '.join(GROUP_BY_CHOICES)}.",
+            err=True,
+        )
+        raise typer.Exit(code=2)
+
+    if baseline_report and not baseline_report.exists():
+        typer.echo(f"Baseline report not found: {baseline_report}", err=True)
+        raise typer.Exit(code=2)
+
     lock = load_lock(lock_path)
     formats = out or cfg.output.formats
     root = Path.cwd()
 
+    if as_of:
+        try:
+            cfg.policy.as_of = date.fromisoformat(as_of)
+        except ValueError:
+            typer.echo(f"Invalid --as-of date '{as_of}'; expected YYYY-MM-DD.", err=True)
+            raise typer.Exit(code=2)
+
     if paths:
         # Shallow override of include paths for ad-hoc scans
         cfg.include.paths = list(paths)
 
-    detections = collect_detections(root, cfg)
-    index = build_index(lock)
-    findings, summary = evaluate_detections(index, detections, cfg)
+    profiler = ScanProfiler(enabled=profile or trace_enabled())
+    cprofile = cProfile.Profile() if pstats_path else None
+    if cprofile:
+        cprofile.enable()
+
+    memory = MemoryTracker(enabled=memory_report)
+    memory.start()
+
+    with profiler.stage("build_index") as timing, memory.stage("build_index") as usage:
+        index = build_index(lock, strategy=cfg.policy.conflict_strategy)
+        timing.items = usage.items = len(index.features_by_bcd)
+    # A detection index must also cover keys a future lock may map: unmapped
+    # attributes and new values of attributes the lock maps values for.
+    html_keys = index.html_keys(exhaustive=bool(exhaustive or cfg.include.exhaustive or detection_index))
+    suppressions: Dict[Path, SuppressionIndex] = {}
+    # Shared with the outputs so each file path is rendered once per scan.
+    strings = ScanStrings()
+    with memory.stage("collect_detections") as usage:
+        detections = collect_detections(
+            root,
+            cfg,
+            profiler=profiler,
+            suppressions=suppressions,
+            memory=memory,
+            html_keys=html_keys,
+            strings=strings,
+        )
+        usage.items = memory.detections = len(detections)
+    if detection_index:
+        write_detection_index(detection_index, detections)
+    eval_cache: Optional[EvaluationCache] = None
+    with profiler.stage("evaluate_detections") as timing, memory.stage("evaluate_detections") as usage:
+        if workspace:
+            findings, summary = evaluate_workspace(root, index, detections, cfg, suppressions=suppressions)
+        elif no_eval_cache:
+            findings, summary = evaluate_detections(index, detections, compile_policy(cfg), suppressions=suppressions)
+        else:
+            eval_cache = EvaluationCache(
+                get_cache_dir() / EVALUATIONS_DIR, lock_digest=lock_digest(lock), policy=policy_hash(cfg)
+            )
+            findings, summary = evaluate_with_cache(
+                index, detections, compile_policy(cfg), eval_cache, suppressions=suppressions
+            )
+            eval_cache.save()
+        timing.items = usage.items = len(findings)
+    diff = None
+    gate_summary = summary
+    if baseline_report:
+        diff = diff_findings(findings, load_baseline_report(baseline_report))
+        gate_summary = summarize_findings(diff.new)
+    rollup = rollup_findings(findings, group_by, strings=strings) if group_by else None
 
     typer.echo(
         f"Policy required_status={cfg.policy.required_status}, unknown_behavior={cfg.policy.unknown_behavior}"
@@ -127,24 +380,50 @@ def scan(
     typer.echo(
         f"Scanned {len(detections)} detections across {len(formats)} output format(s)."
     )
+    if eval_cache is not None and eval_cache.hits:
+        typer.echo(
+            f" Evaluation cache: {eval_cache.hits} of {eval_cache.hits + eval_cache.misses} files reused."
+        )
+    if diff is not None:
+        typer.echo(
+            f"Baseline diff against {baseline_report}: {len(diff.new)} new, {len(diff.resolved)} resolved, "
+            f"{diff.unchanged} unchanged."
+        )
 
     for fmt in formats:
-        if fmt == "console":
-            render_console(findings, summary, root=root, summary_only=summary_only)
-        elif fmt == "json":
-            report_path = Path("report.json")
-            write_json(findings, summary, report_path)
-            typer.echo(f" Wrote JSON report to {report_path}")
-        elif fmt == "gh-annotations":
-            emit_annotations(findings)
-        else:
-            typer.echo(f" Unknown output format '{fmt}' ignored.")
+        with profiler.stage(f"output:{fmt}"), memory.stage(f"output:{fmt}"):
+            _emit_output(
+                fmt,
+                findings,
+                summary,
+                root=root,
+                summary_only=summary_only,
+                rollup=rollup,
+                diff=diff,
+                annotation_limit=cfg.output.annotation_limit if annotation_limit is None else annotation_limit,
+                strings=strings,
+            )
+
+    if cprofile:
+        cprofile.disable()
+        cprofile.dump_stats(str(pstats_path))
+        typer.echo(f" Wrote cProfile stats to {pstats_path}")
+    if memory.enabled:
+        memory.stop()
+        typer.echo(" Memory report:")
+        for line in memory.summary_lines():
+            typer.echo(f"  {line}")
+    if profiler.enabled:
+        profiler.write(profile_path)
+        for line in profiler.summary_lines():
+            typer.echo(f"  {line}")
+        typer.echo(f" Wrote timing report to {profile_path}")
 
     if dry_run:
         typer.echo(" Dry run enabled; exiting without enforcing policy.")
         raise typer.Exit(code=0)
 
-    if summary.has_failures():
+    if gate_summary.has_failures():
         typer.echo(" Baseline violations detected.", err=True)
         raise typer.Exit(code=1)
 
@@ -152,5 +431,191 @@ def scan(
     raise typer.Exit(code=0)
 
 
+@app.command("scan-many")
+def scan_many(
+    manifest: Path = typer.Argument(..., help="Manifest TOML listing local repository checkouts."),
+    lock_path: Path = typer.Option(
+        DEFAULT_LOCK_PATH,
+        "--lock-path",
+        help="Path to baseline.lock.json shared by every repository.",
+    ),
+    workers: Optional[int] = typer.Option(None, "--workers", help="Worker processes (defaults to manifest or CPU count)."),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Run detectors without policy enforcement."),
+) -> None:
+    """Scan many repositories with one shared Baseline index."""
+
+    if not manifest.exists():
+        typer.echo(f"Manifest not found: {manifest}", err=True)
+        raise typer.Exit(code=2)
+    if not lock_path.exists():
+        typer.echo(
+            "Lock file not found. Run `bw sync --lock` before scanning or pass --lock-path.",
+            err=True,
+        )
+        raise typer.Exit(code=2)
+
+    try:
+        plan = load_manifest(manifest)
+    except ValueError as exc:
+        typer.echo(str(exc), err=True)
+        raise typer.Exit(code=2)
+    index = build_index(load_lock(lock_path), strategy=plan.scan.conflict_strategy)
+    batch = run_scan_many(plan, index, workers=workers)
+
+    for result in batch.repositories:
+        if result.error:
+            typer.echo(f" {result.name}: error: {result.error}", err=True)
+            continue
+        summary = result.summary
+        typer.echo(
+            f" {result.name}: {summary.total} findings • Failures: {summary.outcomes.get('fail', 0)} • "
+            f"Warnings: {summary.outcomes.get('warn', 0)} ({result.report_path})"
+        )
+    typer.echo(f"Wrote combined rollup to {batch.rollup_path}")
+
+    if batch.has_errors:
+        raise typer.Exit(code=2)
+    if dry_run:
+        typer.echo(" Dry run enabled; exiting without enforcing policy.")
+        raise typer.Exit(code=0)
+    if batch.has_failures:
+        typer.echo(" Baseline violations detected.", err=True)
+        raise typer.Exit(code=1)
+    typer.echo(" Baseline scan passed.")
+    raise typer.Exit(code=0)
+
+
+@lock_app.command("diff")
+def lock_diff(
+    old_path: Path = typer.Argument(..., help="Previous lock snapshot."),
+    new_path: Path = typer.Argument(..., help="Regenerated lock snapshot."),
+    detection_index: Optional[Path] = typer.Option(
+        None,
+        "--detection-index",
+        help="Detection index from `bw scan --detection-index`; lists the files each change affects.",
+    ),
+    as_json: bool = typer.Option(False, "--json", help="Print the diff as JSON."),
+    config: Optional[Path] = typer.Option(
+        None,
+        "--config",
+        help="Config whose policy.conflict_strategy resolves keys (default: baseline-warden.toml if present).",
+    ),
+    strategy: Optional[str] = typer.Option(
+        None,
+        "--strategy",
+        help="Conflict strategy (overrides the config): first, most_restrictive, or least_restrictive.",
+    ),
+) -> None:
+    """Show feature status transitions between two lock snapshots."""
+
+    for path in (old_path, new_path, detection_index):
+        if path is not None and not path.exists():
+            typer.echo(f"File not found: {path}", err=True)
+            raise typer.Exit(code=2)
+    if strategy is None:
+        if config is not None:
+            strategy = _load_config(config).policy.conflict_strategy
+        elif DEFAULT_CONFIG_PATH.exists():
+            strategy = load_config(DEFAULT_CONFIG_PATH).policy.conflict_strategy
+        else:
+            strategy = "first"
+    if strategy not in CONFLICT_STRATEGIES:
+        typer.echo(f"Unknown --strategy '{strategy}'; expected one of {', '.join(CONFLICT_STRATEGIES)}.", err=True)
+        raise typer.Exit(code=2)
+
+    try:
+        keys = load_detection_index(detection_index) if detection_index else None
+    except ValueError as exc:
+        typer.echo(str(exc), err=True)
+        raise typer.Exit(code=2)
+    result = diff_locks(
+        load_lock(old_path),
+        load_lock(new_path),
+        detection_index=keys,
+        strategy=strategy,  # type: ignore[arg-type]
+    )
+
+    if as_json:
+        typer.echo(json.dumps(result.to_dict(), indent=2))
+        raise typer.Exit(code=0)
+
+    if not result.changes:
+        typer.echo("No feature changes between lock snapshots.")
+    else:
+        typer.echo(f"{len(result.changes)} feature change(s):")
+    for change in result.changes:
+        label = change.title or change.feature_id
+        if change.kind == "changed" and change.status_changed:
+            typer.echo(f"  ~ {change.feature_id} ({label}): {change.old_status} -> {change.new_status}")
+        elif change.kind == "changed":
+            typer.echo(
+                f"  ~ {change.feature_id} ({label}): bcd keys +{len(change.added_keys)} -{len(change.removed_keys)}"
+            )
+        elif change.kind == "added":
+            typer.echo(f"  + {change.feature_id} ({label}): {change.new_status}")
+        else:
+            typer.echo(f"  - {change.feature_id} ({label}): was {change.old_status}")
+    if keys is None:
+        raise typer.Exit(code=0)
+    if not result.affected:
+        typer.echo("No scanned files are affected.")
+        raise typer.Exit(code=0)
+    typer.echo(f"{len(result.affected_files)} affected file(s):")
+    for entry in result.affected:
+        typer.echo(f"  {entry.bcd_key}: {entry.old_status} -> {entry.new_status}")
+        for file in entry.files:
+            typer.echo(f"    {file}")
+    raise typer.Exit(code=0)
+
+
+@lock_app.command("digest")
+def lock_digest_command(
+    path: Path = typer.Argument(DEFAULT_LOCK_PATH, help="Lock snapshot (plain, .gz, or .zst)."),
+) -> None:
+    """Print the content digest of a lock; exit 1 if it does not match the stored one."""
+
+    if not path.exists():
+        typer.echo(f"File not found: {path}", err=True)
+        raise typer.Exit(code=2)
+    payload = read_lock_payload(path)
+    digest = lock_digest(BaselineLock.model_validate(payload))
+    typer.echo(digest)
+    stored = payload.get("digest")
+    if stored is not None and stored != digest:
+        typer.echo(f"Stored digest {stored} does not match the lock contents.", err=True)
+        raise typer.Exit(code=1)
+
+
+@index_app.command("stats")
+def index_stats_command(
+    lock_path: Path = typer.Option(DEFAULT_LOCK_PATH, "--lock-path", help="Lock snapshot to index."),
+    strategy: str = typer.Option(
+        "first",
+        "--strategy",
+        help="Conflict strategy: first, most_restrictive, or least_restrictive.",
+    ),
+    limit: int = typer.Option(20, "--limit", help="Maximum number of conflicting keys to list."),
+) -> None:
+    """Report key counts, BCD key conflicts, and the index memory footprint."""
+
+    if strategy not in CONFLICT_STRATEGIES:
+        typer.echo(f"Unknown --strategy '{strategy}'; expected one of {', '.join(CONFLICT_STRATEGIES)}.", err=True)
+        raise typer.Exit(code=2)
+    if not lock_path.exists():
+        typer.echo(f"Lock file not found: {lock_path}", err=True)
+        raise typer.Exit(code=2)
+
+    stats = index_stats(load_lock(lock_path), strategy=strategy)  # type: ignore[arg-type]
+    typer.echo(f"Features: {stats.features}")
+    typer.echo(f"BCD keys: {stats.bcd_keys}")
+    typer.echo(f"Conflicting keys: {stats.conflicting_keys} (strategy={stats.strategy})")
+    typer.echo(f"Index memory: {stats.index_bytes / 1024:.1f} KiB")
+    for key in sorted(stats.conflicts)[:limit]:
+        claimants = ", ".join(f"{feature.feature_id} ({feature.status or 'unknown'})" for feature in stats.conflicts[key])
+        typer.echo(f"  {key}: {claimants} -> {stats.resolved[key].feature_id}")
+    if stats.conflicting_keys > limit:
+        typer.echo(f"  ... {stats.conflicting_keys - limit} more")
+
+
 if __name__ == "__main__":  # pragma: no cover
     app()
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from datetime import date
 from pathlib import Path
-from typing import List, Literal
+from typing import Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -15,6 +16,9 @@ except ModuleNotFoundError:  # pragma: no cover - fallback for <3.11
 
 RequiredStatus = Literal["widely", "newly_or_widely"]
 UnknownBehavior = Literal["warn", "fail", "ignore"]
+GroupBy = Literal["feature", "file", "bcd-key"]
+PolicyOutcome = Literal["pass", "warn", "fail"]
+ConflictStrategy = Literal["first", "most_restrictive", "least_restrictive"]
 
 
 class PolicyConfig(BaseModel):
@@ -26,6 +30,27 @@ class PolicyConfig(BaseModel):
         "warn",
         description="How to treat tokens that cannot be mapped to Baseline data.",
     )
+    newly_min_age_months: Optional[int] = Field(
+        None,
+        ge=0,
+        description="Judge newly features by age: pass once their low_date is at least this many months before as_of.",
+    )
+    as_of: Optional[date] = Field(
+        None,
+        description="Reference date for newly_min_age_months (defaults to today).",
+    )
+    feature_outcomes: Dict[str, PolicyOutcome] = Field(
+        default_factory=dict,
+        description="Per-feature outcome overrides keyed by feature id.",
+    )
+    path_outcomes: Dict[str, PolicyOutcome] = Field(
+        default_factory=dict,
+        description="Glob → outcome for non-passing findings in matching files; first match wins.",
+    )
+    conflict_strategy: ConflictStrategy = Field(
+        "first",
+        description="Which feature a BCD key resolves to when several features list it.",
+    )
 
 
 class IncludeConfig(BaseModel):
@@ -40,6 +65,10 @@ class IncludeConfig(BaseModel):
             "src/**",
         ]
     )
+    exhaustive: bool = Field(
+        False,
+        description="Emit every HTML attribute key, even ones the lock does not map (they fall back to the element).",
+    )
 
 
 class IgnoreConfig(BaseModel):
@@ -61,6 +90,15 @@ class IgnoreConfig(BaseModel):
 
 class OutputConfig(BaseModel):
     formats: List[str] = Field(default_factory=lambda: ["console", "json", "gh-annotations"])
+    group_by: Optional[GroupBy] = Field(
+        None,
+        description="Aggregate findings per feature, file, or BCD key instead of listing every occurrence.",
+    )
+    annotation_limit: int = Field(
+        50,
+        ge=0,
+        description="Maximum number of GitHub annotations; the most severe and most varied findings are kept.",
+    )
 
 
 class AllowListConfig(BaseModel):
@@ -2,68 +2,92 @@
 
 from __future__ import annotations
 
+import time
+from functools import partial
 from pathlib import Path
-from typing import Iterable, List, Sequence
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 from ..config import BaselineWardenConfig
-from .common import Detection, iter_included_files
-from .css import detect_css
-from .html import detect_html
+from ..memory import MemoryTracker
+from ..profiling import ScanProfiler
+from .common import Detection, FileScan, iter_included_files
+from .component import COMPONENT_EXTENSIONS, scan_component
+from .css import scan_css
+from .html import scan_html
+from .html_keys import HtmlKeyTable
+from .intern import ScanStrings
+from .suppress import SuppressionIndex
 
-HTML_EXTENSIONS = {".html", ".htm", ".jinja", ".jinja2"}
+HTML_EXTENSIONS = {".html", ".htm", ".jinja", ".jinja2", ".hbs", ".handlebars", ".erb"}
 CSS_EXTENSIONS = {".css"}
 
+Detector = Callable[..., FileScan]
 
-def collect_detections(root: Path, config: BaselineWardenConfig) -> List[Detection]:
-    """Collect detections for configured include paths and file types."""
+# (profile stage name, extensions, scanner, accepts an HtmlKeyTable)
+DETECTORS: Tuple[Tuple[str, Set[str], Detector, bool], ...] = (
+    ("detect_html", HTML_EXTENSIONS, scan_html, True),
+    ("detect_css", CSS_EXTENSIONS, scan_css, False),
+    ("detect_component", COMPONENT_EXTENSIONS, scan_component, True),
+)
+
+
+def collect_detections(
+    root: Path,
+    config: BaselineWardenConfig,
+    *,
+    profiler: Optional[ScanProfiler] = None,
+    suppressions: Optional[Dict[Path, SuppressionIndex]] = None,
+    memory: Optional[MemoryTracker] = None,
+    html_keys: Optional[HtmlKeyTable] = None,
+    strings: Optional[ScanStrings] = None,
+) -> List[Detection]:
+    """Collect detections for configured include paths and file types.
+
+    When ``suppressions`` is given, it is filled with the inline suppression
+    index of every file that has directives, keyed like ``Detection.path``.
+    ``html_keys`` (usually ``BaselineIndex.html_keys()``) enables value and
+    global-attribute detection and drops HTML attribute keys the lock does not map.
+    Detections share one relative ``Path`` per file and one string per BCD key
+    through ``strings``; pass a shared ``ScanStrings`` to intern across calls.
+    """
 
     detections: List[Detection] = []
     include_patterns = config.include.paths
     ignore_patterns = config.ignore.globs
+    profiler = profiler or ScanProfiler(enabled=False)
+    strings = strings if strings is not None else ScanStrings()
 
     def _relative(path: Path) -> Path:
         try:
-            return path.relative_to(root)
+            return strings.path(path.relative_to(root))
         except ValueError:
-            return path
-
-    html_files = iter_included_files(
-        root,
-        include_patterns=include_patterns,
-        ignore_patterns=ignore_patterns,
-        extensions=HTML_EXTENSIONS,
-    )
-    for file_path in html_files:
-        relative = _relative(file_path)
-        for detection in detect_html(file_path):
-            detections.append(
-                Detection(
-                    path=relative,
-                    line=detection.line,
-                    bcd_key=detection.bcd_key,
-                    detail=detection.detail,
-                )
-            )
+            return strings.path(path)
 
-    css_files = iter_included_files(
-        root,
-        include_patterns=include_patterns,
-        ignore_patterns=ignore_patterns,
-        extensions=CSS_EXTENSIONS,
-    )
-    for file_path in css_files:
-        relative = _relative(file_path)
-        for detection in detect_css(file_path):
-            detections.append(
-                Detection(
-                    path=relative,
-                    line=detection.line,
-                    bcd_key=detection.bcd_key,
-                    detail=detection.detail,
-                )
+    for name, extensions, detector, uses_html_keys in DETECTORS:
+        if uses_html_keys and html_keys is not None:
+            detector = partial(detector, html_keys=html_keys)
+        files = iter_included_files(
+            root,
+            include_patterns=include_patterns,
+            ignore_patterns=ignore_patterns,
+            extensions=extensions,
+        )
+        for file_path in profiler.iterate("iter_included_files", files):
+            relative = _relative(file_path)
+            start = time.perf_counter()
+            scan = detector(file_path)
+            profiler.record_file(relative, name, time.perf_counter() - start, len(scan.detections))
+            if memory is not None:
+                memory.add_file()
+            if suppressions is not None and scan.suppressions:
+                suppressions[relative] = scan.suppressions
+            intern_key = strings.key
+            detections.extend(
+                Detection(relative, detection.line, intern_key(detection.bcd_key), detection.detail)
+                for detection in scan.detections
             )
 
     return detections
 
 
-__all__ = ["collect_detections", "Detection"]
+__all__ = ["collect_detections", "Detection", "FileScan", "HtmlKeyTable", "ScanStrings", "SuppressionIndex"]
@@ -3,14 +3,22 @@
 from __future__ import annotations
 
 import fnmatch
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Iterable, Iterator, List, Optional, Sequence, Set
 
+from .suppress import SuppressionIndex
 
-@dataclass(frozen=True)
+# Keys under this prefix mark content a detector could not parse, not web-platform features.
+UNSUPPORTED_PREFIX = "bw.unsupported"
+
+
+@dataclass(frozen=True, slots=True)
 class Detection:
-    """Represents a single detected BCD key in a source file."""
+    """Represents a single detected BCD key in a source file.
+
+    Scans hold one per occurrence, so the class uses slots to stay small.
+    """
 
     path: Path
     line: int
@@ -18,7 +26,17 @@ class Detection:
     detail: Optional[str] = None
 
 
-def _is_ignored(relative_path: Path, ignore_globs: Sequence[str]) -> bool:
+@dataclass
+class FileScan:
+    """Detections and inline suppressions gathered from one file in a single pass."""
+
+    detections: List[Detection]
+    suppressions: SuppressionIndex = field(default_factory=SuppressionIndex)
+
+
+def is_ignored(relative_path: Path, ignore_globs: Sequence[str]) -> bool:
+    """Return True when ``relative_path`` matches any of ``ignore_globs``."""
+
     rel = str(relative_path).replace("\\", "/")
     return any(fnmatch.fnmatch(rel, pattern) for pattern in ignore_globs)
 
@@ -42,7 +60,7 @@ def iter_included_files(
             if ext_set and path.suffix.lower() not in ext_set:
                 continue
             relative = path.relative_to(root)
-            if _is_ignored(relative, ignore_patterns):
+            if is_ignored(relative, ignore_patterns):
                 continue
             if relative in seen:
                 continue
@@ -50,4 +68,4 @@ def iter_included_files(
             yield path
 
 
-__all__ = ["Detection", "iter_included_files"]
+__all__ = ["UNSUPPORTED_PREFIX", "Detection", "FileScan", "is_ignored", "iter_included_files"]
@@ -0,0 +1,176 @@
+"""Single-file component detector for ``.vue``, ``.svelte`` and ``.astro`` files.
+
+``split_component`` cuts a component into blocks in one forward scan:
+
+- Vue: the top-level ``<template>`` is the markup; ``<style>``/``<script>`` blocks follow.
+- Svelte/Astro: everything outside ``<script>``/``<style>`` (and Astro's ``---``
+  frontmatter) is markup; those regions are blanked so line numbers stay put.
+
+Markup goes to the HTML parser in component mode, which ignores framework
+components and bindings. Plain CSS style blocks go to the CSS detector.
+Preprocessor languages (``lang="scss"`` and friends) are not parsed and are
+reported once as ``bw.unsupported.style.<lang>`` (or ``.template.<lang>``).
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+from .common import UNSUPPORTED_PREFIX, Detection, FileScan
+from .css import scan_css_text
+from .html import scan_markup
+from .html_keys import HtmlKeyTable
+from .template import mask_template
+
+COMPONENT_EXTENSIONS = {".vue", ".svelte", ".astro"}
+CSS_LANGS = {None, "css", "postcss"}
+HTML_LANGS = {None, "html"}
+
+_VUE_BLOCK_RE = re.compile(r"<(template|script|style)\b([^>]*)>", re.IGNORECASE)
+_BLOCK_RE = re.compile(r"<(script|style)\b([^>]*)>", re.IGNORECASE)
+_CLOSE_RE = {
+    "script": re.compile(r"</script\s*>", re.IGNORECASE),
+    "style": re.compile(r"</style\s*>", re.IGNORECASE),
+}
+_TEMPLATE_TAG_RE = re.compile(r"<(/?)template\b[^>]*>", re.IGNORECASE)
+_LANG_RE = re.compile(r"""\blang\s*=\s*["']?([\w-]+)""", re.IGNORECASE)
+_FRONTMATTER_RE = re.compile(r"\A\s*---[ \t]*\r?\n.*?^---[ \t]*$", re.DOTALL | re.MULTILINE)
+_NON_NEWLINE_RE = re.compile(r"[^\n]")
+
+
+@dataclass
+class ComponentBlock:
+    kind: str  # "markup", "style", or "script"
+    content: str
+    start_line: int  # line of the first content character
+    tag_line: int  # line of the opening tag (equal to start_line for markup)
+    lang: Optional[str] = None
+
+
+def _lang(attributes: str) -> Optional[str]:
+    match = _LANG_RE.search(attributes)
+    return match.group(1).lower() if match else None
+
+
+def _blank(text: str) -> str:
+    return _NON_NEWLINE_RE.sub(" ", text)
+
+
+def _template_end(text: str, start: int) -> tuple[int, int]:
+    """Return (content_end, block_end) of a Vue template whose content starts at ``start``."""
+
+    depth = 1
+    for match in _TEMPLATE_TAG_RE.finditer(text, start):
+        if match.group(0).endswith("/>"):
+            continue
+        depth += -1 if match.group(1) else 1
+        if depth == 0:
+            return match.start(), match.end()
+    return len(text), len(text)
+
+
+def split_component(text: str, flavor: str) -> List[ComponentBlock]:
+    """Split a component into markup, style and script blocks with source line offsets."""
+
+    vue = flavor == "vue"
+    pattern = _VUE_BLOCK_RE if vue else _BLOCK_RE
+    blocks: List[ComponentBlock] = []
+    markup_parts: List[str] = []
+    position = 0
+    line = 1
+    counted = 0
+
+    if flavor == "astro":
+        frontmatter = _FRONTMATTER_RE.match(text)
+        if frontmatter:
+            markup_parts.append(_blank(frontmatter.group(0)))
+            position = frontmatter.end()
+
+    while True:
+        opening = pattern.search(text, position)
+        if opening is None:
+            break
+        tag = opening.group(1).lower()
+        if tag == "template":
+            content_end, block_end = _template_end(text, opening.end())
+        else:
+            closing = _CLOSE_RE[tag].search(text, opening.end())
+            content_end, block_end = (closing.start(), closing.end()) if closing else (len(text), len(text))
+
+        line += text.count("\n", counted, opening.start())
+        tag_line = line
+        start_line = line + text.count("\n", opening.start(), opening.end())
+        line = start_line
+        counted = opening.end()
+
+        kind = "markup" if tag == "template" else tag
+        blocks.append(
+            ComponentBlock(
+                kind=kind,
+                content=text[opening.end() : content_end],
+                start_line=start_line,
+                tag_line=tag_line,
+                lang=_lang(opening.group(2)),
+            )
+        )
+        if not vue:
+            markup_parts.append(text[position : opening.start()])
+            markup_parts.append(_blank(text[opening.start() : block_end]))
+        position = block_end
+
+    if not vue:
+        markup_parts.append(text[position:])
+        blocks.insert(0, ComponentBlock(kind="markup", content="".join(markup_parts), start_line=1, tag_line=1))
+    return blocks
+
+
+def scan_component(
+    path: Path,
+    *,
+    encoding: str = "utf-8",
+    html_keys: Optional[HtmlKeyTable] = None,
+) -> FileScan:
+    """Detect HTML and CSS features in the template and style blocks of a component."""
+
+    try:
+        text = path.read_text(encoding=encoding)
+    except UnicodeDecodeError:
+        text = path.read_text(encoding=encoding, errors="ignore")
+
+    flavor = path.suffix.lower().lstrip(".")
+    result = FileScan(detections=[])
+    for block in split_component(text, flavor):
+        if block.kind == "script":
+            continue
+        supported = HTML_LANGS if block.kind == "markup" else CSS_LANGS
+        if block.lang not in supported:
+            section = "template" if block.kind == "markup" else "style"
+            result.detections.append(
+                Detection(path=path, line=block.tag_line, bcd_key=f"{UNSUPPORTED_PREFIX}.{section}.{block.lang}")
+            )
+            continue
+        if block.kind == "markup":
+            scan = scan_markup(
+                path,
+                mask_template(block.content),
+                start_line=block.start_line,
+                components=True,
+                html_keys=html_keys,
+            )
+        else:
+            scan = scan_css_text(path, block.content, start_line=block.start_line)
+        result.detections.extend(scan.detections)
+        result.suppressions.update(scan.suppressions)
+    return result
+
+
+def detect_component(path: Path, *, encoding: str = "utf-8") -> List[Detection]:
+    """Detect HTML and CSS features in a Vue, Svelte, or Astro component."""
+
+    return scan_component(path, encoding=encoding).detections
+
+
+__all__ = ["COMPONENT_EXTENSIONS", "ComponentBlock", "detect_component", "scan_component", "split_component"]
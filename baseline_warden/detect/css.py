@@ -7,21 +7,40 @@ from typing import Any, List, Sequence
 
 import tinycss2
 
-from .common import Detection
+from .common import Detection, FileScan
+from .suppress import css_suppressions
 
 SELECTOR_PREFIX = "css.selectors"
 PROPERTY_PREFIX = "css.properties"
 AT_RULE_PREFIX = "css.at-rules"
 
 
-def detect_css(path: Path, *, encoding: str = "utf-8") -> List[Detection]:
-    """Detect CSS properties, values, selectors, and at-rules."""
+def scan_css(path: Path, *, encoding: str = "utf-8") -> FileScan:
+    """Detect CSS features plus inline suppression comments from one read of the file."""
 
     try:
         text = path.read_text(encoding=encoding)
     except UnicodeDecodeError:
         text = path.read_text(encoding=encoding, errors="ignore")
+    return scan_css_text(path, text)
+
+
+def scan_css_text(path: Path, text: str, *, start_line: int = 1) -> FileScan:
+    """Scan CSS source whose first line is line ``start_line`` of ``path``."""
+
+    if start_line > 1:
+        # tinycss2 has no line offset; leading newlines shift every reported line.
+        text = "\n" * (start_line - 1) + text
+    return FileScan(detections=_detect_css_text(path, text), suppressions=css_suppressions(text))
+
+
+def detect_css(path: Path, *, encoding: str = "utf-8") -> List[Detection]:
+    """Detect CSS properties, values, selectors, and at-rules."""
+
+    return scan_css(path, encoding=encoding).detections
+
 
+def _detect_css_text(path: Path, text: str) -> List[Detection]:
     detections: List[Detection] = []
     seen: set[tuple[int, str]] = set()
 
@@ -159,4 +178,4 @@ def _declaration_detections(
     return detections
 
 
-__all__ = ["detect_css"]
+__all__ = ["detect_css", "scan_css", "scan_css_text"]
@@ -2,56 +2,160 @@
 
 from __future__ import annotations
 
+import threading
 from html.parser import HTMLParser
 from pathlib import Path
-from typing import Iterable, List, Sequence
+from typing import Iterable, List, Optional, Sequence
 
-from .common import Detection
+from .common import Detection, FileScan
+from .html_keys import GLOBAL_PREFIX, HtmlKeyTable
+from .suppress import DIRECTIVE_MARKER, SuppressionIndex
+from .template import mask_template
+
+# Evergreen global attributes: their attribute keys are noise, but their values are still checked.
+NOISE_ATTRIBUTES = frozenset({"class", "id", "style", "lang", "title", "dir", "hidden"})
 
 
 class _BaselineHTMLParser(HTMLParser):
-    """HTML parser that records elements and attributes encountered."""
+    """HTML parser that records elements and attributes encountered.
+
+    One instance is reused per thread; ``scan`` resets it for each document.
+    """
 
-    def __init__(self, path: Path) -> None:
+    def __init__(self) -> None:
         super().__init__(convert_charrefs=True)
-        self._path = path
+        self._path = Path()
+        self._components = False
+        self._html_keys: Optional[HtmlKeyTable] = None
         self.detections: List[Detection] = []
+        self.suppressions = SuppressionIndex()
+
+    def scan(
+        self,
+        path: Path,
+        text: str,
+        *,
+        start_line: int = 1,
+        components: bool = False,
+        html_keys: Optional[HtmlKeyTable] = None,
+    ) -> FileScan:
+        """Parse ``text`` whose first line is line ``start_line`` of ``path``."""
+
+        self.reset()
+        self.lineno = start_line
+        self._path = path
+        self._components = components
+        self._html_keys = html_keys
+        self.detections = []
+        self.suppressions = SuppressionIndex()
+        self.feed(text)
+        self.close()
+        return FileScan(detections=self.detections, suppressions=self.suppressions)
+
+    def _is_component_tag(self, tag: str) -> bool:
+        # <MyWidget>, <my-widget>, <svelte:head>: framework components, not HTML elements.
+        if "-" in tag or ":" in tag or "." in tag:
+            return True
+        raw = self.get_starttag_text() or ""
+        return any(char.isupper() for char in raw[1 : 1 + len(tag)])
 
     def handle_starttag(self, tag: str, attrs: Sequence[tuple[str, str | None]]) -> None:  # type: ignore[override]
+        if self._components and self._is_component_tag(tag):
+            return
         line, _ = self.getpos()
         tag_key = f"html.elements.{tag}"
         self.detections.append(Detection(path=self._path, line=line, bcd_key=tag_key))
 
-        for attr, _ in attrs:
+        table = self._html_keys
+        for attr, value in attrs:
             if not attr:
                 continue
             key = attr.lower()
-            if key.startswith("data-") or key.startswith("x-") or key.startswith("on"):
+            # Framework bindings (:prop, @event, v-if, #slot, on:click, {...spread}) are not HTML attributes.
+            if self._components and (not key[0].isalpha() or ":" in key or key.startswith("v-")):
                 continue
-            # Ignore common global or evergreen attributes that aren't tracked by Baseline
-            if key in {"class", "id", "style", "lang", "title", "dir", "hidden"}:
+            if key.startswith("data-") or key.startswith("x-") or key.startswith("on"):
                 continue
             if key.startswith("aria-"):
                 continue
-            attr_key = f"html.elements.{tag}.{key}"
+            if table is None:
+                if key not in NOISE_ATTRIBUTES:
+                    self.detections.append(Detection(path=self._path, line=line, bcd_key=f"{tag_key}.{key}"))
+                continue
+            if value:
+                for value_key in table.value_keys(tag, key, value):
+                    self.detections.append(Detection(path=self._path, line=line, bcd_key=value_key))
+            if key in NOISE_ATTRIBUTES:
+                continue
+            attr_key = f"{tag_key}.{key}"
+            if attr_key not in table.keys:
+                global_key = GLOBAL_PREFIX + key
+                if global_key in table.keys:
+                    attr_key = global_key
+                elif not table.exhaustive:
+                    # Unmapped attribute keys resolve to the element detection emitted above.
+                    continue
             self.detections.append(Detection(path=self._path, line=line, bcd_key=attr_key))
 
+    def handle_comment(self, data: str) -> None:
+        if DIRECTIVE_MARKER not in data:
+            return
+        line, _ = self.getpos()
+        self.suppressions.add_comment(data, line, line + data.count("\n"))
+
     def handle_startendtag(self, tag: str, attrs: Sequence[tuple[str, str | None]]) -> None:  # type: ignore[override]
         self.handle_starttag(tag, attrs)
 
 
-def detect_html(path: Path, *, encoding: str = "utf-8") -> List[Detection]:
-    """Detect HTML elements and attributes mapping to BCD keys."""
+def scan_html(
+    path: Path,
+    *,
+    encoding: str = "utf-8",
+    html_keys: Optional[HtmlKeyTable] = None,
+) -> FileScan:
+    """Detect HTML elements and attributes plus inline suppression comments.
+
+    Template syntax (Jinja, Django, Handlebars, ERB) is masked first, so it
+    cannot produce bogus attributes; line numbers are unaffected.
+
+    With ``html_keys`` (see ``BaselineIndex.html_keys``), attribute values
+    are matched against the lock's value keys (``html.elements.input.type_date``),
+    global attributes map to ``html.global_attributes.*`` keys, and attribute
+    keys the lock does not map are dropped unless the table is exhaustive.
+    Without it every attribute key is emitted and values are not inspected.
+    """
 
     try:
         text = path.read_text(encoding=encoding)
     except UnicodeDecodeError:
         text = path.read_text(encoding=encoding, errors="ignore")
 
-    parser = _BaselineHTMLParser(path)
-    parser.feed(text)
-    parser.close()
-    return parser.detections
+    return scan_markup(path, mask_template(text), html_keys=html_keys)
+
+
+_LOCAL = threading.local()
+
+
+def scan_markup(
+    path: Path,
+    text: str,
+    *,
+    start_line: int = 1,
+    components: bool = False,
+    html_keys: Optional[HtmlKeyTable] = None,
+) -> FileScan:
+    """Run the per-thread HTML parser over ``text`` (already masked), offsetting lines by ``start_line``."""
+
+    parser = getattr(_LOCAL, "parser", None)
+    if parser is None:
+        parser = _LOCAL.parser = _BaselineHTMLParser()
+    return parser.scan(path, text, start_line=start_line, components=components, html_keys=html_keys)
+
+
+def detect_html(path: Path, *, encoding: str = "utf-8") -> List[Detection]:
+    """Detect HTML elements and attributes mapping to BCD keys."""
+
+    return scan_html(path, encoding=encoding).detections
 
 
-__all__ = ["detect_html"]
+__all__ = ["NOISE_ATTRIBUTES", "detect_html", "scan_html", "scan_markup"]
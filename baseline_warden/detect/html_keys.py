@@ -0,0 +1,112 @@
+"""Precomputed HTML key table used by the HTML detector during parsing.
+
+``HtmlKeyTable.from_keys`` splits the mapped ``html.*`` BCD keys of a lock into:
+
+- ``keys``: every mapped element, attribute and global-attribute key;
+- ``values``: value-bearing keys by ``(tag, attribute)``, e.g.
+  ``html.elements.link.rel.preload``;
+- ``global_values``: value-bearing global keys by attribute, e.g.
+  ``html.global_attributes.hidden.until-found``.
+
+Attribute and value are read from their fixed positions,
+``html.elements.<tag>.<attr>.<value>`` and
+``html.global_attributes.<attr>.<value>``. BCD spells a few families as
+``<attr>_<value>`` instead (``html.elements.input.type_date``); those are
+listed in ``UNDERSCORE_VALUE_ATTRIBUTES``. An underscore anywhere else is part
+of the name, as in ``html.elements.a.implicit_noopener``.
+
+Attribute values are matched by dictionary lookup in the parse pass, so
+value coverage adds no extra traversal of the file.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field, replace
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
+
+ELEMENT_PREFIX = "html.elements."
+GLOBAL_PREFIX = "html.global_attributes."
+UNDERSCORE_VALUE_ATTRIBUTES = frozenset({("input", "type")})
+# Tokens that can form a key segment; anything else (URLs, free text) is never a value key.
+_VALUE_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9-]*")
+
+
+def _element_value(tag: str, tail: str) -> Optional[Tuple[str, str, str]]:
+    """Return (attribute, value, key prefix) for the part of a key after ``html.elements.<tag>.``."""
+
+    parts = tail.split(".")
+    if len(parts) == 2:
+        return parts[0], parts[1].lower(), f"{ELEMENT_PREFIX}{tag}.{parts[0]}."
+    if len(parts) == 1:
+        attribute, underscore, value = parts[0].partition("_")
+        if underscore and (tag, attribute) in UNDERSCORE_VALUE_ATTRIBUTES:
+            return attribute, value.lower(), f"{ELEMENT_PREFIX}{tag}.{attribute}_"
+    return None
+
+
+@dataclass(frozen=True)
+class HtmlKeyTable:
+    keys: FrozenSet[str] = frozenset()
+    values: Dict[Tuple[str, str], Dict[str, str]] = field(default_factory=dict)
+    global_values: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    # How each value-bearing attribute spells its value keys, e.g. "html.elements.input.type_".
+    value_prefixes: Dict[Tuple[str, str], str] = field(default_factory=dict)
+    global_value_prefixes: Dict[str, str] = field(default_factory=dict)
+    # Emit keys a future lock may map: unmapped attribute keys, and unmapped
+    # values of attributes the lock already maps values for.
+    exhaustive: bool = False
+
+    @classmethod
+    def from_keys(cls, keys: Iterable[str], *, exhaustive: bool = False) -> "HtmlKeyTable":
+        mapped = frozenset(key for key in keys if key.startswith((ELEMENT_PREFIX, GLOBAL_PREFIX)))
+        values: Dict[Tuple[str, str], Dict[str, str]] = {}
+        global_values: Dict[str, Dict[str, str]] = {}
+        value_prefixes: Dict[Tuple[str, str], str] = {}
+        global_value_prefixes: Dict[str, str] = {}
+        for key in mapped:
+            if key.startswith(ELEMENT_PREFIX):
+                tag, _, tail = key[len(ELEMENT_PREFIX) :].partition(".")
+                split = _element_value(tag, tail) if tail else None
+                if split:
+                    attribute, value, prefix = split
+                    values.setdefault((tag, attribute), {})[value] = key
+                    value_prefixes[(tag, attribute)] = prefix
+            else:
+                parts = key[len(GLOBAL_PREFIX) :].split(".")
+                if len(parts) == 2:
+                    global_values.setdefault(parts[0], {})[parts[1].lower()] = key
+                    global_value_prefixes[parts[0]] = f"{GLOBAL_PREFIX}{parts[0]}."
+        return cls(
+            keys=mapped,
+            values=values,
+            global_values=global_values,
+            value_prefixes=value_prefixes,
+            global_value_prefixes=global_value_prefixes,
+            exhaustive=exhaustive,
+        )
+
+    def with_exhaustive(self, exhaustive: bool) -> "HtmlKeyTable":
+        return self if exhaustive == self.exhaustive else replace(self, exhaustive=exhaustive)
+
+    def value_keys(self, tag: str, attribute: str, value: str) -> Iterable[str]:
+        """Yield keys for the whitespace-separated tokens of an attribute value.
+
+        Mapped tokens yield their key. When exhaustive, other tokens of a
+        value-bearing attribute yield the key a lock would spell for them.
+        """
+
+        by_value = self.values.get((tag, attribute))
+        global_by_value = self.global_values.get(attribute)
+        if by_value is None and global_by_value is None:
+            return
+        for token in value.lower().split():
+            key = (by_value and by_value.get(token)) or (global_by_value and global_by_value.get(token))
+            if key:
+                yield key
+            elif self.exhaustive and _VALUE_TOKEN_RE.fullmatch(token):
+                prefix = self.value_prefixes.get((tag, attribute)) or self.global_value_prefixes[attribute]
+                yield prefix + token
+
+
+__all__ = ["ELEMENT_PREFIX", "GLOBAL_PREFIX", "UNDERSCORE_VALUE_ATTRIBUTES", "HtmlKeyTable"]
@@ -0,0 +1,56 @@
+"""Scan-wide interning of file paths and BCD keys.
+
+Detectors build a fresh ``bcd_key`` string for every occurrence and know
+files by their absolute path. ``ScanStrings`` gives the runner one relative
+``Path`` per file and one ``str`` per distinct BCD key, so a scan of N
+detections over M files and K keys holds M paths and K key strings.
+
+``ScanStrings.text`` renders each path once and keeps the string in the
+table. Outputs look paths up there instead of calling ``str(path)`` per
+finding. The table is keyed by ``id()`` of the interned ``Path``, which it
+holds a reference to so the id cannot be reused; hashing a ``Path`` would
+cost about as much as rendering it.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, Tuple
+
+
+class ScanStrings:
+    __slots__ = ("_paths", "_texts", "_keys")
+
+    def __init__(self) -> None:
+        self._paths: Dict[Path, Path] = {}
+        # id(path) -> (path, rendered path)
+        self._texts: Dict[int, Tuple[Path, str]] = {}
+        self._keys: Dict[str, str] = {}
+
+    def path(self, path: Path) -> Path:
+        """Return the canonical ``Path`` object for ``path``."""
+
+        return self._paths.setdefault(path, path)
+
+    def text(self, path: Path) -> str:
+        """Return the rendered form of ``path``, built once per file."""
+
+        # Every keyed path is kept alive by its entry, so an id match is the same object.
+        entry = self._texts.get(id(path))
+        if entry is None:
+            entry = self._texts[id(path)] = (path, str(path))
+        return entry[1]
+
+    def key(self, bcd_key: str) -> str:
+        return self._keys.setdefault(bcd_key, bcd_key)
+
+    @property
+    def path_count(self) -> int:
+        return len(self._paths)
+
+    @property
+    def key_count(self) -> int:
+        return len(self._keys)
+
+
+__all__ = ["ScanStrings"]
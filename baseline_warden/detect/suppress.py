@@ -0,0 +1,144 @@
+"""Inline suppression directives and a per-file line-interval index.
+
+Supported directives (inside CSS ``/* */`` or HTML ``<!-- -->`` comments):
+
+- ``bw-ignore [keys]``: the line(s) the comment is on (trailing comments).
+- ``bw-ignore-next-line [keys]``: only the line after the comment.
+- ``bw-ignore-file [keys]``: the whole file.
+
+``keys`` are optional BCD keys separated by spaces or commas; a key also
+covers its children (``css.properties.position`` covers
+``css.properties.position.sticky``). Without keys every detection is covered.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import FrozenSet, List, Optional, Tuple
+
+DIRECTIVE_MARKER = "bw-ignore"
+_DIRECTIVE_RE = re.compile(r"^\s*bw-ignore(-next-line|-file)?(?=\s|,|$)(.*)$", re.DOTALL)
+_KEY_SPLIT_RE = re.compile(r"[\s,]+")
+# Strings are matched too, so "/* bw-ignore */" inside content: "..." is not a comment.
+# An unterminated string stops at the newline, as in the CSS tokenizer.
+_CSS_COMMENT_RE = re.compile(r"""/\*(.*?)\*/|"(?:[^"\\\n]|\\.)*"?|'(?:[^'\\\n]|\\.)*'?""", re.DOTALL)
+
+# None means "every key".
+KeySet = Optional[FrozenSet[str]]
+
+
+def _covers(keys: KeySet, bcd_key: str) -> bool:
+    if keys is None:
+        return True
+    if bcd_key in keys:
+        return True
+    # Walk parent keys: css.properties.position.sticky -> css.properties.position -> ...
+    parent = bcd_key
+    while "." in parent:
+        parent = parent.rsplit(".", 1)[0]
+        if parent in keys:
+            return True
+    return False
+
+
+@dataclass
+class SuppressionIndex:
+    """Sorted line intervals plus file-level rules for one file."""
+
+    file_keys: List[KeySet] = field(default_factory=list)
+    _starts: List[int] = field(default_factory=list)
+    _intervals: List[Tuple[int, int, KeySet]] = field(default_factory=list)
+    _max_span: int = 0
+    _sorted: bool = True
+
+    def __bool__(self) -> bool:
+        return bool(self.file_keys or self._intervals)
+
+    def add_lines(self, start: int, end: int, keys: KeySet) -> None:
+        if self._intervals and start < self._intervals[-1][0]:
+            self._sorted = False
+        self._intervals.append((start, end, keys))
+        self._starts.append(start)
+        self._max_span = max(self._max_span, end - start)
+
+    def add_file(self, keys: KeySet) -> None:
+        self.file_keys.append(keys)
+
+    def update(self, other: "SuppressionIndex") -> None:
+        """Merge another index (e.g. from a second section of the same file) into this one."""
+
+        self.file_keys.extend(other.file_keys)
+        for start, end, keys in other._intervals:
+            self.add_lines(start, end, keys)
+
+    def signature(self) -> str:
+        """Stable text form of every directive, for cache keys."""
+
+        def keys_text(keys: KeySet) -> str:
+            return "*" if keys is None else ",".join(sorted(keys))
+
+        parts = sorted(f"file:{keys_text(keys)}" for keys in self.file_keys)
+        parts.extend(sorted(f"{start}-{end}:{keys_text(keys)}" for start, end, keys in self._intervals))
+        return ";".join(parts)
+
+    def add_comment(self, text: str, start_line: int, end_line: int) -> bool:
+        """Record a directive found in a comment body; return True when one was found."""
+
+        match = _DIRECTIVE_RE.match(text)
+        if match is None:
+            return False
+        kind, rest = match.groups()
+        tokens = [token for token in _KEY_SPLIT_RE.split(rest.strip()) if token]
+        keys: KeySet = frozenset(tokens) if tokens else None
+        if kind == "-file":
+            self.add_file(keys)
+        elif kind == "-next-line":
+            self.add_lines(end_line + 1, end_line + 1, keys)
+        else:
+            self.add_lines(start_line, end_line, keys)
+        return True
+
+    def suppresses(self, line: int, bcd_key: str) -> bool:
+        """Return True when a directive covers ``bcd_key`` on ``line`` (O(log n))."""
+
+        for keys in self.file_keys:
+            if _covers(keys, bcd_key):
+                return True
+        if not self._intervals:
+            return False
+        if not self._sorted:
+            self._intervals.sort(key=lambda interval: interval[0])
+            self._starts = [interval[0] for interval in self._intervals]
+            self._sorted = True
+        position = bisect_right(self._starts, line) - 1
+        while position >= 0:
+            start, end, keys = self._intervals[position]
+            if start < line - self._max_span:
+                break
+            if start <= line <= end and _covers(keys, bcd_key):
+                return True
+            position -= 1
+        return False
+
+
+def css_suppressions(text: str) -> SuppressionIndex:
+    """Collect directives from CSS comments (not strings) in ``text`` in one forward scan."""
+
+    index = SuppressionIndex()
+    if DIRECTIVE_MARKER not in text:
+        return index
+    line = 1
+    offset = 0
+    for match in _CSS_COMMENT_RE.finditer(text):
+        body = match.group(1)
+        if body is None:
+            continue
+        line += text.count("\n", offset, match.start())
+        offset = match.start()
+        index.add_comment(body, line, line + body.count("\n"))
+    return index
+
+
+__all__ = ["DIRECTIVE_MARKER", "SuppressionIndex", "css_suppressions"]
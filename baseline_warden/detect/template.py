@@ -0,0 +1,105 @@
+"""Template-syntax masking for HTML templates.
+
+Jinja/Django (``{{ }}``, ``{% %}``, ``{# #}``), Handlebars (``{{ }}``,
+``{{{ }}}``, ``{{!-- --}}``) and ERB (``<% %>``) constructs are replaced with
+spaces in one forward pass before the HTML parser sees the text. Newlines are
+kept and every other character becomes one space, so line and column offsets
+are unchanged. Unterminated delimiters are left as-is, and so are openers inside
+``<script>`` and ``<style>`` contents: JavaScript such as ``{#private = 0}``
+must not blank the markup up to a later ``#}``.
+"""
+
+from __future__ import annotations
+
+import re
+
+# Tried in order at each opener, like a regex alternation.
+_DELIMITERS = (
+    ("{{!--", "--}}"),  # Handlebars block comment
+    ("{{{", "}}}"),  # Handlebars raw output
+    ("{{", "}}"),  # Jinja/Django/Handlebars expression
+    ("{%", "%}"),  # Jinja/Django statement
+    ("{#", "#}"),  # Jinja/Django comment
+    ("<%", "%>"),  # ERB
+)
+_OPENER_RE = re.compile(r"\{[{%#]|<%")
+_NON_NEWLINE_RE = re.compile(r"[^\n]")
+_OPENERS = ("{{", "{%", "{#", "<%")
+_RAW_TEXT_RE = re.compile(r"<(script|style)\b[^>]*>", re.IGNORECASE)
+_RAW_TEXT_END_RE = {
+    "script": re.compile(r"</script", re.IGNORECASE),
+    "style": re.compile(r"</style", re.IGNORECASE),
+}
+
+
+def _blank(text: str) -> str:
+    if "\n" not in text:
+        return " " * len(text)
+    return _NON_NEWLINE_RE.sub(" ", text)
+
+
+def has_template_syntax(text: str) -> bool:
+    return any(opener in text for opener in _OPENERS)
+
+
+def _raw_text_span(text: str, position: int) -> tuple[int, int]:
+    """Content span of the first ``<script>``/``<style>`` element opened at or after ``position``."""
+
+    match = _RAW_TEXT_RE.search(text, position)
+    if match is None:
+        return len(text) + 1, len(text) + 1
+    end = _RAW_TEXT_END_RE[match.group(1).lower()].search(text, match.end())
+    return match.end(), end.start() if end else len(text)
+
+
+def mask_template(text: str) -> str:
+    """Blank template delimiters and their contents, preserving line/column offsets.
+
+    Closers are found with ``str.find``, and the next position of each closer
+    is remembered. Stray openers then cost O(1) each instead of a rescan to
+    the end of the file, so the pass stays linear. Raw-text element contents
+    are skipped in one step each.
+    """
+
+    if not has_template_syntax(text):
+        return text
+    # closer -> first index at or after the last search start (-1: none left)
+    next_closer: dict[str, int] = {}
+    parts = []
+    done = position = 0
+    raw_start, raw_end = _raw_text_span(text, 0)
+    while True:
+        match = _OPENER_RE.search(text, position)
+        if match is None:
+            break
+        start = match.start()
+        while raw_start < position or raw_end <= start:
+            # Move to the next element; a masked construct may have covered a start tag.
+            raw_start, raw_end = _raw_text_span(text, position if raw_start < position else raw_end)
+        if raw_start <= start < raw_end:
+            position = raw_end
+            continue
+        end = -1
+        for opener, closer in _DELIMITERS:
+            if not text.startswith(opener, start):
+                continue
+            search_from = start + len(opener)
+            found = next_closer.get(closer)
+            if found is None or 0 <= found < search_from:
+                found = next_closer[closer] = text.find(closer, search_from)
+            if found >= 0:
+                end = found + len(closer)
+                break
+        if end < 0:
+            position = start + 1
+            continue
+        parts.append(text[done:start])
+        parts.append(_blank(text[start:end]))
+        done = position = end
+    if not parts:
+        return text
+    parts.append(text[done:])
+    return "".join(parts)
+
+
+__all__ = ["has_template_syntax", "mask_template"]
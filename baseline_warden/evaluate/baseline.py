@@ -0,0 +1,91 @@
+"""Compare findings against a previously written report.
+
+Every finding is marked ``new`` or ``unchanged`` and only new ones are used
+for gating. Non-passing findings from the baseline that no longer occur are
+reported as resolved.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List
+
+from .fingerprint import FindingKey, OccurrenceTracker
+from .policy import SEVERITY_BY_OUTCOME, Finding, summarize_findings
+
+
+@dataclass
+class BaselineReport:
+    """Findings from a previous report keyed by (file, bcd_key, occurrence)."""
+
+    entries: Dict[FindingKey, Dict[str, Any]]
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+@dataclass
+class BaselineDiff:
+    new: List[Finding] = field(default_factory=list)
+    resolved: List[Dict[str, Any]] = field(default_factory=list)
+    unchanged: int = 0
+
+    def summary_record(self) -> Dict[str, Any]:
+        """Counts for the ``baseline`` block of a report."""
+
+        return {
+            "new": len(self.new),
+            "unchanged": self.unchanged,
+            "resolved": len(self.resolved),
+            "new_outcomes": summarize_findings(self.new).outcomes,
+        }
+
+
+def _iter_report_records(path: Path) -> Iterator[Dict[str, Any]]:
+    if path.suffix == ".jsonl":
+        with path.open(encoding="utf-8") as fh:
+            for line in fh:
+                if line.strip():
+                    yield json.loads(line)
+        return
+    data = json.loads(path.read_text(encoding="utf-8"))
+    yield from data.get("findings", [])
+
+
+def load_baseline_report(path: Path) -> BaselineReport:
+    """Index a ``report.json`` (or ``report.jsonl``) written by ``bw scan``."""
+
+    tracker = OccurrenceTracker()
+    entries: Dict[FindingKey, Dict[str, Any]] = {}
+    for record in _iter_report_records(path):
+        entries[tracker.key(record["file"], record["bcd_key"])] = record
+    return BaselineReport(entries=entries)
+
+
+def diff_findings(findings: Iterable[Finding], baseline: BaselineReport) -> BaselineDiff:
+    """Mark each finding ``new`` or ``unchanged`` and collect resolved baseline findings.
+
+    Each lookup is a single dict operation, so the diff is linear in the number
+    of current plus baseline findings. Baseline findings that passed are not
+    reported as resolved.
+    """
+
+    remaining = dict(baseline.entries)
+    tracker = OccurrenceTracker()
+    diff = BaselineDiff()
+    for finding in findings:
+        key = tracker.key(finding.detection.path, finding.detection.bcd_key)
+        if remaining.pop(key, None) is not None:
+            finding.baseline = "unchanged"
+            diff.unchanged += 1
+        else:
+            finding.baseline = "new"
+            diff.new.append(finding)
+    passing = SEVERITY_BY_OUTCOME["pass"]
+    diff.resolved = [record for record in remaining.values() if record.get("severity") != passing]
+    return diff
+
+
+__all__ = ["BaselineDiff", "BaselineReport", "diff_findings", "load_baseline_report"]
@@ -0,0 +1,206 @@
+"""Persistent cache of policy evaluation results.
+
+A cache bucket lives at ``get_cache_dir()/evaluations/<lock>-<policy>.json``.
+It is named after the lock digest and a hash of the evaluation config
+(policy including the resolved ``as_of`` and conflict strategy, plus the
+allowlist). Inside a bucket, each file's findings are stored under a
+hash of its path, detections and inline suppressions.
+
+A file whose hash is found skips resolution and policy evaluation: its
+findings are rebuilt from the stored rows and the current detections. A new
+lock or config selects another bucket. An edited file gets a new hash, so
+only that file is evaluated again. Each save atomically rewrites the bucket with
+only the entries used by that scan. Buckets beyond ``max_buckets`` are
+evicted, least recently used first, by modification time, under a file lock.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import Counter
+from datetime import date
+from itertools import groupby
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from ..config import BaselineWardenConfig
+from ..detect.common import Detection
+from ..detect.suppress import SuppressionIndex
+from ..index.store import atomic_write_bytes, file_lock
+from .policy import SEVERITY_BY_OUTCOME, CompiledPolicy, EvaluationSummary, Finding, evaluate_detections
+from .resolve import BaselineIndex
+
+EVALUATION_CACHE_VERSION = "2"
+EVALUATIONS_DIR = "evaluations"
+DEFAULT_MAX_BUCKETS = 8
+EVICTION_LOCK = "evict.lock"
+
+# feature_id, status, outcome, message id, allowlisted, suppressed
+Row = Tuple[Optional[str], str, str, int, int, int]
+
+
+def policy_hash(config: BaselineWardenConfig) -> str:
+    """Hash every config field that can change a finding."""
+
+    policy = config.policy.model_dump(mode="json")
+    # as_of only matters for age rules; resolve "today" so the hash changes when the date does.
+    if config.policy.newly_min_age_months is not None:
+        policy["as_of"] = (config.policy.as_of or date.today()).isoformat()
+    else:
+        policy["as_of"] = None
+    data = {
+        "version": EVALUATION_CACHE_VERSION,
+        "policy": policy,
+        "allowlist": config.allowlist.model_dump(mode="json"),
+    }
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def file_hash(path: Path, detections: Iterable[Detection], suppressions: Optional[SuppressionIndex]) -> str:
+    """Hash a file's path, detections (in order) and suppression directives."""
+
+    parts = [path.as_posix(), suppressions.signature() if suppressions else ""]
+    parts.extend(f"{detection.line}\0{detection.bcd_key}\0{detection.detail or ''}" for detection in detections)
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+class EvaluationCache:
+    """One bucket of cached evaluations for a lock digest and policy hash."""
+
+    def __init__(self, directory: Path, *, lock_digest: str, policy: str, max_buckets: int = DEFAULT_MAX_BUCKETS) -> None:
+        self.directory = directory
+        self.lock_digest = lock_digest
+        self.policy = policy
+        self.max_buckets = max_buckets
+        self.path = directory / f"{lock_digest[:16]}-{policy[:16]}.json"
+        self.hits = 0
+        self.misses = 0
+        self._stored: Dict[str, List[Row]] = {}
+        self._messages: List[str] = []
+        self._used: Dict[str, List[Row]] = {}
+        self._message_ids: Dict[str, int] = {}
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if (
+            data.get("version") != EVALUATION_CACHE_VERSION
+            or data.get("lock_digest") != self.lock_digest
+            or data.get("policy") != self.policy
+        ):
+            return
+        self._messages = list(data.get("messages", []))
+        self._stored = {key: [tuple(row) for row in rows] for key, rows in data.get("entries", {}).items()}
+
+    def _message_id(self, message: str) -> int:
+        found = self._message_ids.get(message)
+        if found is None:
+            found = self._message_ids[message] = len(self._message_ids)
+        return found
+
+    def get(self, key: str, detections: List[Detection], index: BaselineIndex) -> Optional[List[Finding]]:
+        """Rebuild findings for ``detections`` from a cached entry, or return None on a miss."""
+
+        rows = self._stored.get(key)
+        if rows is None or len(rows) != len(detections):
+            self.misses += 1
+            return None
+        findings = []
+        for detection, (feature_id, status, outcome, message_id, allowlisted, suppressed) in zip(detections, rows):
+            findings.append(
+                Finding(
+                    detection=detection,
+                    feature=index.features_by_id.get(feature_id) if feature_id is not None else None,
+                    status=status,
+                    outcome=outcome,  # type: ignore[arg-type]
+                    severity=SEVERITY_BY_OUTCOME[outcome],  # type: ignore[arg-type]
+                    message=self._messages[message_id],
+                    allowlisted=bool(allowlisted),
+                    suppressed=bool(suppressed),
+                )
+            )
+        self.hits += 1
+        self.put(key, findings)
+        return findings
+
+    def put(self, key: str, findings: List[Finding]) -> None:
+        self._used[key] = [
+            (
+                finding.feature.feature_id if finding.feature else None,
+                finding.status,
+                finding.outcome,
+                self._message_id(finding.message),
+                int(finding.allowlisted),
+                int(finding.suppressed),
+            )
+            for finding in findings
+        ]
+
+    def save(self) -> None:
+        """Write the entries used by this scan, then evict least recently used buckets."""
+
+        data: Dict[str, Any] = {
+            "version": EVALUATION_CACHE_VERSION,
+            "lock_digest": self.lock_digest,
+            "policy": self.policy,
+            "messages": list(self._message_ids),
+            "entries": self._used,
+        }
+        atomic_write_bytes(self.path, json.dumps(data, separators=(",", ":")).encode("utf-8"))
+        with file_lock(self.directory / EVICTION_LOCK):
+            self._evict()
+
+    def _evict(self) -> None:
+        buckets = []
+        for path in self.directory.glob("*.json"):
+            try:
+                buckets.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                continue
+        buckets.sort(reverse=True)
+        for _, stale in buckets[self.max_buckets :]:
+            if stale != self.path:
+                stale.unlink(missing_ok=True)
+
+
+def evaluate_with_cache(
+    index: BaselineIndex,
+    detections: List[Detection],
+    policy: CompiledPolicy,
+    cache: EvaluationCache,
+    *,
+    suppressions: Optional[Mapping[Path, SuppressionIndex]] = None,
+) -> tuple[List[Finding], EvaluationSummary]:
+    """``evaluate_detections`` that reuses cached findings for unchanged files.
+
+    Detections are taken in runs of the same file, as ``collect_detections``
+    produces them, so findings keep their usual order.
+    """
+
+    findings: List[Finding] = []
+    for path, run in groupby(detections, key=lambda detection: detection.path):
+        file_detections = list(run)
+        file_suppressions = suppressions.get(path) if suppressions else None
+        key = file_hash(path, file_detections, file_suppressions)
+        cached = cache.get(key, file_detections, index)
+        if cached is None:
+            cached, _ = evaluate_detections(index, file_detections, policy, suppressions=suppressions)
+            cache.put(key, cached)
+        findings.extend(cached)
+    outcomes = Counter(finding.outcome for finding in findings)
+    statuses = Counter(finding.status for finding in findings)
+    return findings, EvaluationSummary(total=len(findings), outcomes=outcomes, statuses=statuses)
+
+
+__all__ = [
+    "DEFAULT_MAX_BUCKETS",
+    "EVALUATIONS_DIR",
+    "EvaluationCache",
+    "evaluate_with_cache",
+    "file_hash",
+    "policy_hash",
+]
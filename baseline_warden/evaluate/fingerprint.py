@@ -0,0 +1,57 @@
+"""Stable identities for findings that survive unrelated line shifts."""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+from ..detect.intern import ScanStrings
+
+FindingKey = Tuple[str, str, int]
+FINGERPRINT_VERSION = "baselineWarden/v1"
+
+
+def normalize_path(path: Union[Path, str]) -> str:
+    """Return a platform-independent, forward-slash form of ``path``."""
+
+    return str(path).replace("\\", "/")
+
+
+class OccurrenceTracker:
+    """Key findings by (file, bcd_key, occurrence ordinal) in report order.
+
+    Line numbers move whenever unrelated code is edited, so the ordinal of a
+    key within its file is used as the normalized context instead: the third
+    ``position: sticky`` in ``main.css`` keeps the same key until a sticky
+    declaration before it is added or removed.
+
+    Counts per key stay exact, but locations do not: when an occurrence is
+    inserted before existing ones, every later occurrence shifts up one
+    ordinal and the *last* one is the key that looks new, not the inserted
+    one.
+    """
+
+    def __init__(self, strings: Optional[ScanStrings] = None) -> None:
+        self._counts: Dict[Tuple[str, str], int] = {}
+        self._files: Dict[Union[Path, str], str] = {}
+        self._strings = strings
+
+    def key(self, path: Union[Path, str], bcd_key: str) -> FindingKey:
+        file = self._files.get(path)
+        if file is None:
+            rendered = self._strings.text(path) if self._strings is not None and isinstance(path, Path) else path
+            file = self._files[path] = normalize_path(rendered)
+        ordinal = self._counts.get((file, bcd_key), 0)
+        self._counts[(file, bcd_key)] = ordinal + 1
+        return file, bcd_key, ordinal
+
+
+def fingerprint(key: FindingKey) -> str:
+    """Return a sha256 hex digest identifying a finding key."""
+
+    file, bcd_key, ordinal = key
+    return hashlib.sha256(f"{file}\0{bcd_key}\0{ordinal}".encode("utf-8")).hexdigest()
+
+
+__all__ = ["FINGERPRINT_VERSION", "FindingKey", "OccurrenceTracker", "fingerprint", "normalize_path"]
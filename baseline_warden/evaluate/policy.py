@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import calendar
+import fnmatch
 from collections import Counter
-from dataclasses import dataclass
-from typing import Iterable, List, Literal, Optional
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Literal, Mapping, NamedTuple, Optional, Tuple, Union
 
 from ..config import BaselineWardenConfig
-from ..detect.common import Detection
+from ..detect.common import UNSUPPORTED_PREFIX, Detection
+from ..detect.suppress import SuppressionIndex
 from ..index.cache import LockFeature
 from .resolve import BaselineIndex, resolve_detection
 
@@ -24,6 +29,9 @@ class Finding:
     severity: Severity
     message: str
     allowlisted: bool = False
+    suppressed: bool = False
+    # "new" or "unchanged" once compared against a baseline report.
+    baseline: Optional[str] = None
 
 
 @dataclass
@@ -37,72 +45,208 @@ class EvaluationSummary:
 
 
 STATUS_UNKNOWN = "unknown"
+STATUS_UNSUPPORTED = "unsupported"
 SEVERITY_BY_OUTCOME = {"pass": "info", "warn": "warning", "fail": "error"}
+ALLOWLIST_MESSAGE = "Allowlisted feature"
+FEATURE_OVERRIDE_MESSAGE = "Outcome set by policy.feature_outcomes"
+SUPPRESSED_MESSAGE = "Suppressed by inline bw-ignore directive"
+UNSUPPORTED_MESSAGE = "Not scanned: unsupported preprocessor language"
+
+
+class Decision(NamedTuple):
+    outcome: Outcome
+    severity: Severity
+    message: str
+
+
+def _decision(outcome: Outcome, message: str) -> Decision:
+    return Decision(outcome, SEVERITY_BY_OUTCOME[outcome], message)  # type: ignore[arg-type]
+
+
+@dataclass(frozen=True)
+class CompiledPolicy:
+    """Policy decisions precomputed from a :class:`BaselineWardenConfig`.
+
+    Status decisions and per-feature overrides are plain dict lookups, the
+    allowlists are frozensets, and path-rule matches are cached per path, so
+    each unique key is evaluated once. Instances hold only builtin containers
+    and pickle cleanly for use in worker processes.
+    """
+
+    decisions: Mapping[str, Decision]
+    allowlist_features: FrozenSet[str] = frozenset()
+    allowlist_bcd: FrozenSet[str] = frozenset()
+    feature_decisions: Mapping[str, Decision] = field(default_factory=dict)
+    path_rules: Tuple[Tuple[str, Outcome], ...] = ()
+    # Age threshold for newly features: low_date ordinals <= cutoff are mature.
+    newly_cutoff_ordinal: Optional[int] = None
+    newly_mature: Optional[Decision] = None
+    newly_young: Optional[Decision] = None
+    _path_cache: Dict[str, Optional[Tuple[str, Outcome]]] = field(default_factory=dict, compare=False, repr=False)
+
+    def decide(
+        self,
+        detection: Detection,
+        feature: Optional[LockFeature],
+        status: str,
+        *,
+        low_date_ordinal: Optional[int] = None,
+    ) -> tuple[Decision, bool]:
+        """Return the decision for a detection and whether it was allowlisted."""
+
+        feature_id = feature.feature_id if feature else None
+        if detection.bcd_key in self.allowlist_bcd or (feature_id is not None and feature_id in self.allowlist_features):
+            return _ALLOWLISTED, True
+
+        decision = self.feature_decisions.get(feature_id) if feature_id is not None else None
+        if decision is None and status == "newly" and self.newly_cutoff_ordinal is not None:
+            mature = low_date_ordinal is not None and low_date_ordinal <= self.newly_cutoff_ordinal
+            decision = self.newly_mature if mature else self.newly_young
+        if decision is None:
+            decision = self.decisions.get(status) or self.decisions[STATUS_UNKNOWN]
+        if decision.outcome != "pass" and self.path_rules:
+            rule = self._path_rule(detection.path)
+            if rule is not None:
+                pattern, outcome = rule
+                decision = _decision(outcome, f"{decision.message} (path rule '{pattern}')")
+        return decision, False
+
+    def _path_rule(self, path: Path) -> Optional[Tuple[str, Outcome]]:
+        key = str(path)
+        if key in self._path_cache:
+            return self._path_cache[key]
+        relative = key.replace("\\", "/")
+        match = next(((pattern, outcome) for pattern, outcome in self.path_rules if fnmatch.fnmatch(relative, pattern)), None)
+        self._path_cache[key] = match
+        return match
+
+
+_ALLOWLISTED = _decision("pass", ALLOWLIST_MESSAGE)
+_SUPPRESSED = _decision("pass", SUPPRESSED_MESSAGE)
+_UNSUPPORTED = _decision("pass", UNSUPPORTED_MESSAGE)
+_UNSUPPORTED_KEY_PREFIX = UNSUPPORTED_PREFIX + "."
+
+
+def _status_decisions(config: BaselineWardenConfig) -> Dict[str, Decision]:
+    policy = config.policy
+    decisions = {
+        "limited": _decision("fail", "Feature baseline status is limited"),
+        "widely": _decision("pass", "Feature is widely available"),
+        "newly": (
+            _decision("warn", "Feature is newly available (policy requires widely)")
+            if policy.required_status == "widely"
+            else _decision("pass", "Feature is newly available")
+        ),
+    }
+    if policy.unknown_behavior == "fail":
+        decisions[STATUS_UNKNOWN] = _decision("fail", "Feature mapping is unknown")
+    elif policy.unknown_behavior == "ignore":
+        decisions[STATUS_UNKNOWN] = _decision("pass", "Feature mapping is unknown (ignored)")
+    else:
+        decisions[STATUS_UNKNOWN] = _decision("warn", "Feature mapping is unknown")
+    return decisions
+
+
+def months_before(day: date, months: int) -> date:
+    """Return the date ``months`` calendar months before ``day`` (clamped to month end)."""
+
+    year, month_index = divmod(day.year * 12 + day.month - 1 - months, 12)
+    month = month_index + 1
+    return date(year, month, min(day.day, calendar.monthrange(year, month)[1]))
+
+
+def compile_policy(config: BaselineWardenConfig) -> CompiledPolicy:
+    """Precompute the decision table, allowlists, and override rules for ``config``."""
+
+    policy = config.policy
+    age_rules: Dict[str, Any] = {}
+    if policy.newly_min_age_months is not None:
+        months = policy.newly_min_age_months
+        as_of = policy.as_of or date.today()
+        age_rules = {
+            "newly_cutoff_ordinal": months_before(as_of, months).toordinal(),
+            "newly_mature": _decision("pass", f"Feature has been newly available for at least {months} months"),
+            "newly_young": _decision("warn", f"Feature has been newly available for less than {months} months"),
+        }
+    return CompiledPolicy(
+        decisions=_status_decisions(config),
+        allowlist_features=frozenset(config.allowlist.feature_ids),
+        allowlist_bcd=frozenset(config.allowlist.bcd_keys),
+        feature_decisions={
+            feature_id: _decision(outcome, FEATURE_OVERRIDE_MESSAGE)
+            for feature_id, outcome in policy.feature_outcomes.items()
+        },
+        path_rules=tuple(policy.path_outcomes.items()),
+        **age_rules,
+    )
 
 
 def evaluate_detections(
     index: BaselineIndex,
     detections: Iterable[Detection],
-    config: BaselineWardenConfig,
+    config: Union[BaselineWardenConfig, CompiledPolicy],
+    *,
+    suppressions: Optional[Mapping[Path, SuppressionIndex]] = None,
 ) -> tuple[List[Finding], EvaluationSummary]:
     findings: List[Finding] = []
     outcome_counter: Counter = Counter()
     status_counter: Counter = Counter()
-    allowlist_features = set(config.allowlist.feature_ids)
-    allowlist_bcd = set(config.allowlist.bcd_keys)
+    policy = config if isinstance(config, CompiledPolicy) else compile_policy(config)
 
     for detection in detections:
-        feature = resolve_detection(index, detection)
-        status = feature.status if feature and feature.status else STATUS_UNKNOWN
-        allowlisted = False
-
-        if detection.bcd_key in allowlist_bcd or (feature and feature.feature_id in allowlist_features):
-            outcome: Outcome = "pass"
-            message = "Allowlisted feature"
-            allowlisted = True
+        allowlisted = suppressed = False
+        if detection.bcd_key.startswith(_UNSUPPORTED_KEY_PREFIX):
+            # Unparsed preprocessor blocks are reported but never gated by policy.
+            feature, status, decision = None, STATUS_UNSUPPORTED, _UNSUPPORTED
         else:
-            outcome, message = _evaluate_status(status, config)
+            feature = resolve_detection(index, detection)
+            status = feature.status if feature and feature.status else STATUS_UNKNOWN
+            file_suppressions = suppressions.get(detection.path) if suppressions else None
+            if file_suppressions is not None and file_suppressions.suppresses(detection.line, detection.bcd_key):
+                decision, suppressed = _SUPPRESSED, True
+            else:
+                low_date_ordinal = index.low_date_ordinals.get(feature.feature_id) if feature else None
+                decision, allowlisted = policy.decide(detection, feature, status, low_date_ordinal=low_date_ordinal)
 
-        severity: Severity = SEVERITY_BY_OUTCOME[outcome]
         findings.append(
             Finding(
                 detection=detection,
                 feature=feature,
                 status=status,
-                outcome=outcome,
-                severity=severity,
-                message=message,
+                outcome=decision.outcome,
+                severity=decision.severity,
+                message=decision.message,
                 allowlisted=allowlisted,
+                suppressed=suppressed,
             )
         )
-        outcome_counter[outcome] += 1
+        outcome_counter[decision.outcome] += 1
         status_counter[status] += 1
 
     summary = EvaluationSummary(total=len(findings), outcomes=outcome_counter, statuses=status_counter)
     return findings, summary
 
 
-def _evaluate_status(status: str, config: BaselineWardenConfig) -> tuple[Outcome, str]:
-    required_status = config.policy.required_status
-    unknown_behavior = config.policy.unknown_behavior
+def summarize_findings(findings: Iterable[Finding]) -> EvaluationSummary:
+    """Recount outcomes and statuses for an already-evaluated set of findings."""
 
-    if status == "limited":
-        return "fail", "Feature baseline status is limited"
-
-    if status == "widely":
-        return "pass", "Feature is widely available"
-
-    if status == "newly":
-        if required_status == "widely":
-            return "warn", "Feature is newly available (policy requires widely)"
-        return "pass", "Feature is newly available"
-
-    # unknown handling
-    if unknown_behavior == "fail":
-        return "fail", "Feature mapping is unknown"
-    if unknown_behavior == "ignore":
-        return "pass", "Feature mapping is unknown (ignored)"
-    return "warn", "Feature mapping is unknown"
-
-
-__all__ = ["Finding", "EvaluationSummary", "evaluate_detections"]
+    total = 0
+    outcome_counter: Counter = Counter()
+    status_counter: Counter = Counter()
+    for finding in findings:
+        total += 1
+        outcome_counter[finding.outcome] += 1
+        status_counter[finding.status] += 1
+    return EvaluationSummary(total=total, outcomes=outcome_counter, statuses=status_counter)
+
+
+__all__ = [
+    "CompiledPolicy",
+    "Decision",
+    "EvaluationSummary",
+    "Finding",
+    "compile_policy",
+    "evaluate_detections",
+    "months_before",
+    "summarize_findings",
+]
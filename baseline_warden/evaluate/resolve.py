@@ -2,29 +2,147 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Optional
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, Optional, Tuple
 
+from ..config import ConflictStrategy
 from ..detect.common import Detection
+from ..detect.html_keys import HtmlKeyTable
 from ..index.cache import BaselineLock, LockFeature
 
+# Lower rank = more restrictive. Unknown status sits between limited and newly.
+STATUS_RESTRICTIVENESS = {"limited": 0, None: 1, "newly": 2, "widely": 3}
+CONFLICT_STRATEGIES: Tuple[str, ...] = ("first", "most_restrictive", "least_restrictive")
+
 
 @dataclass
 class BaselineIndex:
+    # The resolved feature for every key; lookups never touch ``conflicts``.
     features_by_id: Dict[str, LockFeature]
     features_by_bcd: Dict[str, LockFeature]
+    # Baseline low/high dates as proleptic Gregorian ordinals, keyed by feature id.
+    low_date_ordinals: Dict[str, int] = field(default_factory=dict)
+    high_date_ordinals: Dict[str, int] = field(default_factory=dict)
+    # Only keys claimed by more than one feature, with every claimant in lock order.
+    conflicts: Dict[str, Tuple[LockFeature, ...]] = field(default_factory=dict)
+    strategy: ConflictStrategy = "first"
+    _html_keys: Optional[HtmlKeyTable] = field(default=None, init=False, repr=False, compare=False)
+
+    def html_keys(self, *, exhaustive: bool = False) -> HtmlKeyTable:
+        """The HTML detector's table of mapped element, attribute, global-attribute and value keys."""
+
+        if self._html_keys is None:
+            self._html_keys = HtmlKeyTable.from_keys(self.features_by_bcd)
+        return self._html_keys.with_exhaustive(exhaustive)
+
+    def features_for(self, bcd_key: str) -> Tuple[LockFeature, ...]:
+        """Return every feature that lists ``bcd_key``."""
+
+        candidates = self.conflicts.get(bcd_key)
+        if candidates is not None:
+            return candidates
+        feature = self.features_by_bcd.get(bcd_key)
+        return (feature,) if feature is not None else ()
+
+
+def date_ordinal(value: Optional[str]) -> Optional[int]:
+    """Parse a lock date (``2023-03-14``, or ranged ``≤2020-01-29``) into an ordinal."""
+
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value.lstrip("≤")[:10]).toordinal()
+    except ValueError:
+        return None
+
+
+def _restrictiveness(feature: LockFeature) -> int:
+    return STATUS_RESTRICTIVENESS.get(feature.status, STATUS_RESTRICTIVENESS[None])
 
 
-def build_index(lock: BaselineLock) -> BaselineIndex:
+def build_index(lock: BaselineLock, *, strategy: ConflictStrategy = "first") -> BaselineIndex:
+    """Index a lock by feature id and BCD key.
+
+    When several features list the same key, ``strategy`` picks the one that
+    lookups resolve to: the first in lock order, or the one whose status is
+    most or least restrictive (ties keep lock order).
+    """
+
+    if strategy not in CONFLICT_STRATEGIES:
+        raise ValueError(f"Unknown conflict strategy '{strategy}'; expected one of {', '.join(CONFLICT_STRATEGIES)}")
     features_by_id: Dict[str, LockFeature] = {}
     features_by_bcd: Dict[str, LockFeature] = {}
+    conflicts: Dict[str, Tuple[LockFeature, ...]] = {}
+    low_date_ordinals: Dict[str, int] = {}
+    high_date_ordinals: Dict[str, int] = {}
 
     for feature in lock.features:
         features_by_id[feature.feature_id] = feature
         for key in feature.bcd_keys:
-            features_by_bcd.setdefault(key, feature)
+            existing = features_by_bcd.setdefault(key, feature)
+            if existing is feature:
+                continue
+            claimants = conflicts.get(key, (existing,))
+            if feature not in claimants:
+                conflicts[key] = claimants + (feature,)
+        low = date_ordinal(feature.low_date)
+        if low is not None:
+            low_date_ordinals[feature.feature_id] = low
+        high = date_ordinal(feature.high_date)
+        if high is not None:
+            high_date_ordinals[feature.feature_id] = high
+
+    if strategy != "first":
+        pick = min if strategy == "most_restrictive" else max
+        for key, claimants in conflicts.items():
+            # min/max return the first of equally ranked items, preserving lock order on ties.
+            features_by_bcd[key] = pick(claimants, key=_restrictiveness)
+
+    return BaselineIndex(
+        features_by_id=features_by_id,
+        features_by_bcd=features_by_bcd,
+        low_date_ordinals=low_date_ordinals,
+        high_date_ordinals=high_date_ordinals,
+        conflicts=conflicts,
+        strategy=strategy,
+    )
+
+
+@dataclass
+class IndexStats:
+    features: int
+    bcd_keys: int
+    conflicting_keys: int
+    strategy: str
+    index_bytes: int
+    conflicts: Dict[str, Tuple[LockFeature, ...]]
+    resolved: Dict[str, LockFeature]
+
+
+def index_stats(lock: BaselineLock, *, strategy: ConflictStrategy = "first") -> IndexStats:
+    """Build an index under tracemalloc and report its size and key conflicts."""
 
-    return BaselineIndex(features_by_id=features_by_id, features_by_bcd=features_by_bcd)
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        index = build_index(lock, strategy=strategy)
+        index_bytes = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+    return IndexStats(
+        features=len(index.features_by_id),
+        bcd_keys=len(index.features_by_bcd),
+        conflicting_keys=len(index.conflicts),
+        strategy=strategy,
+        index_bytes=index_bytes,
+        conflicts=index.conflicts,
+        resolved={key: index.features_by_bcd[key] for key in index.conflicts},
+    )
 
 
 def resolve_detection(index: BaselineIndex, detection: Detection) -> Optional[LockFeature]:
@@ -49,4 +167,13 @@ def resolve_detection(index: BaselineIndex, detection: Detection) -> Optional[Lo
     return None
 
 
-__all__ = ["BaselineIndex", "build_index", "resolve_detection"]
+__all__ = [
+    "BaselineIndex",
+    "CONFLICT_STRATEGIES",
+    "IndexStats",
+    "STATUS_RESTRICTIVENESS",
+    "build_index",
+    "date_ordinal",
+    "index_stats",
+    "resolve_detection",
+]
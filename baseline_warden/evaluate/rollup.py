@@ -0,0 +1,129 @@
+"""Streaming rollups of findings grouped by feature, file, or BCD key."""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..config import GroupBy
+from ..detect.intern import ScanStrings
+from .policy import Finding, Severity
+
+GROUP_BY_CHOICES: Tuple[str, ...] = ("feature", "file", "bcd-key")
+DEFAULT_SAMPLE_SIZE = 5
+SEVERITY_RANK = {"info": 0, "warning": 1, "error": 2}
+
+
+@dataclass
+class FindingGroup:
+    """Aggregated counts and a bounded sample of locations for one group."""
+
+    key: str
+    title: Optional[str] = None
+    count: int = 0
+    severity: Severity = "info"
+    outcomes: Counter = field(default_factory=Counter)
+    statuses: Counter = field(default_factory=Counter)
+    samples: List[Tuple[Path, int]] = field(default_factory=list)
+
+
+def _feature_key(finding: Finding) -> Tuple[str, Optional[str]]:
+    if finding.feature:
+        return finding.feature.feature_id, finding.feature.title
+    # Unmapped detections have no feature; keep them apart by BCD key.
+    return finding.detection.bcd_key, None
+
+
+def _file_key(finding: Finding) -> Tuple[str, Optional[str]]:
+    return str(finding.detection.path), None
+
+
+def _bcd_key(finding: Finding) -> Tuple[str, Optional[str]]:
+    title = finding.feature.title if finding.feature else None
+    return finding.detection.bcd_key, title
+
+
+_KEY_FUNCS: Dict[str, Callable[[Finding], Tuple[str, Optional[str]]]] = {
+    "feature": _feature_key,
+    "file": _file_key,
+    "bcd-key": _bcd_key,
+}
+
+
+class FindingRollup:
+    """Accumulate findings into groups in a single pass.
+
+    Memory is bounded by the number of distinct groups times ``sample_size``,
+    not by the number of findings added.
+    """
+
+    def __init__(
+        self,
+        group_by: GroupBy,
+        *,
+        sample_size: int = DEFAULT_SAMPLE_SIZE,
+        strings: Optional[ScanStrings] = None,
+    ) -> None:
+        if group_by not in _KEY_FUNCS:
+            raise ValueError(f"Unsupported group_by '{group_by}'; expected one of {', '.join(GROUP_BY_CHOICES)}")
+        self.group_by = group_by
+        self.sample_size = sample_size
+        self._key_func = _KEY_FUNCS[group_by]
+        if group_by == "file":
+            paths = strings if strings is not None else ScanStrings()
+            self._key_func = lambda finding: (paths.text(finding.detection.path), None)
+        self._groups: Dict[str, FindingGroup] = {}
+
+    def add(self, finding: Finding) -> None:
+        key, title = self._key_func(finding)
+        group = self._groups.get(key)
+        if group is None:
+            group = FindingGroup(key=key, title=title)
+            self._groups[key] = group
+        group.count += 1
+        group.outcomes[finding.outcome] += 1
+        group.statuses[finding.status] += 1
+        if SEVERITY_RANK[finding.severity] > SEVERITY_RANK[group.severity]:
+            group.severity = finding.severity
+        if len(group.samples) < self.sample_size:
+            group.samples.append((finding.detection.path, finding.detection.line))
+
+    def extend(self, findings: Iterable[Finding]) -> "FindingRollup":
+        for finding in findings:
+            self.add(finding)
+        return self
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    @property
+    def groups(self) -> List[FindingGroup]:
+        """Groups ordered by worst severity, then count, then key."""
+
+        return sorted(
+            self._groups.values(),
+            key=lambda group: (-SEVERITY_RANK[group.severity], -group.count, group.key),
+        )
+
+
+def rollup_findings(
+    findings: Iterable[Finding],
+    group_by: GroupBy,
+    *,
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+    strings: Optional[ScanStrings] = None,
+) -> FindingRollup:
+    """Build a :class:`FindingRollup` from an iterable of findings."""
+
+    return FindingRollup(group_by, sample_size=sample_size, strings=strings).extend(findings)
+
+
+__all__ = [
+    "GROUP_BY_CHOICES",
+    "FindingGroup",
+    "FindingRollup",
+    "GroupBy",
+    "rollup_findings",
+]
@@ -4,4 +4,5 @@ This package will contain:
 - fetch: API client for the Web Status feature catalog.
 - build: Assembly of BCD key → feature ID mappings.
 - cache: Local snapshot management.
+- store: Atomic writes, file locks and content-addressed blobs for the cache directory.
 """
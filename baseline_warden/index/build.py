@@ -3,15 +3,16 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence, Union
 
 import httpx
 from pydantic import BaseModel, Field
 
-from .fetch import BaselineInfo, WebStatusFeature
-from .cache import LockFeature
+from .fetch import BaselineInfo, FetchResult, WebStatusFeature
+from .cache import BaselineLock, LockFeature
+from .store import CacheStore
 from .. import __version__
 
 WEB_FEATURES_URL = "https://unpkg.com/web-features@latest/data.json"
@@ -51,6 +52,14 @@ class FeatureMetadata:
 class WebFeaturesIndex:
     features: Dict[str, FeatureMetadata]
     bcd_to_feature: Dict[str, str]
+    # Keys listed by more than one feature -> every feature id, in dataset order.
+    bcd_conflicts: Dict[str, List[str]] = field(default_factory=dict)
+
+
+def load_web_features_dataset(path: Path) -> WebFeaturesDataset:
+    """Parse a local web-features ``data.json`` (the same file online sync caches)."""
+
+    return WebFeaturesDataset.model_validate_json(path.read_bytes())
 
 
 def fetch_web_features_dataset(
@@ -63,27 +72,33 @@ def fetch_web_features_dataset(
 ) -> WebFeaturesDataset:
     headers = {"Accept": "application/json", "User-Agent": USER_AGENT}
 
-    if cache_path and not force_refresh and cache_path.exists():
-        return WebFeaturesDataset.model_validate_json(cache_path.read_text(encoding="utf-8"))
-
     def _do_request(http_client: httpx.Client) -> WebFeaturesDataset:
         response = http_client.get(url, headers=headers, timeout=timeout)
         response.raise_for_status()
-        dataset = WebFeaturesDataset.model_validate_json(response.text)
+        dataset = WebFeaturesDataset.model_validate_json(response.content)
         if cache_path:
-            cache_path.parent.mkdir(parents=True, exist_ok=True)
-            cache_path.write_text(response.text, encoding="utf-8")
+            CacheStore(cache_path.parent).put(cache_path.name, response.content)
         return dataset
 
-    if client:
-        return _do_request(client)
-    with httpx.Client(follow_redirects=True) as http_client:
-        return _do_request(http_client)
+    def _fetch() -> WebFeaturesDataset:
+        if client:
+            return _do_request(client)
+        with httpx.Client(follow_redirects=True) as http_client:
+            return _do_request(http_client)
+
+    if not cache_path:
+        return _fetch()
+    # Hold the entry lock from the cache check to the write so parallel syncs download once.
+    with CacheStore(cache_path.parent).lock(cache_path.name):
+        if not force_refresh and cache_path.exists():
+            return load_web_features_dataset(cache_path)
+        return _fetch()
 
 
 def build_web_features_index(dataset: WebFeaturesDataset) -> WebFeaturesIndex:
     feature_metadata: Dict[str, FeatureMetadata] = {}
     bcd_to_feature: Dict[str, str] = {}
+    bcd_conflicts: Dict[str, List[str]] = {}
 
     for feature_id, entry in dataset.features.items():
         metadata = FeatureMetadata(
@@ -98,9 +113,13 @@ def build_web_features_index(dataset: WebFeaturesDataset) -> WebFeaturesIndex:
         feature_metadata[feature_id] = metadata
 
         for bcd_key in entry.compat_features:
-            bcd_to_feature.setdefault(bcd_key, feature_id)
+            owner = bcd_to_feature.setdefault(bcd_key, feature_id)
+            if owner != feature_id:
+                claimants = bcd_conflicts.setdefault(bcd_key, [owner])
+                if feature_id not in claimants:
+                    claimants.append(feature_id)
 
-    return WebFeaturesIndex(features=feature_metadata, bcd_to_feature=bcd_to_feature)
+    return WebFeaturesIndex(features=feature_metadata, bcd_to_feature=bcd_to_feature, bcd_conflicts=bcd_conflicts)
 
 
 def assemble_lock_features(
@@ -151,6 +170,19 @@ def assemble_lock_features(
     return lock_entries
 
 
+def build_lock(
+    dataset: WebFeaturesDataset,
+    baseline: FetchResult,
+    *,
+    metadata: Optional[dict] = None,
+) -> BaselineLock:
+    """Build a lock snapshot from parsed datasets; shared by online and offline sync."""
+
+    index = build_web_features_index(dataset)
+    features = assemble_lock_features(index=index, baseline_features=baseline.features)
+    return BaselineLock(features=features, metadata=metadata)
+
+
 __all__ = [
     "FeatureMetadata",
     "WebFeaturesDataset",
@@ -158,4 +190,6 @@ __all__ = [
     "fetch_web_features_dataset",
     "build_web_features_index",
     "assemble_lock_features",
+    "build_lock",
+    "load_web_features_dataset",
 ]
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-import json
+import gzip
 import hashlib
+import json
 import os
 from datetime import UTC, datetime
 from pathlib import Path
@@ -11,6 +12,8 @@ from typing import List, Optional
 
 from pydantic import BaseModel, Field, computed_field
 
+from .store import atomic_write_bytes
+
 
 class LockFeature(BaseModel):
     """Minimal Baseline feature representation stored in the lock file."""
@@ -42,22 +45,90 @@ class BaselineLock(BaseModel):
         return len(self.features)
 
 
-def load_lock(path: Path) -> BaselineLock:
-    """Load a Baseline lock snapshot from disk."""
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
 
-    data = json.loads(path.read_text(encoding="utf-8"))
-    return BaselineLock.model_validate(data)
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError as exc:  # pragma: no cover - depends on optional extra
+        raise RuntimeError(
+            "zstd-compressed locks need the optional 'zstandard' package: pip install 'baseline-warden[zstd]'"
+        ) from exc
+    return zstandard
 
 
-def write_lock(path: Path, lock: BaselineLock) -> None:
-    """Persist a Baseline lock snapshot to disk as JSON."""
+def canonical_lock_payload(lock: BaselineLock) -> dict:
+    """Lock payload with BCD keys sorted; feature order is kept because it decides key ownership."""
 
     payload = lock.model_dump(mode="json", exclude_none=True)
+    for feature in payload["features"]:
+        feature["bcd_keys"] = sorted(feature["bcd_keys"])
+    return payload
+
+
+def _canonical_bytes(data: object, *, compact: bool) -> bytes:
+    if compact:
+        text = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    else:
+        text = json.dumps(data, sort_keys=True, indent=2, ensure_ascii=False)
+    return text.encode("utf-8")
+
+
+def lock_digest(lock: BaselineLock) -> str:
+    """sha256 of the canonical compact encoding of ``version`` and ``features``.
+
+    ``generated_at`` and ``metadata`` are excluded, so re-syncing identical data
+    yields the same digest.
+    """
+
+    payload = canonical_lock_payload(lock)
+    content = {"version": payload["version"], "features": payload["features"]}
+    return hashlib.sha256(_canonical_bytes(content, compact=True)).hexdigest()
+
+
+def _decompress(raw: bytes) -> bytes:
+    if raw.startswith(GZIP_MAGIC):
+        return gzip.decompress(raw)
+    if raw.startswith(ZSTD_MAGIC):
+        return _zstandard().ZstdDecompressor().decompressobj().decompress(raw)
+    return raw
+
+
+def read_lock_payload(path: Path) -> dict:
+    """Return the raw JSON payload of a lock, including the stored ``digest``."""
+
+    return json.loads(_decompress(path.read_bytes()))
+
+
+def load_lock(path: Path) -> BaselineLock:
+    """Load a Baseline lock snapshot from disk (plain, gzip, or zstd JSON)."""
+
+    return BaselineLock.model_validate_json(_decompress(path.read_bytes()))
+
+
+def write_lock(path: Path, lock: BaselineLock, *, compact: bool = False) -> str:
+    """Persist a lock snapshot as canonical JSON and return its content digest.
+
+    Keys are sorted and ``compact`` drops indentation. A ``.gz`` or ``.zst``
+    suffix compresses the output; gzip is written with a zero mtime so equal
+    locks produce identical bytes.
+    """
+
+    payload = canonical_lock_payload(lock)
     payload["feature_count"] = lock.feature_count
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    digest = payload["digest"] = lock_digest(lock)
+    data = _canonical_bytes(payload, compact=compact)
+    if path.suffix == ".gz":
+        data = gzip.compress(data, mtime=0)
+    elif path.suffix == ".zst":
+        data = _zstandard().ZstdCompressor().compress(data)
+    atomic_write_bytes(path, data)
+    return digest
 
 
-__all__ = ["BaselineLock", "LockFeature", "load_lock", "write_lock"]
+__all__ = ["BaselineLock", "LockFeature", "canonical_lock_payload", "load_lock", "lock_digest", "read_lock_payload", "write_lock"]
 
 
 CACHE_ENV_VAR = "BASELINE_WARDEN_CACHE_DIR"
@@ -0,0 +1,235 @@
+"""Compare two lock snapshots and report the impact on a scanned codebase.
+
+Lock features are stored sorted by ``feature_id`` (see
+``assemble_lock_features``), so transitions are computed with a single
+merge-join over both lists. A detection index written by
+``bw scan --detection-index`` maps each detected BCD key to the files that use
+it, which lets ``bw lock diff`` list affected files without rescanning.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+
+from ..config import ConflictStrategy
+from ..detect.common import Detection
+from ..evaluate.resolve import BaselineIndex, build_index, resolve_detection
+from .cache import BaselineLock, LockFeature
+
+DETECTION_INDEX_VERSION = "1"
+
+
+@dataclass
+class FeatureChange:
+    feature_id: str
+    title: Optional[str]
+    kind: str  # "added", "removed", or "changed"
+    old_status: Optional[str] = None
+    new_status: Optional[str] = None
+    added_keys: List[str] = field(default_factory=list)
+    removed_keys: List[str] = field(default_factory=list)
+
+    @property
+    def status_changed(self) -> bool:
+        return self.old_status != self.new_status
+
+
+@dataclass
+class AffectedKey:
+    bcd_key: str
+    old_feature: Optional[str]
+    new_feature: Optional[str]
+    old_status: Optional[str]
+    new_status: Optional[str]
+    files: List[str]
+
+
+@dataclass
+class LockDiff:
+    changes: List[FeatureChange] = field(default_factory=list)
+    affected: List[AffectedKey] = field(default_factory=list)
+
+    @property
+    def affected_files(self) -> List[str]:
+        return sorted({path for entry in self.affected for path in entry.files})
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "changes": [
+                {
+                    "feature_id": change.feature_id,
+                    "title": change.title,
+                    "kind": change.kind,
+                    "old_status": change.old_status,
+                    "new_status": change.new_status,
+                    "added_keys": change.added_keys,
+                    "removed_keys": change.removed_keys,
+                }
+                for change in self.changes
+            ],
+            "affected": [
+                {
+                    "bcd_key": entry.bcd_key,
+                    "old_feature": entry.old_feature,
+                    "new_feature": entry.new_feature,
+                    "old_status": entry.old_status,
+                    "new_status": entry.new_status,
+                    "files": entry.files,
+                }
+                for entry in self.affected
+            ],
+            "affected_files": self.affected_files,
+        }
+
+
+def _sorted_features(features: Sequence[LockFeature]) -> Sequence[LockFeature]:
+    # Locks written by `bw sync` are already sorted; only hand-edited ones pay for a sort.
+    if all(features[i].feature_id <= features[i + 1].feature_id for i in range(len(features) - 1)):
+        return features
+    return sorted(features, key=lambda feature: feature.feature_id)
+
+
+def _compare(old: LockFeature, new: LockFeature) -> Optional[FeatureChange]:
+    old_keys = set(old.bcd_keys)
+    new_keys = set(new.bcd_keys)
+    if old.status == new.status and old_keys == new_keys:
+        return None
+    return FeatureChange(
+        feature_id=new.feature_id,
+        title=new.title or old.title,
+        kind="changed",
+        old_status=old.status,
+        new_status=new.status,
+        added_keys=sorted(new_keys - old_keys),
+        removed_keys=sorted(old_keys - new_keys),
+    )
+
+
+def _removed(feature: LockFeature) -> FeatureChange:
+    return FeatureChange(
+        feature.feature_id, feature.title, "removed", old_status=feature.status, removed_keys=list(feature.bcd_keys)
+    )
+
+
+def _added(feature: LockFeature) -> FeatureChange:
+    return FeatureChange(
+        feature.feature_id, feature.title, "added", new_status=feature.status, added_keys=list(feature.bcd_keys)
+    )
+
+
+def diff_features(old: Sequence[LockFeature], new: Sequence[LockFeature]) -> List[FeatureChange]:
+    """Merge-join two feature lists by ``feature_id`` and return the differences."""
+
+    old_sorted = _sorted_features(old)
+    new_sorted = _sorted_features(new)
+    changes: List[FeatureChange] = []
+    i = j = 0
+    while i < len(old_sorted) and j < len(new_sorted):
+        before, after = old_sorted[i], new_sorted[j]
+        if before.feature_id == after.feature_id:
+            change = _compare(before, after)
+            if change is not None:
+                changes.append(change)
+            i += 1
+            j += 1
+        elif before.feature_id < after.feature_id:
+            changes.append(_removed(before))
+            i += 1
+        else:
+            changes.append(_added(after))
+            j += 1
+    for before in old_sorted[i:]:
+        changes.append(_removed(before))
+    for after in new_sorted[j:]:
+        changes.append(_added(after))
+    return changes
+
+
+def build_detection_index(detections: Iterable[Detection]) -> Dict[str, List[str]]:
+    """Map each detected BCD key to the sorted POSIX paths of files that use it."""
+
+    files_by_key: Dict[str, Set[str]] = defaultdict(set)
+    path_strings: Dict[Path, str] = {}
+    for detection in detections:
+        path = path_strings.get(detection.path)
+        if path is None:
+            path = path_strings[detection.path] = detection.path.as_posix()
+        files_by_key[detection.bcd_key].add(path)
+    return {key: sorted(files) for key, files in sorted(files_by_key.items())}
+
+
+def write_detection_index(path: Path, detections: Iterable[Detection]) -> Dict[str, List[str]]:
+    keys = build_detection_index(detections)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"version": DETECTION_INDEX_VERSION, "keys": keys}, indent=2), encoding="utf-8")
+    return keys
+
+
+def load_detection_index(path: Path) -> Dict[str, List[str]]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if data.get("version") != DETECTION_INDEX_VERSION:
+        raise ValueError(f"Unsupported detection index version in {path}: {data.get('version')!r}")
+    return data["keys"]
+
+
+def _resolve(index: BaselineIndex, bcd_key: str) -> Optional[LockFeature]:
+    return resolve_detection(index, Detection(path=Path("."), line=0, bcd_key=bcd_key))
+
+
+def affected_keys(
+    old_index: BaselineIndex,
+    new_index: BaselineIndex,
+    detection_index: Dict[str, List[str]],
+) -> List[AffectedKey]:
+    """Return detected keys whose resolved feature or status differs between two locks."""
+
+    affected: List[AffectedKey] = []
+    for bcd_key, files in detection_index.items():
+        before = _resolve(old_index, bcd_key)
+        after = _resolve(new_index, bcd_key)
+        old_feature = before.feature_id if before else None
+        new_feature = after.feature_id if after else None
+        old_status = before.status if before else None
+        new_status = after.status if after else None
+        if old_feature == new_feature and old_status == new_status:
+            continue
+        affected.append(AffectedKey(bcd_key, old_feature, new_feature, old_status, new_status, list(files)))
+    return affected
+
+
+def diff_locks(
+    old: BaselineLock,
+    new: BaselineLock,
+    *,
+    detection_index: Optional[Dict[str, List[str]]] = None,
+    strategy: ConflictStrategy = "first",
+) -> LockDiff:
+    """Diff two lock snapshots; with a detection index, also list affected keys and files.
+
+    Keys are resolved with the conflict ``strategy`` the scan uses. They are
+    checked even when no feature changed: reordering a lock can move a shared
+    key to another feature.
+    """
+
+    result = LockDiff(changes=diff_features(old.features, new.features))
+    if detection_index:
+        result.affected = affected_keys(
+            build_index(old, strategy=strategy), build_index(new, strategy=strategy), detection_index
+        )
+    return result
+
+
+__all__ = [
+    "AffectedKey",
+    "FeatureChange",
+    "LockDiff",
+    "build_detection_index",
+    "diff_features",
+    "diff_locks",
+    "load_detection_index",
+    "write_detection_index",
+]
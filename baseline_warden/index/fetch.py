@@ -5,12 +5,13 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Optional, Sequence
+from typing import Any, Iterable, List, Optional, Sequence
 
 import httpx
 from pydantic import BaseModel, Field
 
 from .. import __version__
+from .store import CacheStore
 
 BASE_URL = "https://api.webstatus.dev/v1/features"
 DEFAULT_TIMEOUT = httpx.Timeout(30.0)
@@ -57,6 +58,20 @@ class FetchResult:
     total: Optional[int]
 
 
+def parse_features_payload(data: Any) -> FetchResult:
+    """Read features from a sync cache file, one API response page, or a bare list."""
+
+    if isinstance(data, list):
+        items, total = data, len(data)
+    elif not isinstance(data, dict):
+        raise ValueError(f"expected a JSON object or list of features, got {type(data).__name__}")
+    elif "data" in data:
+        items, total = data["data"], (data.get("metadata") or {}).get("total")
+    else:
+        items, total = data.get("features", []), data.get("total")
+    return FetchResult(features=[WebStatusFeature.model_validate(item) for item in items], total=total)
+
+
 def _build_query(statuses: Iterable[str]) -> str:
     parts = [f"baseline_status:{status}" for status in statuses]
     if not parts:
@@ -78,47 +93,52 @@ def fetch_features(
 
     effective_query = query or _build_query(dict.fromkeys(statuses))
     headers = {"Accept": "application/json", "User-Agent": USER_AGENT}
-    collected: List[WebStatusFeature] = []
-    next_token: Optional[str] = None
-    total: Optional[int] = None
-
-    if cache_path and not force_refresh and cache_path.exists():
-        cached = json.loads(cache_path.read_text(encoding="utf-8"))
-        if cached.get("query") == effective_query:
-            features = [WebStatusFeature.model_validate(item) for item in cached.get("features", [])]
-            return FetchResult(features=features, total=cached.get("total"))
-
-    def _request_loop(http_client: httpx.Client) -> None:
-        nonlocal next_token, total
-        while True:
-            params = {"q": effective_query}
-            if next_token:
-                params["page_token"] = next_token
-            response = http_client.get(base_url, params=params, headers=headers, timeout=timeout)
-            response.raise_for_status()
-            payload = FeaturesResponse.model_validate_json(response.text)
-            collected.extend(payload.data)
-            total = payload.metadata.total
-            next_token = payload.metadata.next_page_token
-            if not next_token:
-                break
-
-    if client:
-        _request_loop(client)
-    else:
-        with httpx.Client() as http_client:
-            _request_loop(http_client)
 
-    if cache_path:
-        cache_path.parent.mkdir(parents=True, exist_ok=True)
+    def _fetch() -> FetchResult:
+        collected: List[WebStatusFeature] = []
+        next_token: Optional[str] = None
+        total: Optional[int] = None
+
+        def _request_loop(http_client: httpx.Client) -> None:
+            nonlocal next_token, total
+            while True:
+                params = {"q": effective_query}
+                if next_token:
+                    params["page_token"] = next_token
+                response = http_client.get(base_url, params=params, headers=headers, timeout=timeout)
+                response.raise_for_status()
+                payload = FeaturesResponse.model_validate_json(response.text)
+                collected.extend(payload.data)
+                total = payload.metadata.total
+                next_token = payload.metadata.next_page_token
+                if not next_token:
+                    break
+
+        if client:
+            _request_loop(client)
+        else:
+            with httpx.Client() as http_client:
+                _request_loop(http_client)
+        return FetchResult(features=collected, total=total)
+
+    if not cache_path:
+        return _fetch()
+
+    store = CacheStore(cache_path.parent)
+    # Hold the entry lock from the cache check to the write so parallel syncs fetch once.
+    with store.lock(cache_path.name):
+        if not force_refresh and cache_path.exists():
+            cached = json.loads(cache_path.read_text(encoding="utf-8"))
+            if cached.get("query") == effective_query:
+                return parse_features_payload(cached)
+        result = _fetch()
         payload = {
             "query": effective_query,
-            "total": total,
-            "features": [feature.model_dump(mode="json", exclude_none=True) for feature in collected],
+            "total": result.total,
+            "features": [feature.model_dump(mode="json", exclude_none=True) for feature in result.features],
         }
-        cache_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-
-    return FetchResult(features=collected, total=total)
+        store.put(cache_path.name, json.dumps(payload, indent=2).encode("utf-8"))
+    return result
 
 
-__all__ = ["fetch_features", "FetchResult", "WebStatusFeature", "BaselineInfo", "SpecInfo", "SpecLink"]
+__all__ = ["fetch_features", "parse_features_payload", "FetchResult", "WebStatusFeature", "BaselineInfo", "SpecInfo", "SpecLink"]
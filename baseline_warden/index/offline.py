@@ -0,0 +1,120 @@
+"""Offline sync sources: local dataset files and tarball bundles.
+
+A bundle is a tar archive (optionally gzip/bz2/xz compressed) holding
+``web-features.json`` and ``webstatus.json``. The same two files that online
+sync caches can be bundled with ``bw sync --lock --write-bundle``.
+Members are read in memory; nothing is extracted to disk.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import io
+import json
+import tarfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+from .build import WebFeaturesDataset
+from .fetch import FetchResult, parse_features_payload
+
+BUNDLE_WEB_FEATURES = "web-features.json"
+BUNDLE_WEB_STATUS = "webstatus.json"
+
+
+@dataclass
+class OfflineSources:
+    dataset: WebFeaturesDataset
+    baseline: FetchResult
+    metadata: Dict[str, dict]
+
+
+def _parse(web_features: bytes, web_status: bytes, *, web_features_source: str, web_status_source: str) -> OfflineSources:
+    try:
+        dataset = WebFeaturesDataset.model_validate_json(web_features)
+    except ValueError as exc:
+        raise ValueError(f"{web_features_source}: {exc}") from exc
+    try:
+        baseline = parse_features_payload(json.loads(web_status))
+    except ValueError as exc:
+        raise ValueError(f"{web_status_source}: {exc}") from exc
+    metadata = {
+        "web_features": {
+            "source": web_features_source,
+            "sha256": hashlib.sha256(web_features).hexdigest(),
+        },
+        "web_status": {
+            "source": web_status_source,
+            "sha256": hashlib.sha256(web_status).hexdigest(),
+            "total": baseline.total,
+        },
+    }
+    return OfflineSources(dataset=dataset, baseline=baseline, metadata=metadata)
+
+
+def load_local_sources(web_features_path: Path, web_status_path: Path) -> OfflineSources:
+    """Parse a web-features ``data.json`` and a Web Status export from disk."""
+
+    return _parse(
+        web_features_path.read_bytes(),
+        web_status_path.read_bytes(),
+        web_features_source=str(web_features_path),
+        web_status_source=str(web_status_path),
+    )
+
+
+def _read_member(archive: tarfile.TarFile, name: str, bundle: Path) -> bytes:
+    member: Optional[tarfile.TarInfo] = None
+    for candidate in archive.getmembers():
+        if candidate.isfile() and Path(candidate.name).name == name:
+            member = candidate
+            break
+    if member is None:
+        raise ValueError(f"Bundle {bundle} has no {name}")
+    handle = archive.extractfile(member)
+    assert handle is not None
+    return handle.read()
+
+
+def load_bundle(path: Path) -> OfflineSources:
+    """Parse the datasets stored in a tarball bundle."""
+
+    try:
+        with tarfile.open(path, "r:*") as archive:
+            web_features = _read_member(archive, BUNDLE_WEB_FEATURES, path)
+            web_status = _read_member(archive, BUNDLE_WEB_STATUS, path)
+    except tarfile.TarError as exc:
+        raise ValueError(f"Not a readable tar bundle: {path} ({exc})") from exc
+    return _parse(
+        web_features,
+        web_status,
+        web_features_source=f"{path}:{BUNDLE_WEB_FEATURES}",
+        web_status_source=f"{path}:{BUNDLE_WEB_STATUS}",
+    )
+
+
+def write_bundle(path: Path, web_features_path: Path, web_status_path: Path) -> None:
+    """Write a bundle from two dataset files; ``.gz`` and ``.tgz`` paths are gzip-compressed."""
+
+    with path.open("wb") as raw:
+        # Zero mtimes (gzip header and members) keep bundles of identical data byte-identical.
+        stream = gzip.GzipFile(filename="", fileobj=raw, mode="wb", mtime=0) if path.suffix in {".gz", ".tgz"} else raw
+        with stream, tarfile.open(fileobj=stream, mode="w") as archive:
+            for name, source in ((BUNDLE_WEB_FEATURES, web_features_path), (BUNDLE_WEB_STATUS, web_status_path)):
+                data = source.read_bytes()
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                info.mtime = 0
+                archive.addfile(info, io.BytesIO(data))
+
+
+__all__ = [
+    "BUNDLE_WEB_FEATURES",
+    "BUNDLE_WEB_STATUS",
+    "OfflineSources",
+    "load_bundle",
+    "load_local_sources",
+    "write_bundle",
+]
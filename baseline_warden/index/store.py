@@ -0,0 +1,131 @@
+"""Concurrency-safe writes to a shared cache directory.
+
+Parallel CI jobs often share one ``BASELINE_WARDEN_CACHE_DIR``, so nothing
+here leaves a partially written file where a reader can see it:
+
+- :func:`atomic_write_bytes` writes a temporary file in the target directory,
+  fsyncs it and renames it over the target, keeping the target's mode (or
+  the umask default for new files).
+- :func:`file_lock` holds an advisory ``fcntl`` lock on a sidecar file. It
+  does nothing on platforms without ``fcntl``.
+- :class:`CacheStore` keeps payloads as content-addressed blobs under
+  ``blobs/``. It publishes named entries such as ``web-features.json`` as
+  hard links to those blobs, so every process reads one copy.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+import stat
+import tempfile
+from pathlib import Path
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+BLOBS_DIR = "blobs"
+LOCKS_DIR = "locks"
+
+
+def _file_mode(path: Path) -> int:
+    """Mode for a rewrite of ``path``: keep the existing one, else what ``open()`` would give."""
+
+    try:
+        return stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Replace ``path`` with ``data`` so readers see the old or the new file, never a mix."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temporary = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+            handle.flush()
+            os.fsync(handle.fileno())
+            # mkstemp creates 0600 files; a shared cache must stay readable by other users.
+            if hasattr(os, "fchmod"):
+                os.fchmod(handle.fileno(), _file_mode(path))
+        os.replace(temporary, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(temporary)
+        raise
+
+
+def atomic_write_text(path: Path, text: str, *, encoding: str = "utf-8") -> None:
+    atomic_write_bytes(path, text.encode(encoding))
+
+
+@contextlib.contextmanager
+def file_lock(path: Path, *, shared: bool = False) -> Iterator[None]:
+    """Hold an advisory lock on ``path`` (created if missing) for the ``with`` block."""
+
+    if fcntl is None:  # pragma: no cover - Windows
+        yield
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a+b") as handle:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+class CacheStore:
+    """Named cache entries backed by content-addressed blobs in ``root``."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def path(self, name: str) -> Path:
+        return self.root / name
+
+    def blob_path(self, digest: str) -> Path:
+        return self.root / BLOBS_DIR / digest[:2] / digest
+
+    def lock(self, name: str, *, shared: bool = False) -> contextlib.AbstractContextManager[None]:
+        """Lock one entry, e.g. across a check-fetch-write sequence so only one process downloads."""
+
+        return file_lock(self.root / LOCKS_DIR / f"{name}.lock", shared=shared)
+
+    def put(self, name: str, data: bytes) -> str:
+        """Store ``data`` as a blob, point entry ``name`` at it and return its sha256."""
+
+        digest = hashlib.sha256(data).hexdigest()
+        blob = self.blob_path(digest)
+        target = self.path(name)
+        with self.lock(BLOBS_DIR):
+            if not blob.exists():
+                atomic_write_bytes(blob, data)
+            link = target.with_name(f".{target.name}.{os.getpid()}.link")
+            try:
+                link.unlink(missing_ok=True)
+                os.link(blob, link)
+                os.replace(link, target)
+            except OSError:
+                # No hard links on this filesystem: publish a copy instead.
+                atomic_write_bytes(target, data)
+            self._prune()
+        return digest
+
+    def _prune(self) -> None:
+        # A blob with a single link is no longer published under any entry name.
+        for blob in self.root.glob(f"{BLOBS_DIR}/*/*"):
+            with contextlib.suppress(OSError):
+                if blob.stat().st_nlink == 1:
+                    blob.unlink()
+
+
+__all__ = ["BLOBS_DIR", "LOCKS_DIR", "CacheStore", "atomic_write_bytes", "atomic_write_text", "file_lock"]
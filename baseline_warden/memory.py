@@ -0,0 +1,156 @@
+"""Memory accounting for scans.
+
+Enable with ``bw scan --memory-report``. Each pipeline stage records its
+tracemalloc peak and retained Python heap, and resident set size (RSS) is
+sampled at stage boundaries and every ``RSS_SAMPLE_EVERY`` scanned files.
+Totals are normalised per 10k files and per detection so runs of different
+sizes can be compared against a budget.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional
+
+RSS_SAMPLE_EVERY = 1000
+FILES_UNIT = 10_000
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
+
+
+def current_rss() -> Optional[int]:
+    """Resident set size in bytes, or None where /proc is unavailable."""
+
+    try:
+        with open("/proc/self/statm", "rb") as handle:
+            return int(handle.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def peak_rss() -> Optional[int]:
+    """Process high-water RSS in bytes (``ru_maxrss`` is KiB on Linux, bytes on macOS)."""
+
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+@dataclass
+class StageMemory:
+    peak_bytes: int = 0
+    retained_bytes: int = 0
+    rss_bytes: Optional[int] = None
+    items: int = 0
+
+
+class MemoryTracker:
+    """Per-stage heap and RSS accounting; every method is a no-op when disabled."""
+
+    def __init__(self, *, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self.stages: Dict[str, StageMemory] = {}
+        self.files = 0
+        self.detections = 0
+        self.max_sampled_rss: Optional[int] = None
+        self._owns_tracing = False
+
+    def start(self) -> None:
+        if self.enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracing = True
+
+    def stop(self) -> None:
+        if self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+
+    def _sample_rss(self) -> Optional[int]:
+        rss = current_rss()
+        if rss is not None and (self.max_sampled_rss is None or rss > self.max_sampled_rss):
+            self.max_sampled_rss = rss
+        return rss
+
+    def add_file(self) -> None:
+        if not self.enabled:
+            return
+        self.files += 1
+        if self.files % RSS_SAMPLE_EVERY == 0:
+            self._sample_rss()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageMemory]:
+        """Measure a block; set ``items`` on the yielded record to keep a count."""
+
+        if not self.enabled or not tracemalloc.is_tracing():
+            yield StageMemory()
+            return
+        record = self.stages.setdefault(name, StageMemory())
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        try:
+            yield record
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            record.peak_bytes = max(record.peak_bytes, peak)
+            record.retained_bytes += current - before
+            record.rss_bytes = self._sample_rss()
+
+    @property
+    def peak_bytes(self) -> int:
+        return max((stage.peak_bytes for stage in self.stages.values()), default=0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        files = max(self.files, 1)
+        detections = max(self.detections, 1)
+        retained = sum(stage.retained_bytes for stage in self.stages.values())
+        rss_readings = [value for value in (peak_rss(), self.max_sampled_rss) if value is not None]
+        return {
+            "files": self.files,
+            "detections": self.detections,
+            "peak_heap_bytes": self.peak_bytes,
+            "peak_rss_bytes": max(rss_readings, default=None),
+            "peak_heap_bytes_per_10k_files": round(self.peak_bytes / files * FILES_UNIT),
+            "retained_bytes_per_detection": round(retained / detections, 1),
+            "stages": {
+                name: {
+                    "peak_bytes": stage.peak_bytes,
+                    "retained_bytes": stage.retained_bytes,
+                    "rss_bytes": stage.rss_bytes,
+                    "items": stage.items,
+                }
+                for name, stage in self.stages.items()
+            },
+        }
+
+    def summary_lines(self) -> List[str]:
+        data = self.to_dict()
+        lines = []
+        for name, stage in data["stages"].items():
+            rss = f", rss {_mib(stage['rss_bytes'])}" if stage["rss_bytes"] is not None else ""
+            lines.append(
+                f"{name}: peak heap {_mib(stage['peak_bytes'])}, retained {_mib(stage['retained_bytes'])}{rss}"
+            )
+        peak_rss_bytes = data["peak_rss_bytes"]
+        lines.append(
+            f"peak heap {_mib(data['peak_heap_bytes'])} "
+            f"({_mib(data['peak_heap_bytes_per_10k_files'])} per 10k files, "
+            f"{data['retained_bytes_per_detection']} retained bytes per detection); "
+            f"peak RSS {_mib(peak_rss_bytes) if peak_rss_bytes is not None else 'n/a'}"
+        )
+        return lines
+
+
+def _mib(value: int) -> str:
+    return f"{value / (1024 * 1024):.1f} MiB"
+
+
+__all__ = ["MemoryTracker", "StageMemory", "current_rss", "peak_rss"]
@@ -1,5 +1,5 @@
 """Output adapters for Baseline Warden results.
 
-Planned formats include console tables, JSON reports, GitHub annotations, and
-HTML summaries.
+Formats: console tables, JSON and JSON Lines reports, SARIF, GitHub
+annotations, and a static HTML dashboard.
 """
@@ -1,23 +1,132 @@
-"""GitHub Actions workflow command output."""
+"""GitHub Actions workflow command output.
+
+Annotations are chosen in one streaming pass:
+
+- consecutive findings on the same file and line are collapsed into one
+  annotation whose severity is the highest among them; repeated messages
+  are listed once, in order, with a ``(×N)`` count;
+- a bounded min-heap keeps the best ``limit`` annotations, ranked by
+  severity, then by whether they show a new file + feature pair (so one
+  noisy file cannot crowd out the rest), then by report order;
+- the kept annotations are written in report order through one buffered
+  ``write`` call.
+"""
 
 from __future__ import annotations
 
-from typing import Iterable
+import heapq
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, TextIO, Tuple
 
+from ..detect.intern import ScanStrings
 from ..evaluate.policy import Finding
 
+DEFAULT_ANNOTATION_LIMIT = 50
+SEVERITY_RANK = {"warning": 1, "error": 2}
+_COMMANDS = {1: "::warning", 2: "::error"}
+
+
+def _escape_data(value: str) -> str:
+    return value.replace("%", "%25").replace("\r", "%0D").replace("\n", "%0A")
+
+
+def _escape_property(value: str) -> str:
+    return _escape_data(value).replace(":", "%3A").replace(",", "%2C")
+
+
+@dataclass
+class Annotation:
+    path: Path
+    line: int
+    file: str
+    rank: int = 0
+    novel: bool = False
+    # message -> occurrences, in first-seen order
+    messages: Dict[str, int] = field(default_factory=dict)
+
+    def add(self, message: str) -> None:
+        self.messages[message] = self.messages.get(message, 0) + 1
+
+    def render(self) -> str:
+        location = f"file={_escape_property(self.file)},line={self.line}"
+        text = "; ".join(
+            message if count == 1 else f"{message} (×{count})" for message, count in self.messages.items()
+        )
+        return f"{_COMMANDS[self.rank]} {location}::{_escape_data(text)}\n"
+
+
+def _message(finding: Finding) -> str:
+    if finding.feature:
+        return f"{finding.feature.title}: {finding.message}"
+    return finding.message
+
+
+def select_annotations(
+    findings: Iterable[Finding],
+    *,
+    limit: int = DEFAULT_ANNOTATION_LIMIT,
+    strings: Optional[ScanStrings] = None,
+) -> Tuple[List[Annotation], int]:
+    """Return up to ``limit`` collapsed annotations in report order, and how many there were in total."""
+
+    paths = strings if strings is not None else ScanStrings()
+    heap: List[Tuple[int, bool, int, Annotation]] = []
+    seen: Set[Tuple[Path, str]] = set()
+    total = 0
+    current: Optional[Annotation] = None
+
+    def flush(annotation: Annotation) -> None:
+        nonlocal total
+        # Negated sequence: among equals, the heap root (evicted first) is the latest annotation.
+        entry = (annotation.rank, annotation.novel, -total, annotation)
+        total += 1
+        if len(heap) < limit:
+            heapq.heappush(heap, entry)
+        elif limit and entry[:3] > heap[0][:3]:
+            heapq.heapreplace(heap, entry)
 
-def emit_annotations(findings: Iterable[Finding], *, limit: int = 50) -> None:
-    count = 0
     for finding in findings:
-        if finding.severity == "info":
+        rank = SEVERITY_RANK.get(finding.severity)
+        if rank is None:
             continue
-        command = "::error" if finding.severity == "error" else "::warning"
-        location = f"file={finding.detection.path},line={finding.detection.line}"
-        message = finding.message
-        if finding.feature:
-            message = f"{finding.feature.title}: {message}"
-        print(f"{command} {location}::{message}")
-        count += 1
-        if count >= limit:
-            break
+        detection = finding.detection
+        if current is None or current.line != detection.line or current.path != detection.path:
+            if current is not None:
+                flush(current)
+            current = Annotation(detection.path, detection.line, paths.text(detection.path))
+        pair = (detection.path, finding.feature.feature_id if finding.feature else detection.bcd_key)
+        if pair not in seen:
+            seen.add(pair)
+            current.novel = True
+        current.rank = max(current.rank, rank)
+        current.add(_message(finding))
+    if current is not None:
+        flush(current)
+
+    selected = [entry[3] for entry in sorted(heap, key=lambda entry: -entry[2])]
+    return selected, total
+
+
+def emit_annotations(
+    findings: Iterable[Finding],
+    *,
+    limit: int = DEFAULT_ANNOTATION_LIMIT,
+    stream: Optional[TextIO] = None,
+    strings: Optional[ScanStrings] = None,
+) -> int:
+    """Write up to ``limit`` workflow commands and return how many were written."""
+
+    selected, total = select_annotations(findings, limit=limit, strings=strings)
+    lines = [annotation.render() for annotation in selected]
+    if total > len(selected):
+        lines.append(
+            f"::notice::Baseline Warden annotated {len(selected)} of {total} locations; "
+            "see the report for all findings\n"
+        )
+    (stream or sys.stdout).write("".join(lines))
+    return len(selected)
+
+
+__all__ = ["DEFAULT_ANNOTATION_LIMIT", "Annotation", "emit_annotations", "select_annotations"]
@@ -0,0 +1,364 @@
+"""Static HTML dashboard output.
+
+``write_html`` streams findings into a report directory::
+
+    report-html/
+      index.html              self-contained page (inline CSS and JS)
+      data/index.js           summary, string tables, per-feature and per-file rollups
+      data/findings-00001.js  findings in chunks of ``shard_size`` rows
+
+Shards and the index are JavaScript files that call ``window.bwReport``
+rather than JSON, so the page works when opened from disk (``file://``),
+where browsers block ``fetch``. Each finding is a compact row of integer
+ids into string tables. Rollup groups record which shards hold their
+findings, so a drill-down loads only those shards. The writer holds one
+shard of rows, the string tables and the rollups in memory, never the
+whole report.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..detect.intern import ScanStrings
+from ..evaluate.policy import EvaluationSummary, Finding
+from ..evaluate.rollup import FindingGroup, FindingRollup
+from .json import REPORT_VERSION, summary_record
+
+HTML_REPORT_DIR = Path("report-html")
+DEFAULT_SHARD_SIZE = 5000
+OUTCOME_CODES = {"pass": 0, "warn": 1, "fail": 2}
+# Bits of a row's last column.
+FLAG_ALLOWLISTED = 1
+FLAG_SUPPRESSED = 2
+_SHARD_GLOB = "findings-*.js"
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+class _StringTable:
+    def __init__(self) -> None:
+        self.ids: Dict[str, int] = {}
+
+    def id(self, value: str) -> int:
+        found = self.ids.get(value)
+        if found is None:
+            found = self.ids[value] = len(self.ids)
+        return found
+
+    def values(self) -> List[str]:
+        return list(self.ids)
+
+
+@dataclass
+class HtmlReport:
+    index_path: Path
+    findings: int
+    shards: int
+
+
+class _GroupShards:
+    """Which shards hold findings of each rollup group, in ascending order."""
+
+    def __init__(self) -> None:
+        self.shards: Dict[int, List[int]] = {}
+
+    def add(self, group_id: int, shard: int) -> None:
+        shards = self.shards.setdefault(group_id, [])
+        if not shards or shards[-1] != shard:
+            shards.append(shard)
+
+
+def _group_records(rollup: FindingRollup, ids: Dict[str, int], shards: _GroupShards) -> List[Dict[str, Any]]:
+    records = []
+    for group in rollup.groups:
+        group_id = ids[group.key]
+        records.append(_group_record(group, group_id, shards.shards.get(group_id, [])))
+    return records
+
+
+def _group_record(group: FindingGroup, group_id: int, shards: List[int]) -> Dict[str, Any]:
+    return {
+        "id": group_id,
+        "key": group.key,
+        "title": group.title,
+        "count": group.count,
+        "severity": group.severity,
+        "outcomes": dict(group.outcomes),
+        "statuses": dict(group.statuses),
+        "shards": shards,
+    }
+
+
+def write_html(
+    findings: Iterable[Finding],
+    summary: EvaluationSummary,
+    out_dir: Path = HTML_REPORT_DIR,
+    *,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    generated_at: Optional[str] = None,
+    strings: Optional[ScanStrings] = None,
+) -> HtmlReport:
+    """Write the dashboard to ``out_dir`` and return where it went."""
+
+    paths = strings if strings is not None else ScanStrings()
+    if shard_size < 1:
+        raise ValueError("shard_size must be at least 1")
+    data_dir = out_dir / "data"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    for stale in data_dir.glob(_SHARD_GLOB):
+        stale.unlink()
+
+    files = _StringTable()
+    keys = _StringTable()
+    features = _StringTable()
+    messages = _StringTable()
+    statuses = _StringTable()
+    by_feature = FindingRollup("feature")
+    by_file = FindingRollup("file", strings=paths)
+    feature_shards = _GroupShards()
+    file_shards = _GroupShards()
+    shard_names: List[str] = []
+    rows: List[List[Any]] = []
+    total = 0
+
+    def flush() -> None:
+        name = f"findings-{len(shard_names) + 1:05d}.js"
+        payload = f"window.bwReport.addShard({len(shard_names)},{_dumps(rows)});\n"
+        (data_dir / name).write_text(payload, encoding="utf-8")
+        shard_names.append(name)
+        rows.clear()
+
+    for finding in findings:
+        detection = finding.detection
+        by_feature.add(finding)
+        by_file.add(finding)
+        feature_key = finding.feature.feature_id if finding.feature else detection.bcd_key
+        file_id = files.id(paths.text(detection.path))
+        feature_id = features.id(feature_key)
+        shard = len(shard_names)
+        file_shards.add(file_id, shard)
+        feature_shards.add(feature_id, shard)
+        rows.append(
+            [
+                file_id,
+                detection.line,
+                keys.id(detection.bcd_key),
+                feature_id,
+                OUTCOME_CODES[finding.outcome],
+                statuses.id(finding.status),
+                messages.id(finding.message),
+                (FLAG_ALLOWLISTED if finding.allowlisted else 0) | (FLAG_SUPPRESSED if finding.suppressed else 0),
+            ]
+        )
+        total += 1
+        if len(rows) >= shard_size:
+            flush()
+    if rows:
+        flush()
+
+    index = {
+        "version": REPORT_VERSION,
+        "generated_at": generated_at or datetime.now(UTC).isoformat(),
+        "summary": summary_record(summary),
+        "outcomes": list(OUTCOME_CODES),
+        "files": files.values(),
+        "keys": keys.values(),
+        "statuses": statuses.values(),
+        "messages": messages.values(),
+        "shards": shard_names,
+        "features": _group_records(by_feature, features.ids, feature_shards),
+        "by_file": _group_records(by_file, files.ids, file_shards),
+    }
+    (data_dir / "index.js").write_text(f"window.bwReport.load({_dumps(index)});\n", encoding="utf-8")
+    index_path = out_dir / "index.html"
+    index_path.write_text(_PAGE, encoding="utf-8")
+    return HtmlReport(index_path=index_path, findings=total, shards=len(shard_names))
+
+
+_PAGE = """<!doctype html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Baseline Warden report</title>
+<style>
+  body { font: 14px/1.4 system-ui, sans-serif; margin: 0; color: #1f2328; background: #f6f8fa; }
+  header, main { padding: 12px 24px; }
+  header { background: #fff; border-bottom: 1px solid #d0d7de; }
+  h1 { font-size: 20px; margin: 0 0 4px; }
+  .totals span { display: inline-block; margin-right: 16px; }
+  .fail { color: #cf222e; } .warn { color: #9a6700; } .pass { color: #1a7f37; }
+  nav button { font: inherit; padding: 4px 12px; margin-right: 4px; border: 1px solid #d0d7de; background: #fff; cursor: pointer; }
+  nav button.active { background: #0969da; color: #fff; border-color: #0969da; }
+  input[type=search] { font: inherit; padding: 4px 8px; width: 280px; margin-left: 12px; }
+  table { border-collapse: collapse; width: 100%; background: #fff; margin-top: 8px; }
+  th, td { text-align: left; padding: 4px 8px; border-bottom: 1px solid #eaeef2; vertical-align: top; }
+  th { background: #f6f8fa; position: sticky; top: 0; }
+  tbody tr.group { cursor: pointer; }
+  tbody tr.group:hover { background: #ddf4ff; }
+  td.num { text-align: right; font-variant-numeric: tabular-nums; }
+  code { font-size: 12px; }
+  .pager { margin: 8px 0; }
+  .pager button { font: inherit; margin-right: 8px; }
+  #detail h2 { font-size: 16px; margin: 16px 0 0; }
+</style>
+<script>
+  window.bwReport = {
+    index: null,
+    shards: {},
+    waiting: {},
+    load: function (index) { this.index = index; },
+    addShard: function (id, rows) {
+      this.shards[id] = rows;
+      var callbacks = this.waiting[id] || [];
+      delete this.waiting[id];
+      callbacks.forEach(function (callback) { callback(); });
+    }
+  };
+</script>
+<script src="data/index.js"></script>
+</head>
+<body>
+<header>
+  <h1>Baseline Warden report</h1>
+  <div id="meta"></div>
+  <div class="totals" id="totals"></div>
+</header>
+<main>
+  <nav>
+    <button data-view="features" class="active">Features</button>
+    <button data-view="by_file">Files</button>
+    <input type="search" id="filter" placeholder="Filter">
+  </nav>
+  <div id="groups"></div>
+  <section id="detail"></section>
+</main>
+<script>
+(function () {
+  var report = window.bwReport;
+  var index = report.index;
+  var PAGE = 200;
+  var view = "features";
+
+  function el(tag, attrs, children) {
+    var node = document.createElement(tag);
+    Object.keys(attrs || {}).forEach(function (name) { node.setAttribute(name, attrs[name]); });
+    (children || []).forEach(function (child) {
+      node.appendChild(typeof child === "string" ? document.createTextNode(child) : child);
+    });
+    return node;
+  }
+
+  function pagedTable(container, headers, items, renderRow) {
+    var page = 0;
+    function draw() {
+      container.textContent = "";
+      var pages = Math.max(1, Math.ceil(items.length / PAGE));
+      var prev = el("button", {}, ["Previous"]);
+      var next = el("button", {}, ["Next"]);
+      prev.disabled = page === 0;
+      next.disabled = page >= pages - 1;
+      prev.onclick = function () { page -= 1; draw(); };
+      next.onclick = function () { page += 1; draw(); };
+      container.appendChild(el("div", {"class": "pager"}, [prev, next, "Page " + (page + 1) + " of " + pages + " (" + items.length + " rows)"]));
+      var body = el("tbody");
+      items.slice(page * PAGE, (page + 1) * PAGE).forEach(function (item) { body.appendChild(renderRow(item)); });
+      container.appendChild(el("table", {}, [el("thead", {}, [el("tr", {}, headers.map(function (h) { return el("th", {}, [h]); }))]), body]));
+    }
+    draw();
+  }
+
+  function loadShards(ids, done) {
+    var missing = ids.filter(function (id) { return !report.shards[id]; });
+    var remaining = missing.length;
+    if (!remaining) { done(); return; }
+    missing.forEach(function (id) {
+      var first = !report.waiting[id];
+      (report.waiting[id] = report.waiting[id] || []).push(function () { remaining -= 1; if (!remaining) { done(); } });
+      if (first) { document.head.appendChild(el("script", {src: "data/" + index.shards[id]})); }
+    });
+  }
+
+  function showGroup(group) {
+    var detail = document.getElementById("detail");
+    detail.textContent = "";
+    detail.appendChild(el("h2", {}, [(group.title || group.key) + " (" + group.count + " findings)"]));
+    var holder = el("div", {}, ["Loading..."]);
+    detail.appendChild(holder);
+    var column = view === "features" ? 3 : 0;
+    loadShards(group.shards, function () {
+      var rows = [];
+      group.shards.forEach(function (id) {
+        report.shards[id].forEach(function (row) { if (row[column] === group.id) { rows.push(row); } });
+      });
+      pagedTable(holder, ["Location", "BCD key", "Status", "Outcome", "Message"], rows, function (row) {
+        var outcome = index.outcomes[row[4]];
+        return el("tr", {}, [
+          el("td", {}, [el("code", {}, [index.files[row[0]] + ":" + row[1]])]),
+          el("td", {}, [el("code", {}, [index.keys[row[2]]])]),
+          el("td", {}, [index.statuses[row[5]]]),
+          el("td", {"class": outcome}, [outcome + (row[7] & 2 ? " (suppressed)" : row[7] & 1 ? " (allowlisted)" : "")]),
+          el("td", {}, [index.messages[row[6]]])
+        ]);
+      });
+      detail.scrollIntoView();
+    });
+  }
+
+  function drawGroups() {
+    var needle = document.getElementById("filter").value.toLowerCase();
+    var groups = index[view].filter(function (group) {
+      return !needle || (group.key + " " + (group.title || "")).toLowerCase().indexOf(needle) >= 0;
+    });
+    var label = view === "features" ? "Feature" : "File";
+    pagedTable(document.getElementById("groups"), [label, "Findings", "Fail", "Warn", "Pass", "Statuses"], groups, function (group) {
+      var name = group.title && group.title !== group.key ? group.title + " (" + group.key + ")" : group.key;
+      var statuses = Object.keys(group.statuses).map(function (s) { return s + " " + group.statuses[s]; }).join(", ");
+      var row = el("tr", {"class": "group"}, [
+        el("td", {"class": group.severity === "error" ? "fail" : group.severity === "warning" ? "warn" : ""}, [name]),
+        el("td", {"class": "num"}, [String(group.count)]),
+        el("td", {"class": "num"}, [String(group.outcomes.fail || 0)]),
+        el("td", {"class": "num"}, [String(group.outcomes.warn || 0)]),
+        el("td", {"class": "num"}, [String(group.outcomes.pass || 0)]),
+        el("td", {}, [statuses])
+      ]);
+      row.onclick = function () { showGroup(group); };
+      return row;
+    });
+  }
+
+  var summary = index.summary;
+  document.getElementById("meta").textContent = "Generated " + index.generated_at + " - " + index.files.length + " files";
+  var totals = document.getElementById("totals");
+  totals.appendChild(el("span", {}, ["Findings: " + summary.total]));
+  ["fail", "warn", "pass"].forEach(function (outcome) {
+    totals.appendChild(el("span", {"class": outcome}, [outcome + ": " + (summary.outcomes[outcome] || 0)]));
+  });
+  Object.keys(summary.statuses).forEach(function (status) {
+    totals.appendChild(el("span", {}, [status + ": " + summary.statuses[status]]));
+  });
+  Array.prototype.forEach.call(document.querySelectorAll("nav button"), function (button) {
+    button.onclick = function () {
+      view = button.getAttribute("data-view");
+      Array.prototype.forEach.call(document.querySelectorAll("nav button"), function (b) { b.classList.toggle("active", b === button); });
+      document.getElementById("detail").textContent = "";
+      drawGroups();
+    };
+  });
+  document.getElementById("filter").oninput = drawGroups;
+  drawGroups();
+})();
+</script>
+</body>
+</html>
+"""
+
+
+__all__ = ["DEFAULT_SHARD_SIZE", "HTML_REPORT_DIR", "HtmlReport", "write_html"]
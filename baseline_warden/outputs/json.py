@@ -1,40 +1,246 @@
-"""JSON report output."""
+"""JSON report output.
+
+Reports are streamed: the header is written first, then each finding as it is
+produced, so peak memory does not grow with the size of the serialized report.
+"""
 
 from __future__ import annotations
 
 import json
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Dict, Iterable, Optional, Sequence, TextIO
 
+from ..detect.intern import ScanStrings
 from ..evaluate.policy import EvaluationSummary, Finding
+from ..evaluate.rollup import FindingGroup, FindingRollup
+
+REPORT_VERSION = "1"
+SUMMARY_SIDECAR_SUFFIX = ".summary.json"
+_COMPACT_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
 
+def finding_record(finding: Finding, strings: Optional[ScanStrings] = None) -> Dict[str, Any]:
+    """Return the JSON-serializable record for a single finding.
 
-def write_json(findings: Iterable[Finding], summary: EvaluationSummary, path: Path) -> None:
-    now = datetime.now(UTC).isoformat()
-    data = {
-        "version": "1",
-        "generated_at": now,
-        "summary": {
-            "total": summary.total,
-            "outcomes": summary.outcomes,
-            "statuses": summary.statuses,
+    ``strings`` supplies pre-rendered paths; without it the path is rendered here.
+    """
+
+    path = finding.detection.path
+    record = {
+        "file": strings.text(path) if strings is not None else str(path),
+        "line": finding.detection.line,
+        "bcd_key": finding.detection.bcd_key,
+        "status": finding.status,
+        "severity": finding.severity,
+        "message": finding.message,
+        "feature": {
+            "id": finding.feature.feature_id if finding.feature else None,
+            "title": finding.feature.title if finding.feature else None,
         },
-        "findings": [
-            {
-                "file": str(finding.detection.path),
-                "line": finding.detection.line,
-                "bcd_key": finding.detection.bcd_key,
-                "status": finding.status,
-                "severity": finding.severity,
-                "message": finding.message,
-                "feature": {
-                    "id": finding.feature.feature_id if finding.feature else None,
-                    "title": finding.feature.title if finding.feature else None,
-                },
-                "allowlisted": finding.allowlisted,
-            }
-            for finding in findings
-        ],
+        "allowlisted": finding.allowlisted,
+        "suppressed": finding.suppressed,
+    }
+    if finding.baseline is not None:
+        record["baseline"] = finding.baseline
+    return record
+
+
+def summary_record(summary: EvaluationSummary) -> Dict[str, Any]:
+    return {
+        "total": summary.total,
+        "outcomes": summary.outcomes,
+        "statuses": summary.statuses,
+    }
+
+
+def _group_record(group: FindingGroup, strings: ScanStrings) -> Dict[str, Any]:
+    return {
+        "key": group.key,
+        "title": group.title,
+        "count": group.count,
+        "severity": group.severity,
+        "outcomes": group.outcomes,
+        "statuses": group.statuses,
+        "samples": [{"file": strings.text(sample_path), "line": line} for sample_path, line in group.samples],
     }
+
+
+class JsonReportWriter:
+    """Incrementally write a JSON report object to an open text stream.
+
+    Output matches ``json.dumps(report, indent=indent)`` for the same key order,
+    so streamed reports are byte-identical to fully materialized ones. Call
+    :meth:`write_finding` as findings are produced; the ``findings`` array is
+    opened lazily and closed by the next :meth:`write_field` or :meth:`close`.
+    """
+
+    def __init__(self, stream: TextIO, *, indent: Optional[int] = 2, strings: Optional[ScanStrings] = None) -> None:
+        self._stream = stream
+        self._strings = strings if strings is not None else ScanStrings()
+        self._indent = indent
+        self._encoder = json.JSONEncoder(indent=indent)
+        if indent is None:
+            self._newline = ""
+            self._pad = ""
+            self._item_sep = ", "
+        else:
+            self._newline = "\n"
+            self._pad = " " * indent
+            self._item_sep = ","
+        self._fields = 0
+        self._findings_open = False
+        self._findings_written = 0
+        self._stream.write("{")
+
+    def _dumps(self, value: Any, depth: int) -> str:
+        text = self._encoder.encode(value)
+        if self._indent is None:
+            return text
+        return text.replace("\n", "\n" + self._pad * depth)
+
+    def _begin_field(self, key: str) -> None:
+        self._close_findings()
+        if self._fields:
+            self._stream.write(self._item_sep)
+        self._stream.write(f"{self._newline}{self._pad}{json.dumps(key)}: ")
+        self._fields += 1
+
+    def write_field(self, key: str, value: Any) -> None:
+        self._begin_field(key)
+        self._stream.write(self._dumps(value, 1))
+
+    def write_header(self, *, generated_at: Optional[str] = None) -> None:
+        self.write_field("version", REPORT_VERSION)
+        self.write_field("generated_at", generated_at or datetime.now(UTC).isoformat())
+
+    def write_finding(self, finding: Finding) -> None:
+        if not self._findings_open:
+            self._begin_field("findings")
+            self._stream.write("[")
+            self._findings_open = True
+        if self._findings_written:
+            self._stream.write(self._item_sep)
+        self._stream.write(f"{self._newline}{self._pad * 2}{self._dumps(finding_record(finding, self._strings), 2)}")
+        self._findings_written += 1
+
+    def write_findings(self, findings: Iterable[Finding]) -> int:
+        """Write the ``findings`` array, returning the number of findings written."""
+
+        if not self._findings_open:
+            self._begin_field("findings")
+            self._stream.write("[")
+            self._findings_open = True
+        for finding in findings:
+            self.write_finding(finding)
+        written = self._findings_written
+        self._close_findings()
+        return written
+
+    def _close_findings(self) -> None:
+        if not self._findings_open:
+            return
+        if self._findings_written:
+            self._stream.write(f"{self._newline}{self._pad}")
+        self._stream.write("]")
+        self._findings_open = False
+
+    def close(self) -> None:
+        self._close_findings()
+        if self._fields:
+            self._stream.write(self._newline)
+        self._stream.write("}")
+
+
+def write_json(
+    findings: Iterable[Finding],
+    summary: EvaluationSummary,
+    path: Path,
+    *,
+    rollup: Optional[FindingRollup] = None,
+    resolved: Optional[Sequence[Dict[str, Any]]] = None,
+    baseline: Optional[Dict[str, Any]] = None,
+    indent: Optional[int] = 2,
+    strings: Optional[ScanStrings] = None,
+) -> None:
+    strings = strings if strings is not None else ScanStrings()
+    with path.open("w", encoding="utf-8") as fh:
+        writer = JsonReportWriter(fh, indent=indent, strings=strings)
+        writer.write_header()
+        writer.write_field("summary", summary_record(summary))
+        writer.write_findings(findings)
+        if rollup is not None:
+            writer.write_field("group_by", rollup.group_by)
+            writer.write_field("groups", [_group_record(group, strings) for group in rollup.groups])
+        if baseline is not None:
+            writer.write_field("baseline", baseline)
+        if resolved is not None:
+            writer.write_field("resolved", list(resolved))
+        writer.close()
+
+
+def summary_sidecar_path(path: Path) -> Path:
+    """Return the sidecar summary path for a streamed report (``report.summary.json``)."""
+
+    return path.with_name(path.stem + SUMMARY_SIDECAR_SUFFIX)
+
+
+def write_summary_sidecar(
+    summary: EvaluationSummary,
+    path: Path,
+    *,
+    rollup: Optional[FindingRollup] = None,
+    resolved: Optional[Sequence[Dict[str, Any]]] = None,
+    baseline: Optional[Dict[str, Any]] = None,
+    strings: Optional[ScanStrings] = None,
+) -> None:
+    data: Dict[str, Any] = {
+        "version": REPORT_VERSION,
+        "generated_at": datetime.now(UTC).isoformat(),
+        "summary": summary_record(summary),
+    }
+    if rollup is not None:
+        data["group_by"] = rollup.group_by
+        data["groups"] = [_group_record(group, strings or ScanStrings()) for group in rollup.groups]
+    if baseline is not None:
+        data["baseline"] = baseline
+    if resolved is not None:
+        data["resolved"] = list(resolved)
     path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+def write_jsonl(
+    findings: Iterable[Finding],
+    summary: EvaluationSummary,
+    path: Path,
+    *,
+    rollup: Optional[FindingRollup] = None,
+    resolved: Optional[Sequence[Dict[str, Any]]] = None,
+    baseline: Optional[Dict[str, Any]] = None,
+    summary_path: Optional[Path] = None,
+    strings: Optional[ScanStrings] = None,
+) -> Path:
+    """Write one compact finding record per line, with the summary in a sidecar.
+
+    Returns the path of the summary sidecar.
+    """
+
+    strings = strings if strings is not None else ScanStrings()
+    with path.open("w", encoding="utf-8") as fh:
+        for finding in findings:
+            fh.write(_COMPACT_ENCODER.encode(finding_record(finding, strings)))
+            fh.write("\n")
+    sidecar = summary_path or summary_sidecar_path(path)
+    write_summary_sidecar(summary, sidecar, rollup=rollup, resolved=resolved, baseline=baseline, strings=strings)
+    return sidecar
+
+
+__all__ = [
+    "JsonReportWriter",
+    "finding_record",
+    "summary_record",
+    "summary_sidecar_path",
+    "write_json",
+    "write_jsonl",
+    "write_summary_sidecar",
+]
@@ -0,0 +1,134 @@
+"""SARIF 2.1.0 output for code-scanning dashboards.
+
+Results are streamed to disk as they are produced. Each feature becomes a rule
+exactly once; results reference rules by ``ruleIndex``. Because the rule table
+is only complete after the last result, ``tool`` is written after ``results``
+inside the run object (JSON object member order is not significant).
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from .. import __version__
+from ..detect.intern import ScanStrings
+from ..evaluate.fingerprint import FINGERPRINT_VERSION, OccurrenceTracker, fingerprint
+from ..evaluate.policy import EvaluationSummary, Finding
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+SARIF_VERSION = "2.1.0"
+TOOL_NAME = "baseline-warden"
+TOOL_URI = "https://github.com/Mockapapella/baseline-warden"
+FEATURE_URI = "https://webstatus.dev/features/{feature_id}"
+UNMAPPED_RULE_ID = "unmapped"
+LEVEL_BY_SEVERITY = {"error": "error", "warning": "warning", "info": "note"}
+_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+class _RuleTable:
+    """Assign each feature a rule index on first sight."""
+
+    def __init__(self) -> None:
+        self._index: Dict[str, int] = {}
+        self.rules: List[Dict[str, Any]] = []
+
+    def index_for(self, finding: Finding) -> tuple[str, int]:
+        feature = finding.feature
+        rule_id = feature.feature_id if feature else UNMAPPED_RULE_ID
+        index = self._index.get(rule_id)
+        if index is None:
+            index = len(self.rules)
+            self._index[rule_id] = index
+            self.rules.append(_rule(finding))
+        return rule_id, index
+
+
+def _rule(finding: Finding) -> Dict[str, Any]:
+    feature = finding.feature
+    if feature is None:
+        return {
+            "id": UNMAPPED_RULE_ID,
+            "name": "Unmapped feature",
+            "shortDescription": {"text": "Detected token could not be mapped to Baseline data"},
+        }
+    title = feature.title or feature.feature_id
+    return {
+        "id": feature.feature_id,
+        "name": title,
+        "shortDescription": {"text": title},
+        "helpUri": FEATURE_URI.format(feature_id=feature.feature_id),
+        "properties": {"baselineStatus": feature.status or "unknown"},
+    }
+
+
+def write_sarif(
+    findings: Iterable[Finding],
+    summary: EvaluationSummary,
+    path: Path,
+    *,
+    include_passing: bool = False,
+    strings: Optional[ScanStrings] = None,
+) -> int:
+    """Stream findings to a SARIF log at ``path``, returning the result count.
+
+    Passing findings are skipped unless ``include_passing`` is set.
+    """
+
+    rules = _RuleTable()
+    occurrences = OccurrenceTracker(strings if strings is not None else ScanStrings())
+    written = 0
+
+    with path.open("w", encoding="utf-8") as fh:
+        fh.write(f'{{"$schema":"{SARIF_SCHEMA}","version":"{SARIF_VERSION}","runs":[{{"results":[')
+        for finding in findings:
+            detection = finding.detection
+            # Track every occurrence so fingerprints do not depend on which findings pass.
+            key = occurrences.key(detection.path, detection.bcd_key)
+            if finding.outcome == "pass" and not include_passing:
+                continue
+            rule_id, rule_index = rules.index_for(finding)
+            result = {
+                "ruleId": rule_id,
+                "ruleIndex": rule_index,
+                "level": LEVEL_BY_SEVERITY[finding.severity],
+                "message": {"text": f"{detection.bcd_key}: {finding.message}"},
+                "locations": [
+                    {
+                        "physicalLocation": {
+                            "artifactLocation": {"uri": key[0]},
+                            "region": {"startLine": max(detection.line, 1)},
+                        }
+                    }
+                ],
+                "partialFingerprints": {FINGERPRINT_VERSION: fingerprint(key)},
+                "properties": {"bcdKey": detection.bcd_key, "baselineStatus": finding.status},
+            }
+            if finding.baseline is not None:
+                result["baselineState"] = finding.baseline
+            if written:
+                fh.write(",")
+            fh.write(_ENCODER.encode(result))
+            written += 1
+
+        tool = {
+            "driver": {
+                "name": TOOL_NAME,
+                "version": __version__,
+                "informationUri": TOOL_URI,
+                "rules": rules.rules,
+            }
+        }
+        properties = {
+            "summary": {
+                "total": summary.total,
+                "outcomes": summary.outcomes,
+                "statuses": summary.statuses,
+            }
+        }
+        fh.write(f'],"tool":{_ENCODER.encode(tool)},"properties":{_ENCODER.encode(properties)}}}]}}')
+    return written
+
+
+__all__ = ["write_sarif"]
@@ -3,14 +3,17 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Optional
 
 from rich.console import Console
 from rich.table import Table
 
 from ..evaluate.policy import EvaluationSummary, Finding
+from ..evaluate.rollup import FindingRollup
 
 SEVERITY_EMOJI = {"error": "❌", "warning": "⚠️", "info": "✅"}
+GROUP_LABELS = {"feature": "Feature", "file": "File", "bcd-key": "BCD Key"}
+ROLLUP_ROW_LIMIT = 100
 
 
 def render_console(
@@ -19,9 +22,12 @@ def render_console(
     *,
     root: Path,
     summary_only: bool = False,
+    rollup: Optional[FindingRollup] = None,
 ) -> None:
     console = Console()
-    if not summary_only:
+    if not summary_only and rollup is not None:
+        _render_rollup(console, rollup)
+    elif not summary_only:
         table = Table(show_header=True, header_style="bold")
         table.add_column("Severity", justify="center")
         table.add_column("Status")
@@ -32,7 +38,9 @@ def render_console(
 
         for finding in findings:
             location = f"{finding.detection.path}:{finding.detection.line}"
-            if finding.severity == "info" and finding.allowlisted:
+            if finding.suppressed:
+                message = f"{finding.message} (suppressed)"
+            elif finding.severity == "info" and finding.allowlisted:
                 message = f"{finding.message} (allowlisted)"
             else:
                 message = finding.message
@@ -55,3 +63,30 @@ def render_console(
         f"Statuses: widely={summary.statuses.get('widely', 0)}, newly={summary.statuses.get('newly', 0)}, "
         f"limited={summary.statuses.get('limited', 0)}, unknown={summary.statuses.get('unknown', 0)}"
     )
+
+
+def _render_rollup(console: Console, rollup: FindingRollup, *, limit: int = ROLLUP_ROW_LIMIT) -> None:
+    table = Table(show_header=True, header_style="bold")
+    table.add_column("Severity", justify="center")
+    table.add_column(GROUP_LABELS[rollup.group_by])
+    table.add_column("Count", justify="right")
+    table.add_column("Fail/Warn/Pass", justify="right")
+    table.add_column("Sample locations")
+
+    groups = rollup.groups
+    for group in groups[:limit]:
+        label = f"{group.key} ({group.title})" if group.title and group.title != group.key else group.key
+        outcomes = f"{group.outcomes.get('fail', 0)}/{group.outcomes.get('warn', 0)}/{group.outcomes.get('pass', 0)}"
+        samples = ", ".join(f"{path}:{line}" for path, line in group.samples)
+        if group.count > len(group.samples):
+            samples = f"{samples}, …"
+        table.add_row(
+            SEVERITY_EMOJI.get(group.severity, ""),
+            label,
+            str(group.count),
+            outcomes,
+            samples,
+        )
+    console.print(table)
+    if len(groups) > limit:
+        console.print(f"… {len(groups) - limit} more group(s) not shown")
@@ -0,0 +1,146 @@
+"""Per-stage timing instrumentation for scans.
+
+Enable with ``bw scan --profile`` or by setting ``BW_TRACE=1``. The profiler
+records wall time, call counts, and item counts per stage plus per-file parse
+times, and writes them as a JSON timing report.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+TRACE_ENV_VAR = "BW_TRACE"
+DEFAULT_TOP_FILES = 10
+
+T = TypeVar("T")
+
+
+def trace_enabled() -> bool:
+    """Return True when ``BW_TRACE`` requests profiling."""
+
+    value = os.environ.get(TRACE_ENV_VAR, "").strip().lower()
+    return value not in {"", "0", "false", "no", "off"}
+
+
+@dataclass
+class StageTiming:
+    seconds: float = 0.0
+    calls: int = 0
+    items: int = 0
+
+
+@dataclass
+class FileTiming:
+    path: str
+    detector: str
+    seconds: float
+    detections: int
+
+
+class ScanProfiler:
+    """Collect per-stage and per-file timings; every method is a no-op when disabled."""
+
+    def __init__(self, *, enabled: bool = True, top_files: int = DEFAULT_TOP_FILES) -> None:
+        self.enabled = enabled
+        self.top_files = top_files
+        self.stages: Dict[str, StageTiming] = {}
+        self.files: List[FileTiming] = []
+        self._started = time.perf_counter()
+
+    def _timing(self, name: str) -> StageTiming:
+        timing = self.stages.get(name)
+        if timing is None:
+            timing = self.stages[name] = StageTiming()
+        return timing
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageTiming]:
+        """Time a block; set ``items`` on the yielded timing to record a count."""
+
+        if not self.enabled:
+            yield StageTiming()
+            return
+        timing = self._timing(name)
+        start = time.perf_counter()
+        try:
+            yield timing
+        finally:
+            timing.seconds += time.perf_counter() - start
+            timing.calls += 1
+
+    def add(self, name: str, seconds: float, *, items: int = 0) -> None:
+        if not self.enabled:
+            return
+        timing = self._timing(name)
+        timing.seconds += seconds
+        timing.calls += 1
+        timing.items += items
+
+    def iterate(self, name: str, iterable: Iterable[T]) -> Iterator[T]:
+        """Yield from ``iterable``, charging only the time spent producing items."""
+
+        if not self.enabled:
+            yield from iterable
+            return
+        timing = self._timing(name)
+        timing.calls += 1
+        iterator = iter(iterable)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                timing.seconds += time.perf_counter() - start
+                return
+            timing.seconds += time.perf_counter() - start
+            timing.items += 1
+            yield item
+
+    def record_file(self, path: Path, detector: str, seconds: float, detections: int) -> None:
+        if not self.enabled:
+            return
+        self.files.append(FileTiming(path=path.as_posix(), detector=detector, seconds=seconds, detections=detections))
+        self.add(detector, seconds, items=detections)
+
+    def slowest_files(self, n: Optional[int] = None) -> List[FileTiming]:
+        return heapq.nlargest(n or self.top_files, self.files, key=lambda item: item.seconds)
+
+    def to_dict(self) -> Dict[str, Any]:
+        def _file(entry: FileTiming) -> Dict[str, Any]:
+            return {
+                "path": entry.path,
+                "detector": entry.detector,
+                "seconds": round(entry.seconds, 6),
+                "detections": entry.detections,
+            }
+
+        return {
+            "version": "1",
+            "wall_seconds": round(time.perf_counter() - self._started, 6),
+            "stages": {
+                name: {"seconds": round(timing.seconds, 6), "calls": timing.calls, "items": timing.items}
+                for name, timing in self.stages.items()
+            },
+            "slowest_files": [_file(entry) for entry in self.slowest_files()],
+            "files": [_file(entry) for entry in self.files],
+        }
+
+    def write(self, path: Path) -> None:
+        path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+
+    def summary_lines(self) -> List[str]:
+        lines = []
+        ordered: List[Tuple[str, StageTiming]] = sorted(self.stages.items(), key=lambda item: -item[1].seconds)
+        for name, timing in ordered:
+            lines.append(f"{name}: {timing.seconds:.3f}s ({timing.calls} call(s), {timing.items} item(s))")
+        return lines
+
+
+__all__ = ["DEFAULT_TOP_FILES", "FileTiming", "ScanProfiler", "StageTiming", "TRACE_ENV_VAR", "trace_enabled"]
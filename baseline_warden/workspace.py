@@ -0,0 +1,183 @@
+"""Monorepo workspace mode: nested configs scoped to their directories.
+
+A ``baseline-warden.toml`` inside a subdirectory overrides its parent's
+settings for every file below it. Tables merge key by key; lists and scalar
+values in the nested file replace the parent's. The tree is walked once with
+the root config and each file's detections are evaluated under the config of
+its nearest ancestor directory.
+"""
+
+from __future__ import annotations
+
+import tomllib
+from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .config import BaselineWardenConfig
+from .detect.common import Detection, is_ignored
+from .detect.suppress import SuppressionIndex
+from .evaluate.policy import (
+    CompiledPolicy,
+    EvaluationSummary,
+    Finding,
+    compile_policy,
+    evaluate_detections,
+    summarize_findings,
+)
+from .evaluate.resolve import BaselineIndex
+
+CONFIG_FILENAME = "baseline-warden.toml"
+ROOT_DIRECTORY = Path(".")
+
+
+@dataclass
+class ConfigScope:
+    """Effective config for a directory and the directory that defines it."""
+
+    directory: Path
+    config: BaselineWardenConfig
+    data: Dict[str, Any] = field(repr=False)
+    parent: Optional["ConfigScope"] = field(default=None, repr=False)
+    # Globs this scope's own file declares; merged configs also carry inherited ones.
+    ignore_globs: List[str] = field(default_factory=list)
+
+    @cached_property
+    def policy(self) -> CompiledPolicy:
+        return compile_policy(self.config)
+
+
+def merge_config_data(parent: Dict[str, Any], child: Dict[str, Any]) -> Dict[str, Any]:
+    """Deep-merge TOML tables; non-table values in ``child`` replace the parent's."""
+
+    merged = dict(parent)
+    for key, value in child.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = merge_config_data(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+class ConfigResolver:
+    """Resolve and cache the effective config for each directory under ``root``."""
+
+    def __init__(self, root: Path, root_config: BaselineWardenConfig, *, filename: str = CONFIG_FILENAME) -> None:
+        self._root = root
+        self._filename = filename
+        root_scope = ConfigScope(
+            directory=ROOT_DIRECTORY,
+            config=root_config,
+            data=root_config.model_dump(mode="json"),
+        )
+        self._scopes: Dict[Path, ConfigScope] = {ROOT_DIRECTORY: root_scope}
+
+    @property
+    def root_scope(self) -> ConfigScope:
+        return self._scopes[ROOT_DIRECTORY]
+
+    def for_directory(self, directory: Path) -> ConfigScope:
+        """Return the scope for ``directory`` (relative to root), resolving ancestors once."""
+
+        scope = self._scopes.get(directory)
+        if scope is not None:
+            return scope
+        if directory.is_absolute() or directory.parent == directory:
+            # Files outside the workspace root fall back to the root config.
+            return self.root_scope
+        parent = self.for_directory(directory.parent)
+        config_path = self._root / directory / self._filename
+        if config_path.is_file():
+            own = tomllib.loads(config_path.read_text())
+            data = merge_config_data(parent.data, own)
+            scope = ConfigScope(
+                directory=directory,
+                config=BaselineWardenConfig.model_validate(data),
+                data=data,
+                parent=parent,
+                ignore_globs=list(own.get("ignore", {}).get("globs", [])),
+            )
+        else:
+            scope = parent
+        self._scopes[directory] = scope
+        return scope
+
+    def for_file(self, relative_path: Path) -> ConfigScope:
+        return self.for_directory(relative_path.parent)
+
+    @property
+    def scopes(self) -> List[ConfigScope]:
+        """Distinct scopes resolved so far, root first."""
+
+        unique: Dict[int, ConfigScope] = {}
+        for scope in self._scopes.values():
+            unique.setdefault(id(scope), scope)
+        return sorted(unique.values(), key=lambda scope: (len(scope.directory.parts), str(scope.directory)))
+
+
+def _scope_ignores(scope: ConfigScope, relative_path: Path) -> bool:
+    """Match each nested file's own ignore globs relative to its directory.
+
+    The root scope has no parent; the traversal already applied its globs.
+    """
+
+    current: Optional[ConfigScope] = scope
+    while current is not None and current.parent is not None:
+        if current.ignore_globs and is_ignored(relative_path.relative_to(current.directory), current.ignore_globs):
+            return True
+        current = current.parent
+    return False
+
+
+def _runs_by_scope(
+    resolver: ConfigResolver,
+    detections: Iterable[Detection],
+) -> Iterable[Tuple[ConfigScope, List[Detection]]]:
+    """Yield consecutive runs of detections that share a scope, in input order."""
+
+    current: ConfigScope | None = None
+    run: List[Detection] = []
+    ignored: Dict[Path, bool] = {}
+    for detection in detections:
+        scope = resolver.for_file(detection.path)
+        skip = ignored.get(detection.path)
+        if skip is None:
+            skip = ignored[detection.path] = _scope_ignores(scope, detection.path)
+        if skip:
+            continue
+        if scope is not current and run:
+            yield current, run  # type: ignore[misc]
+            run = []
+        current = scope
+        run.append(detection)
+    if run and current is not None:
+        yield current, run
+
+
+def evaluate_workspace(
+    root: Path,
+    index: BaselineIndex,
+    detections: Iterable[Detection],
+    root_config: BaselineWardenConfig,
+    *,
+    resolver: ConfigResolver | None = None,
+    suppressions: Mapping[Path, SuppressionIndex] | None = None,
+) -> tuple[List[Finding], EvaluationSummary]:
+    """Evaluate detections under the config of each file's nearest ancestor directory."""
+
+    resolver = resolver or ConfigResolver(root, root_config)
+    findings: List[Finding] = []
+    for scope, run in _runs_by_scope(resolver, detections):
+        scoped_findings, _ = evaluate_detections(index, run, scope.policy, suppressions=suppressions)
+        findings.extend(scoped_findings)
+    return findings, summarize_findings(findings)
+
+
+__all__ = [
+    "CONFIG_FILENAME",
+    "ConfigResolver",
+    "ConfigScope",
+    "evaluate_workspace",
+    "merge_config_data",
+]
@@ -0,0 +1,156 @@
+"""Deterministic synthetic web repositories for benchmarks.
+
+``generate_corpus`` writes HTML, Jinja and CSS files under ``templates/`` and
+``static/`` using a seeded RNG, so the same arguments always produce the same
+bytes. ``corpus_lock`` builds a matching lock that maps most (not all) of the
+generated BCD keys, leaving some detections unmapped as in real projects.
+Pass ``LOCK_VALUE_KEYS`` along with the detected keys so the lock also maps
+attribute values and global attributes.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, List
+
+from baseline_warden.index.cache import BaselineLock, LockFeature
+
+HTML_ELEMENTS = [
+    ("div", ""),
+    ("section", ""),
+    ("article", ""),
+    ("dialog", " open"),
+    ("details", " open"),
+    ("picture", ""),
+    ("template", ""),
+    ("search", ""),
+    ("img", ' loading="lazy" decoding="async"'),
+    ("input", ' type="date"'),
+    ("input", ' type="color"'),
+    ("button", ' popovertarget="menu"'),
+    ("div", ' popover="auto"'),
+    ("video", ' playsinline controls'),
+    ("a", ' href="#" referrerpolicy="no-referrer"'),
+]
+CSS_DECLARATIONS = [
+    "display: grid",
+    "display: flex",
+    "position: sticky",
+    "gap: 1rem",
+    "aspect-ratio: 16 / 9",
+    "container-type: inline-size",
+    "inset: 0",
+    "accent-color: rebeccapurple",
+    "text-wrap: balance",
+    "color: color-mix(in srgb, red 50%, blue)",
+    "scroll-behavior: smooth",
+    "backdrop-filter: blur(4px)",
+    "overscroll-behavior: contain",
+    "margin-inline: auto",
+]
+CSS_SELECTORS = [".card", ".nav > li", ".form:has(input:invalid)", ":is(h1, h2)", ".item:where(.active)", "a:focus-visible"]
+CSS_AT_RULES = ["@media (min-width: 40em)", "@supports (display: grid)", "@container (min-width: 30em)", "@layer base"]
+STATUSES = ("widely", "newly", "limited")
+# Value and global attribute keys that real locks map for the markup above. A
+# scan only emits them with an HtmlKeyTable built from a lock that has them.
+LOCK_VALUE_KEYS = (
+    "html.elements.input.type_color",
+    "html.elements.input.type_date",
+    "html.global_attributes.popover",
+)
+
+
+@dataclass
+class CorpusStats:
+    root: Path = Path()
+    files: int = 0
+    bytes: int = 0
+    paths: List[Path] = field(default_factory=list)
+
+
+def _html_document(rng: random.Random, blocks: int, *, jinja: bool) -> str:
+    lines = ["<!doctype html>", "<html lang=\"en\">", "<head><title>Synthetic</title></head>", "<body>"]
+    if jinja:
+        lines.insert(0, '{% extends "base.html" %}')
+        lines.append("{% block content %}")
+    for index in range(blocks):
+        tag, attributes = rng.choice(HTML_ELEMENTS)
+        text = f"Item {index}"
+        if jinja and index % 3 == 0:
+            text = "{{ item.title|e }}"
+        if jinja and index % 7 == 0:
+            lines.append("{% for item in items %}")
+        if tag in {"img", "input"}:
+            lines.append(f"  <{tag}{attributes}>")
+        else:
+            lines.append(f'  <{tag} class="c{index % 11}"{attributes}>{text}</{tag}>')
+        if jinja and index % 7 == 0:
+            lines.append("{% endfor %}")
+    if jinja:
+        lines.append("{% endblock %}")
+    lines.extend(["</body>", "</html>", ""])
+    return "\n".join(lines)
+
+
+def _css_stylesheet(rng: random.Random, rules: int) -> str:
+    lines: List[str] = []
+    for index in range(rules):
+        selector = rng.choice(CSS_SELECTORS)
+        declarations = rng.sample(CSS_DECLARATIONS, k=3)
+        body = "\n".join(f"  {declaration};" for declaration in declarations)
+        if index % 5 == 0:
+            at_rule = rng.choice(CSS_AT_RULES)
+            lines.append(f"{at_rule} {{\n{selector} {{\n{body}\n}}\n}}")
+        else:
+            lines.append(f"{selector} {{\n{body}\n}}")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def generate_corpus(root: Path, *, files: int = 300, size: int = 40, seed: int = 0) -> CorpusStats:
+    """Write ``files`` files (HTML, Jinja and CSS in equal parts) of ``size`` blocks or rules each."""
+
+    rng = random.Random(seed)
+    stats = CorpusStats(root=root)
+    for index in range(files):
+        kind = index % 3
+        if kind == 0:
+            path = root / "templates" / f"page{index // 30}" / f"page{index}.html"
+            text = _html_document(rng, size, jinja=False)
+        elif kind == 1:
+            path = root / "templates" / f"page{index // 30}" / f"page{index}.jinja"
+            text = _html_document(rng, size, jinja=True)
+        else:
+            path = root / "static" / "css" / f"sheet{index // 30}" / f"sheet{index}.css"
+            text = _css_stylesheet(rng, size)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = text.encode("utf-8")
+        path.write_bytes(data)
+        stats.files += 1
+        stats.bytes += len(data)
+        stats.paths.append(path)
+    return stats
+
+
+def corpus_lock(bcd_keys: Iterable[str], *, unmapped_every: int = 5) -> BaselineLock:
+    """One feature per key, cycling statuses; every ``unmapped_every``-th key is left out."""
+
+    features = []
+    for index, key in enumerate(sorted(set(bcd_keys))):
+        if unmapped_every and index % unmapped_every == unmapped_every - 1:
+            continue
+        features.append(
+            LockFeature(
+                feature_id=f"feature-{index}",
+                title=key,
+                status=STATUSES[index % len(STATUSES)],
+                low_date="2023-01-01",
+                bcd_keys=[key],
+            )
+        )
+    return BaselineLock(features=features)
+
+
+__all__ = ["LOCK_VALUE_KEYS", "CorpusStats", "corpus_lock", "generate_corpus"]
@@ -0,0 +1,99 @@
+"""Benchmark the JSON report writers on a large synthetic findings list.
+
+Usage::
+
+    uv run python benchmarks/json_report.py --findings 1000000
+
+Compares the streaming ``write_json``/``write_jsonl`` writers with the previous
+materialize-then-``json.dumps`` approach and prints wall time plus peak Python
+heap allocated during each write (via ``tracemalloc``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+from typing import Callable, List
+
+from baseline_warden.detect.common import Detection
+from baseline_warden.evaluate.policy import EvaluationSummary, Finding
+from baseline_warden.index.cache import LockFeature
+from baseline_warden.outputs.json import finding_record, summary_record, write_json, write_jsonl
+
+
+def make_findings(count: int) -> tuple[List[Finding], EvaluationSummary]:
+    features = [
+        LockFeature(feature_id=f"feature-{i}", title=f"Feature {i}", status=status, bcd_keys=[f"css.properties.p{i}"])
+        for i, status in enumerate(["widely", "newly", "limited"] * 10)
+    ]
+    findings: List[Finding] = []
+    for i in range(count):
+        feature = features[i % len(features)]
+        outcome = "fail" if feature.status == "limited" else "pass"
+        findings.append(
+            Finding(
+                detection=Detection(path=Path(f"static/css/file{i // 50}.css"), line=i % 50 + 1, bcd_key=feature.bcd_keys[0]),
+                feature=feature,
+                status=feature.status or "unknown",
+                outcome=outcome,
+                severity="error" if outcome == "fail" else "info",
+                message="Feature baseline status is limited" if outcome == "fail" else "Feature is widely available",
+            )
+        )
+    summary = EvaluationSummary(
+        total=count,
+        outcomes=Counter(finding.outcome for finding in findings),
+        statuses=Counter(finding.status for finding in findings),
+    )
+    return findings, summary
+
+
+def legacy_write_json(findings: List[Finding], summary: EvaluationSummary, path: Path) -> None:
+    data = {
+        "version": "1",
+        "generated_at": "1970-01-01T00:00:00+00:00",
+        "summary": summary_record(summary),
+        "findings": [finding_record(finding) for finding in findings],
+    }
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+def measure(label: str, func: Callable[[], None], *, trace: bool) -> None:
+    if trace:
+        tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    peak = 0
+    if trace:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    peak_text = f"{peak / 1024 / 1024:8.1f} MiB peak" if trace else "   (untraced)"
+    print(f"{label:<22} {elapsed:8.2f}s {peak_text}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--findings", type=int, default=1_000_000)
+    parser.add_argument("--no-trace", action="store_true", help="Skip tracemalloc (faster, timings only).")
+    args = parser.parse_args()
+
+    findings, summary = make_findings(args.findings)
+    trace = not args.no_trace
+    print(f"{args.findings} findings")
+    with tempfile.TemporaryDirectory() as tmp:
+        out = Path(tmp)
+        measure("legacy json.dumps", lambda: legacy_write_json(findings, summary, out / "legacy.json"), trace=trace)
+        measure("streaming json", lambda: write_json(findings, summary, out / "report.json"), trace=trace)
+        measure("streaming jsonl", lambda: write_jsonl(findings, summary, out / "report.jsonl"), trace=trace)
+        for name in ("legacy.json", "report.json", "report.jsonl"):
+            print(f"{name:<22} {(out / name).stat().st_size / 1024 / 1024:8.1f} MiB on disk")
+
+
+if __name__ == "__main__":
+    main()
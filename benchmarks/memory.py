@@ -0,0 +1,113 @@
+"""Memory harness for the full scan pipeline on a synthetic corpus.
+
+Usage (from the repository root)::
+
+    python -m benchmarks.memory --files 1000
+    python -m benchmarks.memory --budget benchmarks/memory_budget.json
+
+Runs ``collect_detections`` -> ``build_index`` -> ``evaluate_detections`` ->
+``write_json`` under ``MemoryTracker`` (the same accounting as
+``bw scan --memory-report``). It prints peak heap per 10k files, retained
+bytes per detection and peak RSS. With ``--budget`` it exits 1 when a
+normalised number exceeds its limit. The budget file also records the corpus
+(``files``, ``size``) it was calibrated on; that corpus is used unless
+``--files``/``--size`` are given.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from baseline_warden.config import BaselineWardenConfig
+from baseline_warden.detect import collect_detections
+from baseline_warden.evaluate.policy import compile_policy, evaluate_detections
+from baseline_warden.evaluate.resolve import build_index
+from baseline_warden.memory import MemoryTracker
+from baseline_warden.outputs.json import write_json
+
+from .corpus import corpus_lock, generate_corpus
+
+DEFAULT_BUDGET_PATH = Path(__file__).with_name("memory_budget.json")
+DEFAULT_FILES = 1000
+DEFAULT_SIZE = 40
+# Budget keys checked against MemoryTracker.to_dict(); RSS is reported but not budgeted
+# because it includes the interpreter and imported modules.
+BUDGET_KEYS = ("peak_heap_bytes_per_10k_files", "retained_bytes_per_detection")
+
+
+def measure_scan(root: Path, *, report_path: Path) -> Dict[str, Any]:
+    """Scan ``root`` with the default policy and return the memory report."""
+
+    config = BaselineWardenConfig()
+    config.include.paths = ["templates/**/*", "static/**/*"]
+    memory = MemoryTracker()
+    memory.start()
+    try:
+        with memory.stage("collect_detections") as usage:
+            detections = collect_detections(root, config, memory=memory)
+            usage.items = memory.detections = len(detections)
+        lock = corpus_lock(detection.bcd_key for detection in detections)
+        with memory.stage("build_index") as usage:
+            index = build_index(lock)
+            usage.items = len(index.features_by_bcd)
+        with memory.stage("evaluate_detections") as usage:
+            findings, summary = evaluate_detections(index, detections, compile_policy(config))
+            usage.items = len(findings)
+        with memory.stage("output:json"):
+            write_json(findings, summary, report_path)
+    finally:
+        memory.stop()
+    return memory.to_dict()
+
+
+def check_budget(report: Dict[str, Any], budget: Dict[str, float]) -> List[str]:
+    """Return one message per budget the report exceeds."""
+
+    failures = []
+    for key in BUDGET_KEYS:
+        limit = budget.get(key)
+        if limit is not None and report[key] > limit:
+            failures.append(f"{key} = {report[key]} exceeds budget {limit}")
+    return failures
+
+
+def load_budget(path: Path = DEFAULT_BUDGET_PATH) -> Dict[str, float]:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, help=f"Corpus files (default: the budget's corpus, else {DEFAULT_FILES}).")
+    parser.add_argument("--size", type=int, help=f"Blocks or rules per file (default: the budget's corpus, else {DEFAULT_SIZE}).")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--budget", type=Path, help="JSON file with per-10k-file and per-detection limits.")
+    parser.add_argument("--save", type=Path, help="Write the memory report as JSON.")
+    args = parser.parse_args(argv)
+    budget = load_budget(args.budget) if args.budget else {}
+    files = args.files or int(budget.get("files", DEFAULT_FILES))
+    size = args.size or int(budget.get("size", DEFAULT_SIZE))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        generate_corpus(root, files=files, size=size, seed=args.seed)
+        report = measure_scan(root, report_path=root / "report.json")
+
+    print(json.dumps(report, indent=2))
+    if args.save:
+        args.save.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    if args.budget:
+        failures = check_budget(report, budget)
+        for failure in failures:
+            print(f"over budget: {failure}")
+        if failures:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
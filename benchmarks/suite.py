@@ -0,0 +1,240 @@
+"""Per-stage throughput benchmarks on a synthetic corpus.
+
+Usage (from the repository root)::
+
+    python -m benchmarks.suite --files 600 --repeat 5 --save benchmarks/results/main.json
+    python -m benchmarks.suite --files 600 --repeat 5 --compare benchmarks/results/main.json
+
+Each stage (``detect_html``, ``detect_css``, ``collect_detections``,
+``resolve_detection``, ``evaluate_detections``, ``write_outputs``) runs
+``--repeat`` times over the same deterministic corpus. As in ``bw scan``, the
+HTML stages detect with the key table of the lock that the later stages resolve
+against, so value and global attribute matching is timed. The report shows min and median wall time and, based on the median,
+files/s, MB/s and detections/s. ``--compare`` prints the change of each
+stage's median against a stored result and, with ``--fail-on-regression``,
+exits 1 when any stage is slower by more than ``--threshold``.
+Everything runs offline with the standard library.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from baseline_warden.config import BaselineWardenConfig
+from baseline_warden.detect import CSS_EXTENSIONS, HTML_EXTENSIONS, collect_detections
+from baseline_warden.detect.common import Detection
+from baseline_warden.detect.css import scan_css
+from baseline_warden.detect.html import scan_html
+from baseline_warden.evaluate.policy import compile_policy, evaluate_detections
+from baseline_warden.evaluate.resolve import build_index, resolve_detection
+from baseline_warden.outputs.gh_annotations import emit_annotations
+from baseline_warden.outputs.json import write_json
+from baseline_warden.outputs.sarif import write_sarif
+
+from .corpus import LOCK_VALUE_KEYS, CorpusStats, corpus_lock, generate_corpus
+
+RESULT_VERSION = "1"
+
+
+@dataclass
+class StageResult:
+    name: str
+    timings: List[float]
+    files: int
+    bytes: int
+    detections: int
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.timings)
+
+    def to_dict(self) -> Dict[str, Any]:
+        median = self.median or 1e-9
+        return {
+            "seconds_min": round(min(self.timings), 6),
+            "seconds_median": round(self.median, 6),
+            "files": self.files,
+            "bytes": self.bytes,
+            "detections": self.detections,
+            "files_per_s": round(self.files / median, 1),
+            "mb_per_s": round(self.bytes / median / 1_000_000, 3),
+            "detections_per_s": round(self.detections / median, 1),
+        }
+
+
+def _time(repeat: int, func: Callable[[], object]) -> List[float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _detect_stage(name: str, scanner: Callable, paths: List[Path], repeat: int) -> tuple[StageResult, List[Detection]]:
+    detections: List[Detection] = []
+
+    def run() -> None:
+        detections.clear()
+        for path in paths:
+            detections.extend(scanner(path).detections)
+
+    timings = _time(repeat, run)
+    size = sum(path.stat().st_size for path in paths)
+    return StageResult(name, timings, len(paths), size, len(detections)), list(detections)
+
+
+def run_suite(stats: CorpusStats, *, repeat: int) -> List[StageResult]:
+    html_paths = [path for path in stats.paths if path.suffix in HTML_EXTENSIONS]
+    css_paths = [path for path in stats.paths if path.suffix in CSS_EXTENSIONS]
+    config = BaselineWardenConfig()
+    config.include.paths = ["templates/**/*", "static/**/*"]
+
+    # Untimed pass: the lock maps what the corpus uses, plus value keys.
+    keys = {detection.bcd_key for detection in collect_detections(stats.root, config)}
+    index = build_index(corpus_lock([*keys, *LOCK_VALUE_KEYS]))
+    html_keys = index.html_keys()
+
+    html_result, html_detections = _detect_stage(
+        "detect_html", partial(scan_html, html_keys=html_keys), html_paths, repeat
+    )
+    css_result, css_detections = _detect_stage("detect_css", scan_css, css_paths, repeat)
+
+    collected: List[Detection] = []
+
+    def collect() -> None:
+        collected[:] = collect_detections(stats.root, config, html_keys=html_keys)
+
+    collect_result = StageResult("collect_detections", _time(repeat, collect), stats.files, stats.bytes, 0)
+    # Later stages use runner output: relative paths, as in ``bw scan``.
+    detections = collected
+    collect_result.detections = len(detections)
+
+    policy = compile_policy(BaselineWardenConfig())
+
+    def resolve_all() -> None:
+        for detection in detections:
+            resolve_detection(index, detection)
+
+    resolve_result = StageResult(
+        "resolve_detection", _time(repeat, resolve_all), stats.files, stats.bytes, len(detections)
+    )
+    evaluate_result = StageResult(
+        "evaluate_detections",
+        _time(repeat, lambda: evaluate_detections(index, detections, policy)),
+        stats.files,
+        stats.bytes,
+        len(detections),
+    )
+    findings, summary = evaluate_detections(index, detections, policy)
+    report_dir = stats.root / ".bench-out"
+    report_dir.mkdir(exist_ok=True)
+
+    def write_outputs() -> None:
+        write_json(findings, summary, report_dir / "report.json")
+        write_sarif(findings, summary, report_dir / "report.sarif")
+        with contextlib.redirect_stdout(io.StringIO()):
+            emit_annotations(findings)
+
+    outputs_result = StageResult("write_outputs", _time(repeat, write_outputs), stats.files, stats.bytes, len(findings))
+    return [html_result, css_result, collect_result, resolve_result, evaluate_result, outputs_result]
+
+
+def build_report(results: List[StageResult], stats: CorpusStats, *, seed: int, size: int, repeat: int) -> Dict[str, Any]:
+    return {
+        "version": RESULT_VERSION,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "corpus": {"files": stats.files, "bytes": stats.bytes, "seed": seed, "size": size},
+        "repeat": repeat,
+        "stages": {result.name: result.to_dict() for result in results},
+    }
+
+
+def compare_reports(current: Dict[str, Any], baseline: Dict[str, Any], *, threshold: float) -> tuple[List[str], bool]:
+    """Return report lines and whether any stage regressed beyond ``threshold``."""
+
+    lines = []
+    regressed = False
+    if current["corpus"] != baseline.get("corpus"):
+        lines.append(f"warning: corpus differs from baseline ({baseline.get('corpus')}); ratios are not comparable")
+    for name, stage in current["stages"].items():
+        previous = baseline.get("stages", {}).get(name)
+        if previous is None:
+            lines.append(f"{name:<22} new stage")
+            continue
+        ratio = stage["seconds_median"] / max(previous["seconds_median"], 1e-9)
+        change = (ratio - 1) * 100
+        verdict = "ok"
+        if ratio > 1 + threshold:
+            verdict = "REGRESSION"
+            regressed = True
+        elif ratio < 1 - threshold:
+            verdict = "faster"
+        lines.append(
+            f"{name:<22} {previous['seconds_median']:.4f}s -> {stage['seconds_median']:.4f}s ({change:+.1f}%) {verdict}"
+        )
+    return lines, regressed
+
+
+def format_report(report: Dict[str, Any]) -> List[str]:
+    corpus = report["corpus"]
+    lines = [f"corpus: {corpus['files']} files, {corpus['bytes'] / 1_000_000:.2f} MB (seed={corpus['seed']})"]
+    for name, stage in report["stages"].items():
+        lines.append(
+            f"{name:<22} median {stage['seconds_median']:.4f}s  min {stage['seconds_min']:.4f}s  "
+            f"{stage['files_per_s']:>10.1f} files/s  {stage['mb_per_s']:>8.2f} MB/s  "
+            f"{stage['detections_per_s']:>12.1f} detections/s"
+        )
+    return lines
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=600, help="Number of corpus files (HTML, Jinja, CSS in equal parts).")
+    parser.add_argument("--size", type=int, default=40, help="Blocks per HTML file / rules per CSS file.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--corpus-dir", type=Path, help="Keep the generated corpus here instead of a temp dir.")
+    parser.add_argument("--save", type=Path, help="Write the JSON result to this path.")
+    parser.add_argument("--compare", type=Path, help="Compare against a previously saved result.")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Allowed slowdown ratio (default 0.10 = 10%%).")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = args.corpus_dir or Path(tmp)
+        stats = generate_corpus(root, files=args.files, size=args.size, seed=args.seed)
+        results = run_suite(stats, repeat=args.repeat)
+    report = build_report(results, stats, seed=args.seed, size=args.size, repeat=args.repeat)
+
+    for line in format_report(report):
+        print(line)
+    if args.save:
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        args.save.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"saved {args.save}")
+    if args.compare:
+        lines, regressed = compare_reports(report, json.loads(args.compare.read_text()), threshold=args.threshold)
+        print(f"compared with {args.compare}:")
+        for line in lines:
+            print(f"  {line}")
+        if regressed and args.fail_on_regression:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,14 @@
+from pathlib import Path
+
+import pytest
+
+from baseline_warden.index.cache import CACHE_ENV_VAR
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep scan caches out of the user's real cache directory."""
+
+    cache_dir = tmp_path_factory.mktemp("cache")
+    monkeypatch.setenv(CACHE_ENV_VAR, str(cache_dir))
+    return cache_dir
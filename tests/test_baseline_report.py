@@ -0,0 +1,105 @@
+import json
+import os
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from baseline_warden.cli import app
+from baseline_warden.config import BaselineWardenConfig
+from baseline_warden.detect.common import Detection
+from baseline_warden.evaluate.baseline import diff_findings, load_baseline_report
+from baseline_warden.evaluate.policy import evaluate_detections
+from baseline_warden.evaluate.resolve import build_index
+from baseline_warden.index.cache import BaselineLock, LockFeature, write_lock
+from baseline_warden.outputs.json import write_json
+
+STICKY = "css.properties.position.sticky"
+
+
+def _lock() -> BaselineLock:
+    return BaselineLock(
+        features=[LockFeature(feature_id="sticky", title="Sticky", status="limited", bcd_keys=[STICKY])]
+    )
+
+
+def test_diff_findings_ignores_line_shifts_and_reports_resolved(tmp_path: Path) -> None:
+    index = build_index(_lock())
+    config = BaselineWardenConfig()
+    old, old_summary = evaluate_detections(
+        index,
+        [
+            Detection(path=Path("a.css"), line=1, bcd_key=STICKY),
+            Detection(path=Path("b.css"), line=1, bcd_key=STICKY),
+        ],
+        config,
+    )
+    report = tmp_path / "old.json"
+    write_json(old, old_summary, report)
+
+    current, _ = evaluate_detections(
+        index,
+        [
+            Detection(path=Path("a.css"), line=7, bcd_key=STICKY),
+            Detection(path=Path("a.css"), line=9, bcd_key=STICKY),
+        ],
+        config,
+    )
+    diff = diff_findings(current, load_baseline_report(report))
+
+    assert diff.unchanged == 1
+    assert [f.detection.line for f in diff.new] == [9]
+    assert [f.baseline for f in current] == ["unchanged", "new"]
+    assert [record["file"] for record in diff.resolved] == ["b.css"]
+
+
+def test_passing_baseline_findings_are_not_reported_as_resolved(tmp_path: Path) -> None:
+    index = build_index(_lock())
+    config = BaselineWardenConfig()
+    config.allowlist.feature_ids = ["sticky"]
+    old, old_summary = evaluate_detections(index, [Detection(path=Path("a.css"), line=1, bcd_key=STICKY)], config)
+    report = tmp_path / "old.json"
+    write_json(old, old_summary, report)
+
+    diff = diff_findings([], load_baseline_report(report))
+
+    assert diff.resolved == []
+
+
+def test_scan_with_baseline_report_gates_only_new_findings(tmp_path: Path) -> None:
+    (tmp_path / "static").mkdir()
+    css = tmp_path / "static" / "main.css"
+    css.write_text("a { position: sticky; }")
+    config = tmp_path / "baseline-warden.toml"
+    config.write_text('[include]\npaths = ["static/**/*.css"]\n\n[output]\nformats = ["json"]\n')
+    lock_path = tmp_path / "baseline.lock.json"
+    write_lock(lock_path, _lock())
+    args = ["scan", "--config", str(config), "--lock-path", str(lock_path)]
+
+    runner = CliRunner()
+    cwd = os.getcwd()
+    try:
+        os.chdir(tmp_path)
+        first = runner.invoke(app, args, catch_exceptions=False)
+        (tmp_path / "report.json").rename(tmp_path / "old.json")
+        unchanged = runner.invoke(app, args + ["--baseline-report", "old.json"], catch_exceptions=False)
+        css.write_text("a { position: sticky; }\nb { position: sticky; }")
+        regressed = runner.invoke(app, args + ["--baseline-report", "old.json"], catch_exceptions=False)
+        (tmp_path / "report.json").rename(tmp_path / "regressed.json")
+        rebaselined = runner.invoke(app, args + ["--baseline-report", "regressed.json"], catch_exceptions=False)
+    finally:
+        os.chdir(cwd)
+
+    assert first.exit_code == 1
+    assert unchanged.exit_code == 0
+    assert "0 new, 0 resolved, 2 unchanged" in unchanged.output
+    assert regressed.exit_code == 1
+    report = json.loads((tmp_path / "regressed.json").read_text())
+    sticky = [finding for finding in report["findings"] if finding["bcd_key"] == STICKY]
+    assert [(finding["line"], finding["baseline"]) for finding in sticky] == [(1, "unchanged"), (2, "new")]
+    assert report["baseline"]["new"] == 2
+    assert report["baseline"]["unchanged"] == 2
+    assert report["baseline"]["new_outcomes"]["fail"] == 1
+    assert report["resolved"] == []
+    # The full report is a usable baseline for the next run.
+    assert rebaselined.exit_code == 0
+    assert "0 new, 0 resolved, 4 unchanged" in rebaselined.output
@@ -0,0 +1,86 @@
+import json
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from baseline_warden.batch import load_manifest, scan_many
+from baseline_warden.cli import app
+from baseline_warden.evaluate.resolve import build_index
+from baseline_warden.index.cache import BaselineLock, LockFeature, write_lock
+
+
+def _lock() -> BaselineLock:
+    return BaselineLock(
+        features=[LockFeature(feature_id="sticky", title="Sticky", status="limited", bcd_keys=["css.properties.position.sticky"])]
+    )
+
+
+def _workspace(tmp_path: Path) -> Path:
+    clean = tmp_path / "repos" / "clean" / "static"
+    clean.mkdir(parents=True)
+    (clean / "main.css").write_text("a { color: red; }")
+    sticky = tmp_path / "repos" / "sticky"
+    (sticky / "styles").mkdir(parents=True)
+    (sticky / "styles" / "main.css").write_text("a { position: sticky; }")
+    # Per-repo config: only this repo scans styles/
+    (sticky / "baseline-warden.toml").write_text('[include]\npaths = ["styles/**/*.css"]\n')
+    manifest = tmp_path / "manifest.toml"
+    manifest.write_text(
+        """
+[scan]
+workers = 1
+out_dir = "out"
+
+[[repos]]
+path = "repos/clean"
+
+[[repos]]
+path = "repos/sticky"
+
+[[repos]]
+name = "missing"
+path = "repos/missing"
+"""
+    )
+    return manifest
+
+
+def test_scan_many_writes_reports_and_rollup(tmp_path: Path) -> None:
+    manifest = load_manifest(_workspace(tmp_path))
+
+    batch = scan_many(manifest, build_index(_lock()))
+
+    results = {result.name: result for result in batch.repositories}
+    assert not results["clean"].failed
+    assert results["sticky"].failed
+    assert results["missing"].error
+    assert (tmp_path / "out" / "sticky" / "report.json").exists()
+    rollup = json.loads((tmp_path / "out" / "rollup.json").read_text())
+    assert rollup["summary"]["repositories"] == 3
+    assert rollup["summary"]["failed"] == 1
+    assert rollup["summary"]["errors"] == 1
+
+
+def test_scan_many_cli_with_worker_pool(tmp_path: Path) -> None:
+    manifest = _workspace(tmp_path)
+    manifest.write_text(manifest.read_text().replace('[[repos]]\nname = "missing"\npath = "repos/missing"\n', ""))
+    lock_path = tmp_path / "baseline.lock.json"
+    write_lock(lock_path, _lock())
+
+    result = CliRunner().invoke(
+        app,
+        ["scan-many", str(manifest), "--lock-path", str(lock_path), "--workers", "2"],
+        catch_exceptions=False,
+    )
+
+    assert result.exit_code == 1
+    assert "sticky:" in result.stdout
+    assert (tmp_path / "out" / "clean" / "report.json").exists()
+
+
+def test_scan_many_cli_reports_missing_manifest(tmp_path: Path) -> None:
+    result = CliRunner().invoke(app, ["scan-many", str(tmp_path / "missing.toml")])
+
+    assert result.exit_code == 2
+    assert result.exception is None or isinstance(result.exception, SystemExit)
+    assert "Manifest not found" in result.output
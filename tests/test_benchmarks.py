@@ -0,0 +1,44 @@
+from pathlib import Path
+
+from benchmarks.corpus import corpus_lock, generate_corpus
+from benchmarks.suite import build_report, compare_reports, run_suite
+
+
+def test_corpus_generator_is_deterministic(tmp_path: Path) -> None:
+    first = generate_corpus(tmp_path / "a", files=9, size=5, seed=3)
+    second = generate_corpus(tmp_path / "b", files=9, size=5, seed=3)
+
+    assert first.bytes == second.bytes
+    assert {path.suffix for path in first.paths} == {".html", ".jinja", ".css"}
+    for left, right in zip(first.paths, second.paths):
+        assert left.read_bytes() == right.read_bytes()
+
+
+def test_corpus_lock_leaves_some_keys_unmapped() -> None:
+    lock = corpus_lock(f"css.properties.p{i}" for i in range(10))
+
+    assert lock.feature_count == 8
+
+
+def test_suite_reports_throughput_and_flags_regressions(tmp_path: Path) -> None:
+    stats = generate_corpus(tmp_path, files=6, size=4)
+    results = run_suite(stats, repeat=1)
+    report = build_report(results, stats, seed=0, size=4, repeat=1)
+
+    assert list(report["stages"]) == [
+        "detect_html",
+        "detect_css",
+        "collect_detections",
+        "resolve_detection",
+        "evaluate_detections",
+        "write_outputs",
+    ]
+    assert all(stage["detections"] > 0 for stage in report["stages"].values())
+
+    slower_stages = {
+        name: {**stage, "seconds_median": stage["seconds_median"] * 2 + 1} for name, stage in report["stages"].items()
+    }
+    slower = {**report, "stages": slower_stages}
+    lines, regressed = compare_reports(slower, report, threshold=0.1)
+    assert regressed
+    assert all("REGRESSION" in line for line in lines)
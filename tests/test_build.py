@@ -1,4 +1,5 @@
 from baseline_warden.index.build import (
+    WebFeatureEntry,
     WebFeaturesDataset,
     assemble_lock_features,
     build_web_features_index,
@@ -45,6 +46,15 @@ def test_build_web_features_index_creates_metadata_and_bcd_map() -> None:
     assert index.bcd_to_feature["css.properties.shared"] == "feature-c"
 
 
+def test_build_web_features_index_records_bcd_conflicts() -> None:
+    dataset = _dataset()
+    dataset.features["feature-e"] = WebFeatureEntry(name="Feature E", compat_features=["css.properties.shared"])
+    index = build_web_features_index(dataset)
+
+    assert index.bcd_to_feature["css.properties.shared"] == "feature-c"
+    assert index.bcd_conflicts == {"css.properties.shared": ["feature-c", "feature-e"]}
+
+
 def test_assemble_lock_features_merges_baseline_data() -> None:
     dataset = _dataset()
     index = build_web_features_index(dataset)
@@ -1,6 +1,6 @@
 from pathlib import Path
 
-from baseline_warden.index.cache import BaselineLock, LockFeature, load_lock, write_lock
+from baseline_warden.index.cache import BaselineLock, LockFeature, load_lock, lock_digest, read_lock_payload, write_lock
 
 
 def test_lock_roundtrip(tmp_path: Path) -> None:
@@ -22,3 +22,50 @@ def test_lock_roundtrip(tmp_path: Path) -> None:
     assert loaded.feature_count == 1
     assert loaded.features[0].feature_id == feature.feature_id
     assert loaded.generated_at.tzinfo is not None
+
+
+def _sample_lock(**kwargs) -> BaselineLock:
+    return BaselineLock(
+        features=[
+            LockFeature(feature_id="dialog", status="widely", bcd_keys=["html.elements.dialog.open", "html.elements.dialog"]),
+            LockFeature(feature_id="has", status="newly", bcd_keys=["css.selectors.has"]),
+        ],
+        **kwargs,
+    )
+
+
+def test_lock_digest_ignores_generated_at_and_metadata() -> None:
+    first = _sample_lock(metadata={"source": "a"})
+    second = _sample_lock(metadata={"source": "b"})
+
+    assert lock_digest(first) == lock_digest(second)
+    second.features[1].status = "widely"
+    assert lock_digest(first) != lock_digest(second)
+
+
+def test_write_lock_is_canonical_and_compact(tmp_path: Path) -> None:
+    lock = _sample_lock()
+    pretty = tmp_path / "pretty.lock.json"
+    compact = tmp_path / "compact.lock.json"
+
+    digest = write_lock(pretty, lock)
+    assert write_lock(compact, lock, compact=True) == digest
+
+    text = compact.read_text()
+    assert text.startswith('{"digest":"' + digest)
+    assert "\n" not in text
+    payload = read_lock_payload(pretty)
+    assert payload["features"][0]["bcd_keys"] == ["html.elements.dialog", "html.elements.dialog.open"]
+    assert load_lock(compact).features == load_lock(pretty).features
+
+
+def test_gzip_lock_roundtrip_is_reproducible(tmp_path: Path) -> None:
+    lock = _sample_lock()
+    first = tmp_path / "a.lock.json.gz"
+    second = tmp_path / "b.lock.json.gz"
+    write_lock(first, lock, compact=True)
+    write_lock(second, lock, compact=True)
+
+    assert first.read_bytes()[:2] == b"\x1f\x8b"
+    assert first.read_bytes() == second.read_bytes()
+    assert lock_digest(load_lock(first)) == lock_digest(lock)
@@ -0,0 +1,97 @@
+import json
+import multiprocessing
+import os
+import stat
+from pathlib import Path
+
+import httpx
+import pytest
+
+from baseline_warden.index.build import fetch_web_features_dataset
+from baseline_warden.index.cache import BaselineLock, LockFeature, load_lock, write_lock
+from baseline_warden.index.store import BLOBS_DIR, CacheStore, atomic_write_bytes
+
+DATASET = {"features": {"grid": {"name": "Grid", "compat_features": ["css.properties.display.grid"]}}}
+
+
+def test_atomic_write_replaces_without_leftovers(tmp_path: Path) -> None:
+    target = tmp_path / "nested" / "data.json"
+    atomic_write_bytes(target, b"old")
+    atomic_write_bytes(target, b"new")
+
+    assert target.read_bytes() == b"new"
+    assert [path.name for path in target.parent.iterdir()] == ["data.json"]
+
+
+def test_write_lock_is_atomic(tmp_path: Path) -> None:
+    path = tmp_path / "baseline.lock.json"
+    write_lock(path, BaselineLock(features=[LockFeature(feature_id="grid", status="widely")]))
+
+    assert load_lock(path).features[0].feature_id == "grid"
+    assert [entry.name for entry in tmp_path.iterdir()] == ["baseline.lock.json"]
+
+
+@pytest.mark.skipif(not hasattr(os, "fchmod"), reason="POSIX file modes")
+def test_atomic_writes_use_umask_or_keep_existing_mode(tmp_path: Path) -> None:
+    def mode(path: Path) -> int:
+        return stat.S_IMODE(path.stat().st_mode)
+
+    previous = os.umask(0o022)
+    try:
+        lock_path = tmp_path / "baseline.lock.json"
+        write_lock(lock_path, BaselineLock(features=[LockFeature(feature_id="grid", status="widely")]))
+        store = CacheStore(tmp_path / "cache")
+        digest = store.put("web-features.json", b"{}")
+
+        assert mode(lock_path) == 0o644
+        assert mode(store.path("web-features.json")) == 0o644
+        assert mode(store.blob_path(digest)) == 0o644
+
+        lock_path.chmod(0o640)
+        write_lock(lock_path, BaselineLock(features=[]))
+        assert mode(lock_path) == 0o640
+    finally:
+        os.umask(previous)
+
+
+def test_store_shares_blobs_and_prunes_unreferenced_ones(tmp_path: Path) -> None:
+    store = CacheStore(tmp_path)
+    digest = store.put("a.json", b"same")
+    assert store.put("b.json", b"same") == digest
+    assert store.path("a.json").read_bytes() == store.path("b.json").read_bytes() == b"same"
+    assert len(list(tmp_path.glob(f"{BLOBS_DIR}/*/*"))) == 1
+
+    store.put("a.json", b"changed")
+    store.put("b.json", b"changed")
+
+    assert [blob.read_bytes() for blob in tmp_path.glob(f"{BLOBS_DIR}/*/*")] == [b"changed"]
+    assert store.path("a.json").read_bytes() == b"changed"
+
+
+def _sync_dataset(cache_path: str, counter, barrier) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        with counter.get_lock():
+            counter.value += 1
+        return httpx.Response(200, json=DATASET)
+
+    barrier.wait()
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        dataset = fetch_web_features_dataset(client=client, cache_path=Path(cache_path))
+    assert "grid" in dataset.features
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="needs fork")
+def test_parallel_syncs_fetch_the_dataset_once(tmp_path: Path) -> None:
+    context = multiprocessing.get_context("fork")
+    counter = context.Value("i", 0)
+    barrier = context.Barrier(4)
+    cache_path = tmp_path / "web-features.json"
+    workers = [context.Process(target=_sync_dataset, args=(str(cache_path), counter, barrier)) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=30)
+
+    assert [worker.exitcode for worker in workers] == [0, 0, 0, 0]
+    assert counter.value == 1
+    assert json.loads(cache_path.read_text()) == DATASET
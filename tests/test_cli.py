@@ -1,5 +1,6 @@
 from pathlib import Path
 
+import httpx
 from typer.testing import CliRunner
 
 from baseline_warden.cli import app
@@ -52,3 +53,23 @@ def test_scan_with_lock(tmp_path: Path) -> None:
     )
     assert result.exit_code == 0
     assert "Dry run enabled" in result.stdout
+
+
+def test_scan_reports_missing_config(tmp_path: Path) -> None:
+    result = CliRunner().invoke(app, ["scan", "--config", str(tmp_path / "missing.toml")])
+
+    assert result.exit_code == 2
+    assert result.exception is None or isinstance(result.exception, SystemExit)
+    assert "Config not found" in result.output
+
+
+def test_sync_reports_fetch_failure(tmp_path: Path, monkeypatch) -> None:
+    def fail(**_: object) -> None:
+        raise httpx.ConnectError("offline")
+
+    monkeypatch.setattr("baseline_warden.cli.fetch_web_features_dataset", fail)
+    result = CliRunner().invoke(app, ["sync", "--lock", "--lock-path", str(tmp_path / "baseline.lock.json")])
+
+    assert result.exit_code == 1
+    assert result.exception is None or isinstance(result.exception, SystemExit)
+    assert "Failed to fetch Baseline data: offline" in result.output
@@ -0,0 +1,95 @@
+from pathlib import Path
+
+from baseline_warden.config import BaselineWardenConfig
+from baseline_warden.detect.component import detect_component, scan_component, split_component
+from baseline_warden.evaluate.policy import evaluate_detections
+from baseline_warden.evaluate.resolve import build_index
+from baseline_warden.index.cache import BaselineLock
+
+VUE = """<template>
+  <div :class="cls" @click="go" v-if="ok">
+    <MyWidget open />
+    <template v-for="item in items"><dialog open>{{ item }}</dialog></template>
+  </div>
+</template>
+
+<script setup>
+const ok = true
+</script>
+
+<style scoped>
+/* bw-ignore-next-line css.properties.position */
+.a { position: sticky; }
+.b { display: grid; }
+</style>
+
+<style lang="scss">
+.c { .d { color: red; } }
+</style>
+"""
+
+
+def test_split_vue_component_keeps_line_offsets() -> None:
+    blocks = split_component(VUE, "vue")
+
+    assert [(block.kind, block.lang, block.tag_line) for block in blocks] == [
+        ("markup", None, 1),
+        ("script", None, 8),
+        ("style", None, 12),
+        ("style", "scss", 18),
+    ]
+    assert blocks[0].content.count("<template") == 1
+
+
+def test_vue_component_detections(tmp_path: Path) -> None:
+    path = tmp_path / "Widget.vue"
+    path.write_text(VUE)
+    scan = scan_component(path)
+    detections = {(d.line, d.bcd_key) for d in scan.detections}
+
+    assert (2, "html.elements.div") in detections
+    assert (4, "html.elements.dialog.open") in detections
+    assert (4, "html.elements.template") in detections
+    assert (14, "css.properties.position.sticky") in detections
+    assert (15, "css.properties.display.grid") in detections
+    assert (18, "bw.unsupported.style.scss") in detections
+    # Bindings, component tags and SCSS content produce nothing.
+    assert not any(key.startswith(("html.elements.div.", "html.elements.mywidget")) for _, key in detections)
+    assert not any(key == "css.properties.color" for _, key in detections)
+    assert scan.suppressions.suppresses(14, "css.properties.position.sticky")
+
+
+def test_svelte_markup_outside_blocks(tmp_path: Path) -> None:
+    path = tmp_path / "Card.svelte"
+    path.write_text(
+        "<script>\n  let open = false;\n</script>\n\n"
+        "<svelte:head><title>x</title></svelte:head>\n"
+        "{#if open}\n<details on:toggle={t} bind:open class:active={open}>hi</details>\n{/if}\n"
+        "<style>\n  details { inset: 0; }\n</style>\n"
+    )
+
+    assert {(d.line, d.bcd_key) for d in detect_component(path)} == {
+        (5, "html.elements.title"),
+        (7, "html.elements.details"),
+        (10, "css.properties.inset"),
+    }
+
+
+def test_astro_frontmatter_is_skipped(tmp_path: Path) -> None:
+    path = tmp_path / "page.astro"
+    path.write_text("---\nconst title = '<dialog>';\n---\n<search>{title}</search>\n<Layout client:load />\n")
+
+    assert {(d.line, d.bcd_key) for d in detect_component(path)} == {(4, "html.elements.search")}
+
+
+def test_unsupported_blocks_stay_outside_policy(tmp_path: Path) -> None:
+    path = tmp_path / "Styled.vue"
+    path.write_text('<template><p>Hi</p></template>\n<style lang="scss">\n$a: 1;\n</style>\n')
+    config = BaselineWardenConfig()
+    config.policy.unknown_behavior = "fail"
+
+    findings, summary = evaluate_detections(build_index(BaselineLock()), detect_component(path), config)
+
+    unsupported = [f for f in findings if f.detection.bcd_key == "bw.unsupported.style.scss"]
+    assert [(f.outcome, f.status) for f in unsupported] == [("pass", "unsupported")]
+    assert summary.outcomes["fail"] == len(findings) - 1
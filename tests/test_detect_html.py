@@ -1,6 +1,8 @@
 from pathlib import Path
 
-from baseline_warden.detect.html import detect_html
+from baseline_warden.detect.html import detect_html, scan_html
+from baseline_warden.evaluate.resolve import build_index
+from baseline_warden.index.cache import BaselineLock, LockFeature
 
 
 def test_detect_html_emits_element_and_attribute_keys(tmp_path: Path) -> None:
@@ -38,3 +40,21 @@ def test_detect_html_skips_data_and_event_attributes(tmp_path: Path) -> None:
     assert "html.elements.button" in keys
     assert "html.elements.button.data-test" not in keys
     assert "html.elements.button.onclick" not in keys
+
+
+def test_detect_html_key_table_drops_unmapped_attribute_keys(tmp_path: Path) -> None:
+    lock = BaselineLock(
+        features=[
+            LockFeature(feature_id="dialog", title="Dialog", status="widely", bcd_keys=["html.elements.dialog"]),
+            LockFeature(feature_id="popover", title="Popover", status="newly", bcd_keys=["html.elements.dialog.popover"]),
+        ]
+    )
+    html_keys = build_index(lock).html_keys()
+    path = tmp_path / "sample.html"
+    path.write_text('<dialog popover open><main role="x"></main></dialog>')
+
+    filtered = {d.bcd_key for d in scan_html(path, html_keys=html_keys).detections}
+    exhaustive = {d.bcd_key for d in scan_html(path).detections}
+
+    assert filtered == {"html.elements.dialog", "html.elements.dialog.popover", "html.elements.main"}
+    assert exhaustive == filtered | {"html.elements.dialog.open", "html.elements.main.role"}
@@ -1,6 +1,7 @@
 from pathlib import Path
 
-from baseline_warden.detect.html import detect_html
+from baseline_warden.detect.html import detect_html, scan_html
+from baseline_warden.detect.html_keys import HtmlKeyTable
 
 
 def test_ignores_common_global_and_aria_attributes(tmp_path: Path) -> None:
@@ -14,3 +15,87 @@ def test_ignores_common_global_and_aria_attributes(tmp_path: Path) -> None:
     assert "html.elements.button.class" not in keys
     assert "html.elements.button.aria-label" not in keys
 
+
+def test_key_table_splits_value_bearing_keys() -> None:
+    table = HtmlKeyTable.from_keys(
+        [
+            "html.elements.input.type_date",
+            "html.elements.link.rel.preload",
+            "html.elements.img.loading",
+            "html.global_attributes.hidden.until-found",
+            "html.global_attributes.inert",
+            "html.elements.a.implicit_noopener",
+            "html.elements.a.rel.noopener",
+            "css.properties.display",
+        ]
+    )
+
+    assert "css.properties.display" not in table.keys
+    assert table.values == {
+        ("input", "type"): {"date": "html.elements.input.type_date"},
+        ("link", "rel"): {"preload": "html.elements.link.rel.preload"},
+        ("a", "rel"): {"noopener": "html.elements.a.rel.noopener"},
+    }
+    assert table.global_values == {"hidden": {"until-found": "html.global_attributes.hidden.until-found"}}
+    assert list(table.value_keys("link", "rel", "Preload stylesheet")) == ["html.elements.link.rel.preload"]
+
+
+def test_detects_attribute_values_and_global_attributes(tmp_path: Path) -> None:
+    table = HtmlKeyTable.from_keys(
+        [
+            "html.elements.input.type_date",
+            "html.elements.img.loading",
+            "html.elements.img.loading.lazy",
+            "html.global_attributes.inert",
+            "html.global_attributes.hidden.until-found",
+        ]
+    )
+    p = tmp_path / "values.html"
+    p.write_text(
+        '<input type="DATE" inert>\n'
+        '<img loading="lazy" class="x">\n'
+        '<div hidden="until-found" translate="no"></div>\n'
+        '<input type="text">'
+    )
+
+    keys = [(d.line, d.bcd_key) for d in scan_html(p, html_keys=table).detections]
+
+    assert keys == [
+        (1, "html.elements.input"),
+        (1, "html.elements.input.type_date"),
+        (1, "html.global_attributes.inert"),
+        (2, "html.elements.img"),
+        (2, "html.elements.img.loading.lazy"),
+        (2, "html.elements.img.loading"),
+        (3, "html.elements.div"),
+        (3, "html.global_attributes.hidden.until-found"),
+        (4, "html.elements.input"),
+    ]
+
+
+def test_exhaustive_table_keeps_unmapped_attribute_keys(tmp_path: Path) -> None:
+    table = HtmlKeyTable.from_keys(["html.global_attributes.inert"], exhaustive=True)
+    p = tmp_path / "exhaustive.html"
+    p.write_text('<div inert translate="no" class="x"></div>')
+
+    keys = {d.bcd_key for d in scan_html(p, html_keys=table).detections}
+
+    assert keys == {"html.elements.div", "html.global_attributes.inert", "html.elements.div.translate"}
+
+
+def test_exhaustive_table_emits_unmapped_values_of_value_bearing_attributes(tmp_path: Path) -> None:
+    table = HtmlKeyTable.from_keys(
+        ["html.elements.input.type_date", "html.elements.link.rel.preload", "html.global_attributes.hidden.until-found"],
+        exhaustive=True,
+    )
+    p = tmp_path / "future.html"
+    p.write_text('<input type="week"><link rel="modulepreload https://x"><p hidden="secret" title="Hi there"></p>')
+
+    keys = {d.bcd_key for d in scan_html(p, html_keys=table).detections}
+
+    assert {
+        "html.elements.input.type_week",
+        "html.elements.link.rel.modulepreload",
+        "html.global_attributes.hidden.secret",
+    } <= keys
+    assert not any(key.endswith(("https://x", ".hi", ".there")) for key in keys)
@@ -1,7 +1,9 @@
 from pathlib import Path
 
 from baseline_warden.config import BaselineWardenConfig
-from baseline_warden.detect import collect_detections
+from baseline_warden.detect import HtmlKeyTable, ScanStrings, collect_detections
+from baseline_warden.evaluate.policy import Finding
+from baseline_warden.outputs.json import finding_record
 
 
 def test_collect_detections_scans_html_and_css(tmp_path: Path) -> None:
@@ -24,3 +26,49 @@ def test_collect_detections_scans_html_and_css(tmp_path: Path) -> None:
     assert "html.elements.dialog.popover" in keys
     assert "css.selectors.focus-visible" in keys
     assert "css.properties.position.sticky" in keys
+
+
+def test_collect_detections_applies_html_keys_to_html_and_components(tmp_path: Path) -> None:
+    (tmp_path / "templates").mkdir()
+    (tmp_path / "templates" / "index.html").write_text('<input type="date" inputmode="numeric">')
+    (tmp_path / "templates" / "Form.vue").write_text('<template><input type="date" inputmode="numeric"></template>')
+
+    config = BaselineWardenConfig()
+    config.include.paths = ["templates/**/*"]
+
+    detections = collect_detections(tmp_path, config, html_keys=HtmlKeyTable.from_keys(["html.elements.input.inputmode"]))
+    keys = sorted((d.path.suffix, d.bcd_key) for d in detections)
+
+    assert keys == [
+        (".html", "html.elements.input"),
+        (".html", "html.elements.input.inputmode"),
+        (".vue", "html.elements.input"),
+        (".vue", "html.elements.input.inputmode"),
+    ]
+
+
+def test_collect_detections_interns_paths_and_keys(tmp_path: Path) -> None:
+    (tmp_path / "templates").mkdir()
+    (tmp_path / "templates" / "a.html").write_text("<div></div>\n<div></div>")
+    (tmp_path / "templates" / "b.html").write_text("<div></div>")
+
+    config = BaselineWardenConfig()
+    config.include.paths = ["templates/**/*.html"]
+    strings = ScanStrings()
+
+    detections = collect_detections(tmp_path, config, strings=strings)
+
+    assert len(detections) == 3
+    assert len({id(d.bcd_key) for d in detections}) == 1
+    a_paths = [d.path for d in detections if d.path.name == "a.html"]
+    assert a_paths[0] is a_paths[1] and a_paths[0] == Path("templates/a.html")
+    assert (strings.path_count, strings.key_count) == (2, 1)
+    # Outputs reuse the table's rendering of each path.
+    rendered = strings.text(a_paths[0])
+    assert rendered == "templates/a.html" and strings.text(a_paths[1]) is rendered
+    # An equal Path that was not interned still renders correctly.
+    assert strings.text(Path("templates/a.html")) == rendered
+    finding = Finding(
+        detection=detections[0], feature=None, status="unknown", outcome="warn", severity="warning", message=""
+    )
+    assert finding_record(finding, strings)["file"] is strings.text(detections[0].path)
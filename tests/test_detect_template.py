@@ -0,0 +1,84 @@
+import time
+from pathlib import Path
+
+from baseline_warden.detect.html import detect_html
+from baseline_warden.detect.template import mask_template
+
+
+def test_mask_template_preserves_offsets() -> None:
+    text = '<a href="{{ url }}" {% if x %}\ndownload{% endif %}>{# note\nmore #}<%= name %></a>'
+    masked = mask_template(text)
+
+    assert len(masked) == len(text)
+    assert [i for i, c in enumerate(masked) if c == "\n"] == [i for i, c in enumerate(text) if c == "\n"]
+    assert "{" not in masked and "%" not in masked
+    assert "download" in masked
+
+
+def test_mask_template_handles_handlebars_and_unterminated_tags() -> None:
+    assert mask_template("{{{raw}}}{{!-- c --}}") == " " * 21
+    assert mask_template("<p>{{ open") == "<p>{{ open"
+    assert mask_template("<p>plain</p>") == "<p>plain</p>"
+
+
+def test_mask_template_is_linear_with_many_unterminated_openers() -> None:
+    text = "<p>{{ ok }}</p>" + "<p>{{ a {% b <% c {{{ d {# e\n" * 20000
+
+    started = time.perf_counter()
+    masked = mask_template(text)
+
+    # A rescan to the end of the text per opener took minutes here.
+    assert time.perf_counter() - started < 2
+    assert masked.startswith("<p>        </p>")
+    assert masked[15:] == text[15:]
+
+
+def test_jinja_template_yields_no_junk_attributes(tmp_path: Path) -> None:
+    path = tmp_path / "page.jinja"
+    path.write_text(
+        "{% extends 'base.html' %}\n"
+        "<input type=\"date\" {% if required %}required{% endif %} value=\"{{ value }}\">\n"
+        "{% for item in items %}\n"
+        "<dialog {{ attrs|xmlattr }}>{{ item }}</dialog>\n"
+        "{% endfor %}\n"
+    )
+
+    detections = {(d.line, d.bcd_key) for d in detect_html(path)}
+
+    assert detections == {
+        (2, "html.elements.input"),
+        (2, "html.elements.input.type"),
+        (2, "html.elements.input.required"),
+        (2, "html.elements.input.value"),
+        (4, "html.elements.dialog"),
+    }
+
+
+def test_erb_and_handlebars_files_are_scanned(tmp_path: Path) -> None:
+    erb = tmp_path / "show.html.erb"
+    erb.write_text('<% if @user %>\n<search <%= data %>></search>\n<% end %>\n')
+    hbs = tmp_path / "card.hbs"
+    hbs.write_text("{{#if open}}<details open>{{/if}}\n")
+
+    assert {(d.line, d.bcd_key) for d in detect_html(erb)} == {(2, "html.elements.search")}
+    assert {d.bcd_key for d in detect_html(hbs)} == {"html.elements.details", "html.elements.details.open"}
+
+
+def test_mask_template_skips_script_and_style_contents(tmp_path: Path) -> None:
+    text = (
+        "<script>\nclass Counter {#count = 0;}\n</script>\n"
+        "<dialog open>{{ title }}</dialog>\n"
+        '<script src="{{ url }}">const end = "#}";</script>\n'
+        "<style>.a{#b{}}</style>{# note #}\n"
+    )
+    masked = mask_template(text)
+
+    assert len(masked) == len(text)
+    assert "class Counter {#count = 0;}\n</script>" in masked
+    assert "<dialog open>           </dialog>" in masked
+    assert '<script src="         ">const end = "#}";</script>' in masked
+    assert masked.endswith("<style>.a{#b{}}</style>          \n")
+
+    path = tmp_path / "page.html"
+    path.write_text(text)
+    assert (4, "html.elements.dialog.open") in {(d.line, d.bcd_key) for d in detect_html(path)}
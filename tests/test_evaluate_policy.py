@@ -81,3 +81,61 @@ def test_evaluate_detections_respects_allowlist_and_unknown_behavior() -> None:
     assert outcomes["html.elements.dialog"] == "warn"  # newly but policy requires widely
 
     assert summary.outcomes == Counter({"pass": 2, "warn": 1})
+
+
+def test_compiled_policy_applies_feature_and_path_overrides() -> None:
+    import pickle
+
+    from baseline_warden.evaluate.policy import compile_policy
+
+    config = BaselineWardenConfig()
+    config.policy.feature_outcomes = {"feature-widely": "warn"}
+    config.policy.path_outcomes = {"legacy/**": "warn"}
+    policy = pickle.loads(pickle.dumps(compile_policy(config)))
+
+    detections = [
+        Detection(path=Path("app/a.css"), line=1, bcd_key="css.properties.display.grid"),
+        Detection(path=Path("app/b.css"), line=1, bcd_key="css.properties.position.sticky"),
+        Detection(path=Path("legacy/c.css"), line=1, bcd_key="css.properties.position.sticky"),
+    ]
+    findings, summary = evaluate_detections(build_index(_lock()), detections, policy)
+    outcomes = {str(f.detection.path.as_posix()): f.outcome for f in findings}
+
+    assert outcomes["app/a.css"] == "warn"  # feature override
+    assert outcomes["app/b.css"] == "fail"
+    assert outcomes["legacy/c.css"] == "warn"  # path rule downgrades the failure
+    assert "legacy/**" in findings[2].message
+    assert summary.outcomes == Counter({"warn": 2, "fail": 1})
+
+
+def test_newly_min_age_months_uses_low_date_ordinals() -> None:
+    from datetime import date
+
+    from baseline_warden.evaluate.policy import months_before
+
+    lock = BaselineLock(
+        features=[
+            LockFeature(feature_id="old", status="newly", low_date="2023-01-15", bcd_keys=["css.properties.old"]),
+            LockFeature(feature_id="young", status="newly", low_date="2024-12-01", bcd_keys=["css.properties.young"]),
+            LockFeature(feature_id="ranged", status="newly", low_date="≤2020-01-29", bcd_keys=["css.properties.ranged"]),
+            LockFeature(feature_id="undated", status="newly", bcd_keys=["css.properties.undated"]),
+        ]
+    )
+    index = build_index(lock)
+    assert index.low_date_ordinals["old"] == date(2023, 1, 15).toordinal()
+    assert index.low_date_ordinals["ranged"] == date(2020, 1, 29).toordinal()
+    assert "undated" not in index.low_date_ordinals
+
+    config = BaselineWardenConfig()
+    config.policy.required_status = "widely"
+    config.policy.newly_min_age_months = 18
+    config.policy.as_of = date(2025, 1, 1)
+    detections = [
+        Detection(path=Path("a.css"), line=1, bcd_key=f"css.properties.{name}")
+        for name in ("old", "young", "ranged", "undated")
+    ]
+    findings, _ = evaluate_detections(index, detections, config)
+    outcomes = {f.feature.feature_id: f.outcome for f in findings}
+
+    assert outcomes == {"old": "pass", "young": "warn", "ranged": "pass", "undated": "warn"}
+    assert months_before(date(2025, 3, 31), 1) == date(2025, 2, 28)
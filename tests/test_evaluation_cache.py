@@ -0,0 +1,90 @@
+import os
+from pathlib import Path
+
+from baseline_warden.config import BaselineWardenConfig
+from baseline_warden.detect.common import Detection
+from baseline_warden.detect.suppress import SuppressionIndex
+from baseline_warden.evaluate import cache as eval_cache_module
+from baseline_warden.evaluate.cache import EvaluationCache, evaluate_with_cache, policy_hash
+from baseline_warden.evaluate.policy import compile_policy, evaluate_detections
+from baseline_warden.evaluate.resolve import build_index
+from baseline_warden.index.cache import BaselineLock, LockFeature, lock_digest
+
+LOCK = BaselineLock(
+    features=[
+        LockFeature(feature_id="sticky", title="Sticky", status="limited", bcd_keys=["css.properties.position.sticky"]),
+        LockFeature(feature_id="grid", title="Grid", status="widely", bcd_keys=["css.properties.display.grid"]),
+    ]
+)
+DETECTIONS = [
+    Detection(Path("a.css"), 1, "css.properties.position.sticky"),
+    Detection(Path("a.css"), 2, "css.properties.mystery"),
+    Detection(Path("b.css"), 1, "css.properties.display.grid"),
+]
+
+
+def _evaluate(directory: Path, config: BaselineWardenConfig, detections=DETECTIONS, lock=LOCK, suppressions=None):
+    cache = EvaluationCache(directory, lock_digest=lock_digest(lock), policy=policy_hash(config))
+    findings, summary = evaluate_with_cache(
+        build_index(lock), detections, compile_policy(config), cache, suppressions=suppressions
+    )
+    cache.save()
+    return cache, findings, summary
+
+
+def _rows(findings):
+    return [
+        (f.detection, f.feature.feature_id if f.feature else None, f.status, f.outcome, f.severity, f.message, f.allowlisted, f.suppressed)
+        for f in findings
+    ]
+
+
+def test_cached_findings_match_a_fresh_evaluation(tmp_path: Path, monkeypatch) -> None:
+    config = BaselineWardenConfig()
+    suppressions = {Path("b.css"): SuppressionIndex()}
+    suppressions[Path("b.css")].add_file(None)
+    expected, expected_summary = evaluate_detections(build_index(LOCK), DETECTIONS, config, suppressions=suppressions)
+
+    first, _, _ = _evaluate(tmp_path, config, suppressions=suppressions)
+    assert (first.hits, first.misses) == (0, 2)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cached files must not be evaluated")
+
+    monkeypatch.setattr(eval_cache_module, "evaluate_detections", fail)
+    second, findings, summary = _evaluate(tmp_path, config, suppressions=suppressions)
+
+    assert (second.hits, second.misses) == (2, 0)
+    assert _rows(findings) == _rows(expected)
+    assert summary == expected_summary
+
+
+def test_changes_invalidate_only_affected_entries(tmp_path: Path) -> None:
+    config = BaselineWardenConfig()
+    _evaluate(tmp_path, config)
+
+    edited = DETECTIONS[:2] + [Detection(Path("b.css"), 3, "css.properties.display.grid")]
+    cache, _, _ = _evaluate(tmp_path, config, detections=edited)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    stricter = BaselineWardenConfig()
+    stricter.allowlist.feature_ids = ["sticky"]
+    cache, findings, _ = _evaluate(tmp_path, stricter, detections=edited)
+    assert (cache.hits, cache.misses) == (0, 2)
+    assert findings[0].allowlisted
+
+    relocked = BaselineLock(features=[LOCK.features[0].model_copy(update={"status": "widely"}), LOCK.features[1]])
+    cache, _, _ = _evaluate(tmp_path, config, detections=edited, lock=relocked)
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+def test_save_evicts_least_recently_used_buckets(tmp_path: Path) -> None:
+    for index in range(3):
+        stale = tmp_path / f"stale{index}.json"
+        stale.write_text("{}")
+        os.utime(stale, (index, index))
+
+    cache = EvaluationCache(tmp_path, lock_digest=lock_digest(LOCK), policy=policy_hash(BaselineWardenConfig()), max_buckets=2)
+    cache.save()
+
+    assert sorted(path.name for path in tmp_path.glob("*.json")) == sorted([cache.path.name, "stale2.json"])
@@ -0,0 +1,73 @@
+import io
+from pathlib import Path
+
+from baseline_warden.config import BaselineWardenConfig
+from baseline_warden.detect.common import Detection
+from baseline_warden.evaluate.policy import evaluate_detections
+from baseline_warden.evaluate.resolve import build_index
+from baseline_warden.index.cache import BaselineLock, LockFeature
+from baseline_warden.outputs.gh_annotations import emit_annotations
+
+
+def _findings(detections):
+    lock = BaselineLock(
+        features=[
+            LockFeature(feature_id="sticky", title="Sticky", status="limited", bcd_keys=["css.properties.position.sticky"]),
+            LockFeature(feature_id="has", title=":has()", status="limited", bcd_keys=["css.selectors.has"]),
+        ]
+    )
+    findings, _ = evaluate_detections(build_index(lock), detections, BaselineWardenConfig())
+    return findings
+
+
+def _emit(detections, *, limit: int) -> list:
+    stream = io.StringIO()
+    emit_annotations(_findings(detections), limit=limit, stream=stream)
+    return stream.getvalue().splitlines()
+
+
+def test_annotations_prefer_errors_and_new_file_feature_pairs() -> None:
+    detections = [Detection(Path("noisy.css"), line, "css.properties.mystery") for line in range(1, 6)]
+    detections.append(Detection(Path("noisy.css"), 6, "css.properties.position.sticky"))
+    detections.append(Detection(Path("other.css"), 1, "css.properties.mystery"))
+
+    lines = _emit(detections, limit=3)
+
+    assert lines == [
+        "::warning file=noisy.css,line=1::Feature mapping is unknown",
+        "::error file=noisy.css,line=6::Sticky: Feature baseline status is limited",
+        "::warning file=other.css,line=1::Feature mapping is unknown",
+        "::notice::Baseline Warden annotated 3 of 7 locations; see the report for all findings",
+    ]
+
+
+def test_annotations_collapse_same_line_and_escape() -> None:
+    detections = [
+        Detection(Path("a,b.css"), 4, "css.properties.position.sticky"),
+        Detection(Path("a,b.css"), 4, "css.selectors.has"),
+    ]
+
+    lines = _emit(detections, limit=50)
+
+    assert lines == [
+        "::error file=a%2Cb.css,line=4::Sticky: Feature baseline status is limited; "
+        ":has(): Feature baseline status is limited"
+    ]
+
+
+def test_annotations_dedupe_repeated_messages_on_a_line() -> None:
+    detections = [Detection(Path("a.css"), 2, "css.properties.position.sticky") for _ in range(3)]
+    detections.append(Detection(Path("a.css"), 2, "css.selectors.has"))
+
+    lines = _emit(detections, limit=50)
+
+    assert lines == [
+        "::error file=a.css,line=2::Sticky: Feature baseline status is limited (×3); "
+        ":has(): Feature baseline status is limited"
+    ]
+
+
+def test_annotation_limit_zero_only_reports_the_total() -> None:
+    lines = _emit([Detection(Path("a.css"), 1, "css.properties.position.sticky")], limit=0)
+
+    assert lines == ["::notice::Baseline Warden annotated 0 of 1 locations; see the report for all findings"]
@@ -0,0 +1,60 @@
+import json
+from pathlib import Path
+
+from baseline_warden.config import BaselineWardenConfig
+from baseline_warden.detect.common import Detection
+from baseline_warden.evaluate.policy import evaluate_detections
+from baseline_warden.evaluate.resolve import build_index
+from baseline_warden.index.cache import BaselineLock, LockFeature
+from baseline_warden.outputs.html import write_html
+
+
+def _payload(path: Path, prefix: str):
+    text = path.read_text(encoding="utf-8")
+    assert text.startswith(prefix) and text.endswith(");\n")
+    return json.loads(text[len(prefix) : -3])
+
+
+def test_html_report_shards_findings_and_indexes_groups(tmp_path: Path) -> None:
+    lock = BaselineLock(
+        features=[
+            LockFeature(feature_id="sticky", title="Sticky", status="limited", bcd_keys=["css.properties.position.sticky"]),
+        ]
+    )
+    detections = [
+        Detection(Path("a.css"), 1, "css.properties.position.sticky"),
+        Detection(Path("a.css"), 2, "css.properties.mystery"),
+        Detection(Path("b.css"), 3, "css.properties.position.sticky"),
+        Detection(Path("c.css"), 4, "css.properties.mystery"),
+        Detection(Path("c.css"), 5, "css.properties.mystery"),
+    ]
+    findings, summary = evaluate_detections(build_index(lock), detections, BaselineWardenConfig())
+    out_dir = tmp_path / "report-html"
+    (out_dir / "data").mkdir(parents=True)
+    (out_dir / "data" / "findings-00009.js").write_text("stale")
+
+    report = write_html(findings, summary, out_dir, shard_size=2)
+
+    assert (report.findings, report.shards) == (5, 3)
+    assert "data/index.js" in report.index_path.read_text()
+    assert sorted(path.name for path in (out_dir / "data").iterdir()) == [
+        "findings-00001.js",
+        "findings-00002.js",
+        "findings-00003.js",
+        "index.js",
+    ]
+    index = _payload(out_dir / "data" / "index.js", "window.bwReport.load(")
+    assert index["summary"]["total"] == 5
+    assert index["files"] == ["a.css", "b.css", "c.css"]
+    features = {group["key"]: group for group in index["features"]}
+    assert features["sticky"]["count"] == 2 and features["sticky"]["shards"] == [0, 1]
+    assert features["css.properties.mystery"]["shards"] == [0, 1, 2]
+    by_file = {group["key"]: group["shards"] for group in index["by_file"]}
+    assert by_file == {"a.css": [0], "b.css": [1], "c.css": [1, 2]}
+
+    rows = _payload(out_dir / "data" / "findings-00002.js", "window.bwReport.addShard(1,")
+    file_id, line, key_id, group_id, outcome, status_id, message_id, flags = rows[0]
+    assert (index["files"][file_id], line, index["keys"][key_id]) == ("b.css", 3, "css.properties.position.sticky")
+    assert group_id == features["sticky"]["id"]
+    assert index["outcomes"][outcome] == "fail" and index["statuses"][status_id] == "limited"
+    assert index["messages"][message_id] == "Feature baseline status is limited" and flags == 0
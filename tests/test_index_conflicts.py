@@ -0,0 +1,57 @@
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from baseline_warden.cli import app
+from baseline_warden.evaluate.resolve import build_index, index_stats
+from baseline_warden.index.cache import BaselineLock, LockFeature, write_lock
+
+
+def _lock() -> BaselineLock:
+    return BaselineLock(
+        features=[
+            LockFeature(feature_id="grid", status="widely", bcd_keys=["css.properties.display.grid", "css.properties.grid"]),
+            LockFeature(feature_id="subgrid", status="newly", bcd_keys=["css.properties.grid"]),
+            LockFeature(feature_id="masonry", status="limited", bcd_keys=["css.properties.grid", "css.properties.masonry"]),
+        ]
+    )
+
+
+@pytest.mark.parametrize(
+    ("strategy", "expected"),
+    [("first", "grid"), ("most_restrictive", "masonry"), ("least_restrictive", "grid")],
+)
+def test_conflict_strategy_picks_resolved_feature(strategy: str, expected: str) -> None:
+    index = build_index(_lock(), strategy=strategy)  # type: ignore[arg-type]
+
+    assert index.features_by_bcd["css.properties.grid"].feature_id == expected
+    assert [feature.feature_id for feature in index.features_for("css.properties.grid")] == ["grid", "subgrid", "masonry"]
+
+
+def test_single_feature_keys_are_not_stored_as_conflicts() -> None:
+    index = build_index(_lock())
+
+    assert list(index.conflicts) == ["css.properties.grid"]
+    assert [feature.feature_id for feature in index.features_for("css.properties.masonry")] == ["masonry"]
+    assert index.features_for("css.properties.unknown") == ()
+
+
+def test_unknown_strategy_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        build_index(_lock(), strategy="random")  # type: ignore[arg-type]
+
+
+def test_index_stats_reports_conflicts(tmp_path: Path) -> None:
+    stats = index_stats(_lock(), strategy="most_restrictive")
+
+    assert (stats.features, stats.bcd_keys, stats.conflicting_keys) == (3, 3, 1)
+    assert stats.resolved["css.properties.grid"].feature_id == "masonry"
+    assert stats.index_bytes > 0
+
+    lock_path = tmp_path / "baseline.lock.json"
+    write_lock(lock_path, _lock())
+    result = CliRunner().invoke(app, ["index", "stats", "--lock-path", str(lock_path)], catch_exceptions=False)
+    assert result.exit_code == 0
+    assert "Conflicting keys: 1 (strategy=first)" in result.stdout
+    assert "css.properties.grid: grid (widely), subgrid (newly), masonry (limited) -> grid" in result.stdout
@@ -0,0 +1,58 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from baseline_warden.config import BaselineWardenConfig
+from baseline_warden.detect.common import Detection
+from baseline_warden.evaluate.policy import evaluate_detections
+from baseline_warden.evaluate.resolve import build_index
+from baseline_warden.evaluate.rollup import rollup_findings
+from baseline_warden.index.cache import BaselineLock, LockFeature
+from baseline_warden.outputs.json import finding_record, summary_record, write_json, write_jsonl
+
+
+def _evaluate(count: int):
+    lock = BaselineLock(
+        features=[LockFeature(feature_id="sticky", title="Sticky", status="limited", bcd_keys=["css.properties.position.sticky"])]
+    )
+    detections = [
+        Detection(path=Path("static/main.css"), line=i, bcd_key="css.properties.position.sticky" if i % 2 else "css.properties.unknown")
+        for i in range(count)
+    ]
+    return evaluate_detections(build_index(lock), detections, BaselineWardenConfig())
+
+
+@pytest.mark.parametrize("count", [0, 1, 5])
+@pytest.mark.parametrize("indent", [2, None])
+def test_write_json_matches_materialized_dump(tmp_path: Path, count: int, indent) -> None:
+    findings, summary = _evaluate(count)
+    rollup = rollup_findings(findings, "bcd-key") if count else None
+    path = tmp_path / "report.json"
+
+    write_json(findings, summary, path, rollup=rollup, indent=indent)
+
+    written = path.read_text(encoding="utf-8")
+    expected = {
+        "version": "1",
+        "generated_at": json.loads(written)["generated_at"],
+        "summary": summary_record(summary),
+        "findings": [finding_record(finding) for finding in findings],
+    }
+    if rollup is not None:
+        expected["group_by"] = "bcd-key"
+        expected["groups"] = json.loads(written)["groups"]
+    assert written == json.dumps(expected, indent=indent)
+
+
+def test_write_jsonl_streams_findings_and_summary_sidecar(tmp_path: Path) -> None:
+    findings, summary = _evaluate(3)
+    path = tmp_path / "report.jsonl"
+
+    sidecar = write_jsonl(findings, summary, path)
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 3
+    assert json.loads(lines[1])["bcd_key"] == "css.properties.position.sticky"
+    assert sidecar == tmp_path / "report.summary.json"
+    assert json.loads(sidecar.read_text())["summary"]["total"] == 3
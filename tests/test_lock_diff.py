@@ -0,0 +1,145 @@
+import json
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from baseline_warden.cli import app
+from baseline_warden.detect.common import Detection
+from baseline_warden.index.cache import BaselineLock, LockFeature, write_lock
+from baseline_warden.index.diff import build_detection_index, diff_features, diff_locks
+
+
+def _feature(feature_id: str, status: str | None, *keys: str) -> LockFeature:
+    return LockFeature(feature_id=feature_id, title=feature_id.title(), status=status, bcd_keys=list(keys))
+
+
+OLD = BaselineLock(
+    features=[
+        _feature("dialog", "newly", "html.elements.dialog"),
+        _feature("has", "limited", "css.selectors.has"),
+        _feature("popover", "limited", "html.global_attributes.popover"),
+        _feature("sticky", "widely", "css.properties.position.sticky"),
+    ]
+)
+NEW = BaselineLock(
+    features=[
+        _feature("dialog", "widely", "html.elements.dialog"),
+        _feature("has", "newly", "css.selectors.has"),
+        _feature("sticky", "widely", "css.properties.position.sticky", "css.properties.position"),
+        _feature("view-transitions", "limited", "css.at-rules.view-transition"),
+    ]
+)
+
+
+def test_diff_features_merges_sorted_feature_lists() -> None:
+    changes = {change.feature_id: change for change in diff_features(OLD.features, NEW.features)}
+
+    assert changes["dialog"].kind == "changed"
+    assert (changes["dialog"].old_status, changes["dialog"].new_status) == ("newly", "widely")
+    assert changes["popover"].kind == "removed"
+    assert changes["view-transitions"].kind == "added"
+    assert changes["sticky"].added_keys == ["css.properties.position"]
+    assert not changes["sticky"].status_changed
+
+
+def test_diff_features_handles_unsorted_input() -> None:
+    changes = diff_features(list(reversed(OLD.features)), list(reversed(NEW.features)))
+
+    assert [change.feature_id for change in changes] == ["dialog", "has", "popover", "sticky", "view-transitions"]
+
+
+def test_diff_locks_lists_affected_files_only() -> None:
+    detections = [
+        Detection(path=Path("src/index.html"), line=3, bcd_key="html.elements.dialog.open"),
+        Detection(path=Path("src/app.css"), line=1, bcd_key="css.properties.position.sticky"),
+        Detection(path=Path("src/app.css"), line=9, bcd_key="css.selectors.has"),
+    ]
+    result = diff_locks(OLD, NEW, detection_index=build_detection_index(detections))
+
+    by_key = {entry.bcd_key: entry for entry in result.affected}
+    # The attribute key resolves through its element fallback.
+    assert by_key["html.elements.dialog.open"].new_status == "widely"
+    assert by_key["css.selectors.has"].files == ["src/app.css"]
+    assert "css.properties.position.sticky" not in by_key
+    assert result.affected_files == ["src/app.css", "src/index.html"]
+
+
+SHARED_KEY = "css.properties.contain"
+SHARED_OLD = BaselineLock(features=[_feature("alpha", "widely", SHARED_KEY), _feature("beta", "limited", SHARED_KEY)])
+SHARED_NEW = BaselineLock(features=[_feature("alpha", "widely", SHARED_KEY), _feature("beta", "newly", SHARED_KEY)])
+
+
+def test_diff_locks_resolves_shared_keys_with_the_strategy() -> None:
+    keys = {SHARED_KEY: ["src/app.css"]}
+
+    assert diff_locks(SHARED_OLD, SHARED_NEW, detection_index=keys).affected == []
+    [entry] = diff_locks(SHARED_OLD, SHARED_NEW, detection_index=keys, strategy="most_restrictive").affected
+    assert (entry.old_feature, entry.old_status, entry.new_status) == ("beta", "limited", "newly")
+
+
+def test_diff_locks_reports_ownership_changes_without_feature_changes() -> None:
+    result = diff_locks(
+        SHARED_OLD,
+        BaselineLock(features=list(reversed(SHARED_OLD.features))),
+        detection_index={SHARED_KEY: ["src/app.css"]},
+    )
+
+    assert result.changes == []
+    assert [(entry.old_feature, entry.new_feature) for entry in result.affected] == [("alpha", "beta")]
+
+
+def test_lock_diff_command_uses_the_configured_strategy(tmp_path: Path) -> None:
+    old_path, new_path, index_path = tmp_path / "old.json", tmp_path / "new.json", tmp_path / "index.json"
+    write_lock(old_path, SHARED_OLD)
+    write_lock(new_path, SHARED_NEW)
+    index_path.write_text(json.dumps({"version": "1", "keys": {SHARED_KEY: ["src/app.css"]}}))
+    config_path = tmp_path / "baseline-warden.toml"
+    config_path.write_text('[policy]\nconflict_strategy = "most_restrictive"\n')
+    args = ["lock", "diff", str(old_path), str(new_path), "--detection-index", str(index_path)]
+
+    configured = CliRunner().invoke(app, [*args, "--config", str(config_path)], catch_exceptions=False)
+    overridden = CliRunner().invoke(app, [*args, "--config", str(config_path), "--strategy", "first"])
+
+    assert f"{SHARED_KEY}: limited -> newly" in configured.stdout
+    assert "No scanned files are affected." in overridden.stdout
+
+
+def test_lock_diff_command(tmp_path: Path) -> None:
+    old_path = tmp_path / "old.lock.json"
+    new_path = tmp_path / "new.lock.json"
+    write_lock(old_path, OLD)
+    write_lock(new_path, NEW)
+    index_path = tmp_path / "detections.json"
+    index_path.write_text(json.dumps({"version": "1", "keys": {"css.selectors.has": ["src/app.css"]}}))
+
+    runner = CliRunner()
+    result = runner.invoke(
+        app,
+        ["lock", "diff", str(old_path), str(new_path), "--detection-index", str(index_path)],
+        catch_exceptions=False,
+    )
+
+    assert result.exit_code == 0
+    assert "dialog (Dialog): newly -> widely" in result.stdout
+    assert "+ view-transitions" in result.stdout
+    assert "1 affected file(s)" in result.stdout
+    assert "src/app.css" in result.stdout
+
+    as_json = runner.invoke(app, ["lock", "diff", str(old_path), str(new_path), "--json"], catch_exceptions=False)
+    data = json.loads(as_json.stdout)
+    assert len(data["changes"]) == 5
+    assert data["affected"] == []
+
+
+def test_lock_digest_command_detects_tampering(tmp_path: Path) -> None:
+    path = tmp_path / "baseline.lock.json"
+    digest = write_lock(path, OLD)
+    runner = CliRunner()
+
+    result = runner.invoke(app, ["lock", "digest", str(path)], catch_exceptions=False)
+    assert result.exit_code == 0
+    assert result.stdout.strip() == digest
+
+    path.write_text(path.read_text().replace('"newly"', '"widely"'))
+    result = runner.invoke(app, ["lock", "digest", str(path)], catch_exceptions=False)
+    assert result.exit_code == 1
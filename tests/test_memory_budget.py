@@ -0,0 +1,37 @@
+from pathlib import Path
+
+from benchmarks.corpus import generate_corpus
+from benchmarks.memory import check_budget, load_budget, measure_scan
+from baseline_warden.memory import MemoryTracker
+
+
+def test_measure_scan_reports_every_stage(tmp_path: Path) -> None:
+    # The budget itself is checked by the CI memory job on a corpus large enough
+    # for the per-file rates to be stable; 30 files are dominated by fixed costs.
+    corpus = tmp_path / "corpus"
+    generate_corpus(corpus, files=30, size=40)
+    report = measure_scan(corpus, report_path=tmp_path / "report.json")
+
+    assert report["files"] == 30
+    assert set(report["stages"]) == {"collect_detections", "build_index", "evaluate_detections", "output:json"}
+    assert set(load_budget()) >= {"peak_heap_bytes_per_10k_files", "retained_bytes_per_detection"}
+    assert report["peak_heap_bytes_per_10k_files"] > 0 and report["retained_bytes_per_detection"] > 0
+
+
+def test_check_budget_reports_overruns() -> None:
+    report = {"peak_heap_bytes_per_10k_files": 2_000, "retained_bytes_per_detection": 10.0}
+
+    assert check_budget(report, {"peak_heap_bytes_per_10k_files": 1_000}) == [
+        "peak_heap_bytes_per_10k_files = 2000 exceeds budget 1000"
+    ]
+
+
+def test_disabled_tracker_is_a_no_op() -> None:
+    memory = MemoryTracker(enabled=False)
+    memory.start()
+    with memory.stage("collect_detections") as usage:
+        usage.items = 3
+    memory.add_file()
+
+    assert memory.stages == {}
+    assert memory.files == 0
@@ -0,0 +1,137 @@
+import json
+import tarfile
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from baseline_warden.cli import app
+from baseline_warden.index.cache import load_lock, lock_digest
+from baseline_warden.index.offline import load_bundle, load_local_sources, write_bundle
+
+WEB_FEATURES = {
+    "features": {
+        "dialog": {"name": "<dialog>", "compat_features": ["html.elements.dialog"]},
+        "has": {"name": ":has()", "compat_features": ["css.selectors.has"]},
+    }
+}
+# Same shape as the sync cache file (`webstatus-baseline.json`).
+WEB_STATUS_CACHE = {
+    "query": "baseline_status:widely OR baseline_status:newly OR baseline_status:limited",
+    "total": 2,
+    "features": [
+        {"feature_id": "dialog", "name": "Dialog", "baseline": {"status": "widely", "low_date": "2022-03-14"}},
+        {"feature_id": "has", "baseline": {"status": "newly", "low_date": "2023-12-19"}},
+    ],
+}
+
+
+def _write_sources(tmp_path: Path, web_status: object = WEB_STATUS_CACHE) -> tuple[Path, Path]:
+    web_features_path = tmp_path / "web-features.json"
+    web_status_path = tmp_path / "webstatus.json"
+    web_features_path.write_text(json.dumps(WEB_FEATURES))
+    web_status_path.write_text(json.dumps(web_status))
+    return web_features_path, web_status_path
+
+
+def test_local_sources_accept_api_response_pages(tmp_path: Path) -> None:
+    page = {"data": WEB_STATUS_CACHE["features"], "metadata": {"total": 2, "next_page_token": None}}
+    sources = load_local_sources(*_write_sources(tmp_path, page))
+
+    assert [feature.feature_id for feature in sources.baseline.features] == ["dialog", "has"]
+    assert sources.baseline.total == 2
+    assert len(sources.metadata["web_features"]["sha256"]) == 64
+
+
+def test_bundle_roundtrip_matches_local_files(tmp_path: Path) -> None:
+    web_features_path, web_status_path = _write_sources(tmp_path)
+    first = tmp_path / "a.tar.gz"
+    second = tmp_path / "b.tar.gz"
+    write_bundle(first, web_features_path, web_status_path)
+    write_bundle(second, web_features_path, web_status_path)
+
+    assert first.read_bytes() == second.read_bytes()
+    bundled = load_bundle(first)
+    local = load_local_sources(web_features_path, web_status_path)
+    assert bundled.metadata["web_status"]["sha256"] == local.metadata["web_status"]["sha256"]
+    assert bundled.baseline.features == local.baseline.features
+
+
+def test_load_bundle_rejects_missing_member(tmp_path: Path) -> None:
+    web_features_path, _ = _write_sources(tmp_path)
+    bundle = tmp_path / "bundle.tar"
+    write_bundle(bundle, web_features_path, web_features_path)
+    broken = tmp_path / "broken.tar"
+    with tarfile.open(bundle) as source, tarfile.open(broken, "w") as target:
+        member = source.getmember("web-features.json")
+        target.addfile(member, source.extractfile(member))
+
+    with pytest.raises(ValueError, match="webstatus.json"):
+        load_bundle(broken)
+
+
+def test_sync_builds_lock_offline(tmp_path: Path) -> None:
+    web_features_path, web_status_path = _write_sources(tmp_path)
+    runner = CliRunner()
+    from_files = tmp_path / "from-files.lock.json"
+    result = runner.invoke(
+        app,
+        ["sync", "--from", str(web_features_path), "--from-status", str(web_status_path), "--lock-path", str(from_files)],
+        catch_exceptions=False,
+    )
+    assert result.exit_code == 0, result.stdout
+
+    lock = load_lock(from_files)
+    assert {feature.feature_id: feature.status for feature in lock.features} == {"dialog": "widely", "has": "newly"}
+    assert lock.metadata["web_features"]["source"] == str(web_features_path)
+
+    bundle = tmp_path / "bundle.tgz"
+    write_bundle(bundle, web_features_path, web_status_path)
+    from_bundle = tmp_path / "from-bundle.lock.json"
+    result = runner.invoke(app, ["sync", "--bundle", str(bundle), "--lock-path", str(from_bundle)], catch_exceptions=False)
+    assert result.exit_code == 0
+    assert lock_digest(load_lock(from_bundle)) == lock_digest(lock)
+
+
+def test_sync_offline_requires_both_files(tmp_path: Path) -> None:
+    web_features_path, _ = _write_sources(tmp_path)
+    result = CliRunner().invoke(app, ["sync", "--from", str(web_features_path)], catch_exceptions=False)
+
+    assert result.exit_code == 2
+    assert "--from-status" in result.stdout
+
+
+def test_local_sources_reject_non_object_status_payload(tmp_path: Path) -> None:
+    web_features_path, web_status_path = _write_sources(tmp_path, web_status=42)
+
+    with pytest.raises(ValueError, match=r"webstatus\.json: expected a JSON object or list of features, got int"):
+        load_local_sources(web_features_path, web_status_path)
+    result = CliRunner().invoke(
+        app, ["sync", "--from", str(web_features_path), "--from-status", str(web_status_path)], catch_exceptions=False
+    )
+    assert result.exit_code == 2
+    assert "Invalid offline dataset" in result.output
+
+
+def test_sync_rejects_write_bundle_offline(tmp_path: Path) -> None:
+    web_features_path, web_status_path = _write_sources(tmp_path)
+    lock_path = tmp_path / "baseline.lock.json"
+    result = CliRunner().invoke(
+        app,
+        [
+            "sync",
+            "--from",
+            str(web_features_path),
+            "--from-status",
+            str(web_status_path),
+            "--lock-path",
+            str(lock_path),
+            "--write-bundle",
+            str(tmp_path / "bundle.tgz"),
+        ],
+        catch_exceptions=False,
+    )
+
+    assert result.exit_code == 2
+    assert "--write-bundle needs an online sync" in result.output
+    assert not lock_path.exists()
@@ -0,0 +1,62 @@
+import json
+import os
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from baseline_warden.cli import app
+from baseline_warden.config import BaselineWardenConfig
+from baseline_warden.detect import collect_detections
+from baseline_warden.index.cache import BaselineLock, write_lock
+from baseline_warden.profiling import ScanProfiler
+
+
+def _project(tmp_path: Path) -> Path:
+    (tmp_path / "templates").mkdir()
+    (tmp_path / "static").mkdir()
+    (tmp_path / "templates" / "index.html").write_text("<dialog popover>Hi</dialog>")
+    (tmp_path / "static" / "main.css").write_text("a { position: sticky; }")
+    config = tmp_path / "baseline-warden.toml"
+    config.write_text('[include]\npaths = ["templates/**/*.html", "static/**/*.css"]\n\n[output]\nformats = ["json"]\n')
+    return config
+
+
+def test_collect_detections_records_stage_and_file_timings(tmp_path: Path) -> None:
+    _project(tmp_path)
+    config = BaselineWardenConfig()
+    config.include.paths = ["templates/**/*.html", "static/**/*.css"]
+    profiler = ScanProfiler()
+
+    detections = collect_detections(tmp_path, config, profiler=profiler)
+
+    stages = profiler.stages
+    assert stages["iter_included_files"].items == 2
+    assert stages["detect_html"].items + stages["detect_css"].items == len(detections)
+    assert {entry.path for entry in profiler.files} == {"templates/index.html", "static/main.css"}
+    assert len(profiler.slowest_files(1)) == 1
+
+
+def test_scan_writes_timing_report_when_bw_trace_set(tmp_path: Path) -> None:
+    config = _project(tmp_path)
+    lock_path = tmp_path / "baseline.lock.json"
+    write_lock(lock_path, BaselineLock())
+
+    runner = CliRunner()
+    cwd = os.getcwd()
+    try:
+        os.chdir(tmp_path)
+        result = runner.invoke(
+            app,
+            ["scan", "--config", str(config), "--lock-path", str(lock_path), "--dry-run", "--pstats", "scan.pstats"],
+            env={"BW_TRACE": "1"},
+            catch_exceptions=False,
+        )
+    finally:
+        os.chdir(cwd)
+
+    assert result.exit_code == 0
+    report = json.loads((tmp_path / "profile.json").read_text())
+    for stage in ("iter_included_files", "detect_html", "detect_css", "build_index", "evaluate_detections", "output:json"):
+        assert stage in report["stages"]
+    assert report["slowest_files"]
+    assert (tmp_path / "scan.pstats").exists()
@@ -0,0 +1,84 @@
+from pathlib import Path
+
+from baseline_warden.config import BaselineWardenConfig
+from baseline_warden.detect.common import Detection
+from baseline_warden.evaluate.policy import evaluate_detections
+from baseline_warden.evaluate.resolve import build_index
+from baseline_warden.evaluate.rollup import rollup_findings
+from baseline_warden.index.cache import BaselineLock, LockFeature
+
+
+def _findings():
+    lock = BaselineLock(
+        features=[
+            LockFeature(feature_id="sticky", title="Sticky", status="limited", bcd_keys=["css.properties.position.sticky"]),
+            LockFeature(feature_id="grid", title="Grid", status="widely", bcd_keys=["css.properties.display.grid"]),
+        ]
+    )
+    detections = [
+        Detection(path=Path(f"f{i % 3}.css"), line=i, bcd_key="css.properties.position.sticky") for i in range(1, 21)
+    ]
+    detections.append(Detection(path=Path("g.css"), line=1, bcd_key="css.properties.display.grid"))
+    findings, _ = evaluate_detections(build_index(lock), detections, BaselineWardenConfig())
+    return findings
+
+
+def test_rollup_by_feature_counts_and_bounds_samples() -> None:
+    rollup = rollup_findings(_findings(), "feature", sample_size=3)
+
+    groups = rollup.groups
+    assert [group.key for group in groups] == ["sticky", "grid"]
+    sticky = groups[0]
+    assert sticky.count == 20
+    assert sticky.severity == "error"
+    assert sticky.outcomes["fail"] == 20
+    assert len(sticky.samples) == 3
+    assert sticky.samples[0] == (Path("f1.css"), 1)
+
+
+def test_rollup_by_file_groups_per_path() -> None:
+    rollup = rollup_findings(_findings(), "file")
+
+    counts = {group.key: group.count for group in rollup.groups}
+    assert counts == {"f0.css": 6, "f1.css": 7, "f2.css": 7, "g.css": 1}
+
+
+def test_scan_group_by_writes_groups_to_json(tmp_path: Path) -> None:
+    import json
+    import os
+
+    from typer.testing import CliRunner
+
+    from baseline_warden.cli import app
+    from baseline_warden.index.cache import write_lock
+
+    (tmp_path / "static").mkdir()
+    (tmp_path / "static" / "main.css").write_text("a { position: sticky; }\nb { position: sticky; }")
+    config = tmp_path / "baseline-warden.toml"
+    config.write_text('[include]\npaths = ["static/**/*.css"]\n\n[output]\nformats = ["console", "json"]\n')
+    lock_path = tmp_path / "baseline.lock.json"
+    write_lock(
+        lock_path,
+        BaselineLock(
+            features=[LockFeature(feature_id="sticky", title="Sticky", status="limited", bcd_keys=["css.properties.position.sticky"])]
+        ),
+    )
+
+    runner = CliRunner()
+    cwd = os.getcwd()
+    try:
+        os.chdir(tmp_path)
+        result = runner.invoke(
+            app,
+            ["scan", "--config", str(config), "--lock-path", str(lock_path), "--group-by", "feature", "--dry-run"],
+            catch_exceptions=False,
+        )
+    finally:
+        os.chdir(cwd)
+
+    assert result.exit_code == 0
+    report = json.loads((tmp_path / "report.json").read_text())
+    assert report["group_by"] == "feature"
+    sticky = next(group for group in report["groups"] if group["key"] == "sticky")
+    assert sticky["count"] == 2
+    assert sticky["samples"][0] == {"file": str(Path("static/main.css")), "line": 1}
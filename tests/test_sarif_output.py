@@ -0,0 +1,54 @@
+import json
+from pathlib import Path
+
+from baseline_warden.config import BaselineWardenConfig
+from baseline_warden.detect.common import Detection
+from baseline_warden.evaluate.policy import evaluate_detections
+from baseline_warden.evaluate.resolve import build_index
+from baseline_warden.index.cache import BaselineLock, LockFeature
+from baseline_warden.outputs.sarif import write_sarif
+
+
+def _lock() -> BaselineLock:
+    return BaselineLock(
+        features=[
+            LockFeature(feature_id="sticky", title="Sticky", status="limited", bcd_keys=["css.properties.position.sticky"]),
+            LockFeature(feature_id="grid", title="Grid", status="widely", bcd_keys=["css.properties.display.grid"]),
+        ]
+    )
+
+
+def _sarif(tmp_path: Path, detections) -> dict:
+    findings, summary = evaluate_detections(build_index(_lock()), detections, BaselineWardenConfig())
+    path = tmp_path / "report.sarif"
+    write_sarif(findings, summary, path)
+    return json.loads(path.read_text())
+
+
+def test_sarif_deduplicates_rules_and_references_by_index(tmp_path: Path) -> None:
+    detections = [
+        Detection(path=Path("a.css"), line=1, bcd_key="css.properties.position.sticky"),
+        Detection(path=Path("a.css"), line=2, bcd_key="css.properties.display.grid"),
+        Detection(path=Path("b.css"), line=3, bcd_key="css.properties.position.sticky"),
+        Detection(path=Path("b.css"), line=4, bcd_key="css.properties.mystery"),
+    ]
+    log = _sarif(tmp_path, detections)
+
+    run = log["runs"][0]
+    rules = run["tool"]["driver"]["rules"]
+    assert [rule["id"] for rule in rules] == ["sticky", "unmapped"]
+    results = run["results"]
+    assert len(results) == 3  # passing grid finding skipped
+    assert [result["ruleIndex"] for result in results] == [0, 0, 1]
+    assert results[0]["level"] == "error"
+    assert results[2]["level"] == "warning"
+    assert results[1]["locations"][0]["physicalLocation"]["artifactLocation"]["uri"] == "b.css"
+
+
+def test_sarif_fingerprints_survive_line_shifts(tmp_path: Path) -> None:
+    before = _sarif(tmp_path, [Detection(path=Path("a.css"), line=1, bcd_key="css.properties.position.sticky")])
+    after = _sarif(tmp_path, [Detection(path=Path("a.css"), line=9, bcd_key="css.properties.position.sticky")])
+
+    fp_before = before["runs"][0]["results"][0]["partialFingerprints"]
+    fp_after = after["runs"][0]["results"][0]["partialFingerprints"]
+    assert fp_before == fp_after
@@ -61,14 +61,60 @@ formats = ["console", "json"]
             ["scan", "--config", str(config), "--lock-path", str(lock_path)],
             catch_exceptions=False,
         )
+        first_report = (tmp_path / "report.json").read_text()
+        rerun = runner.invoke(
+            app,
+            ["scan", "--config", str(config), "--lock-path", str(lock_path)],
+            catch_exceptions=False,
+        )
     finally:
         os.chdir(cwd)
 
     assert result.exit_code == 1
     assert "Baseline violations detected" in result.output
+    assert "Evaluation cache" not in result.output
+    assert "Evaluation cache: 2 of 2 files reused." in rerun.output
+    assert json.loads((tmp_path / "report.json").read_text())["findings"] == json.loads(first_report)["findings"]
 
     report_path = tmp_path / "report.json"
     assert report_path.exists()
     report = json.loads(report_path.read_text())
     status_counts = report["summary"]["statuses"]
     assert status_counts["limited"] >= 1
+
+
+def test_scan_drops_unmapped_attribute_keys_unless_exhaustive(tmp_path: Path) -> None:
+    (tmp_path / "templates").mkdir()
+    (tmp_path / "templates" / "index.html").write_text('<dialog open closedby="any">Test</dialog>')
+    config = tmp_path / "baseline-warden.toml"
+    config.write_text('[include]\npaths = ["templates/**/*.html"]\n\n[output]\nformats = ["json"]\n')
+    lock = BaselineLock(
+        features=[
+            LockFeature(feature_id="dialog", title="Dialog", status="widely", bcd_keys=["html.elements.dialog"]),
+            LockFeature(
+                feature_id="dialog-closedby",
+                title="closedby",
+                status="limited",
+                bcd_keys=["html.elements.dialog.closedby"],
+            ),
+        ]
+    )
+    lock_path = tmp_path / "baseline.lock.json"
+    write_lock(lock_path, lock)
+
+    def scanned_keys(*extra: str) -> list:
+        cwd = os.getcwd()
+        try:
+            os.chdir(tmp_path)
+            CliRunner().invoke(app, ["scan", "--config", str(config), "--lock-path", str(lock_path), *extra])
+        finally:
+            os.chdir(cwd)
+        report = json.loads((tmp_path / "report.json").read_text())
+        return sorted(finding["bcd_key"] for finding in report["findings"])
+
+    assert scanned_keys() == ["html.elements.dialog", "html.elements.dialog.closedby"]
+    assert scanned_keys("--exhaustive") == [
+        "html.elements.dialog",
+        "html.elements.dialog.closedby",
+        "html.elements.dialog.open",
+    ]
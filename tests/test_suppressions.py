@@ -0,0 +1,91 @@
+from pathlib import Path
+
+from baseline_warden.config import BaselineWardenConfig
+from baseline_warden.detect import collect_detections
+from baseline_warden.detect.css import scan_css
+from baseline_warden.detect.html import scan_html
+from baseline_warden.detect.suppress import SuppressionIndex, css_suppressions
+from baseline_warden.evaluate.policy import evaluate_detections
+from baseline_warden.evaluate.resolve import build_index
+from baseline_warden.index.cache import BaselineLock, LockFeature
+
+
+def test_css_directives_cover_their_line_or_the_next_line(tmp_path: Path) -> None:
+    path = tmp_path / "main.css"
+    path.write_text(
+        "a {\n"
+        "  /* bw-ignore-next-line css.properties.position */\n"
+        "  position: sticky;\n"
+        "  display: grid; /* bw-ignore */\n"
+        "  inset: 0;\n"
+        "}\n"
+    )
+    scan = scan_css(path)
+
+    assert scan.suppressions.suppresses(3, "css.properties.position.sticky")
+    assert not scan.suppressions.suppresses(3, "css.properties.display")
+    assert scan.suppressions.suppresses(4, "css.properties.display.grid")
+    assert not scan.suppressions.suppresses(5, "css.properties.inset")
+
+
+def test_css_directives_inside_strings_are_not_comments() -> None:
+    index = css_suppressions(
+        'a::before { content: "/* bw-ignore */"; position: sticky; }\n'
+        "b::after { content: 'it\\'s /* bw-ignore-file */'; }\n"
+        "/* bw-ignore-next-line css.selectors.has */\n"
+        "c:has(d) {}\n"
+    )
+
+    assert not index.suppresses(1, "css.properties.position.sticky")
+    assert not index.suppresses(2, "css.selectors.after")
+    assert index.suppresses(4, "css.selectors.has")
+
+
+def test_html_next_line_and_file_directives(tmp_path: Path) -> None:
+    path = tmp_path / "index.html"
+    path.write_text(
+        "<!-- bw-ignore-file html.elements.marquee -->\n"
+        "<!-- bw-ignore-next-line -->\n"
+        "<dialog popover></dialog>\n"
+        "<dialog></dialog>\n"
+        "<marquee></marquee>\n"
+    )
+    scan = scan_html(path)
+
+    assert scan.suppressions.suppresses(3, "html.elements.dialog.popover")
+    assert not scan.suppressions.suppresses(4, "html.elements.dialog")
+    assert scan.suppressions.suppresses(5, "html.elements.marquee")
+
+
+def test_suppression_index_handles_unsorted_and_overlapping_intervals() -> None:
+    index = SuppressionIndex()
+    index.add_lines(50, 51, frozenset({"a"}))
+    index.add_lines(10, 30, None)
+    index.add_lines(12, 13, frozenset({"b"}))
+
+    assert index.suppresses(25, "anything")
+    assert index.suppresses(51, "a.child")
+    assert not index.suppresses(52, "a")
+    assert not index.suppresses(9, "b")
+
+
+def test_evaluate_marks_suppressed_findings_as_passing(tmp_path: Path) -> None:
+    (tmp_path / "static").mkdir()
+    (tmp_path / "static" / "main.css").write_text(
+        "a { position: sticky; } /* bw-ignore */\nb { position: sticky; }\n"
+    )
+    config = BaselineWardenConfig()
+    config.include.paths = ["static/**/*.css"]
+    lock = BaselineLock(
+        features=[LockFeature(feature_id="sticky", status="limited", bcd_keys=["css.properties.position.sticky"])]
+    )
+
+    suppressions = {}
+    detections = collect_detections(tmp_path, config, suppressions=suppressions)
+    findings, summary = evaluate_detections(build_index(lock), detections, config, suppressions=suppressions)
+
+    sticky = [f for f in findings if f.detection.bcd_key == "css.properties.position.sticky"]
+    assert [(f.detection.line, f.outcome) for f in sticky] == [(1, "pass"), (2, "fail")]
+    assert sticky[0].message == "Suppressed by inline bw-ignore directive"
+    assert (sticky[0].suppressed, sticky[0].allowlisted) == (True, False)
+    assert summary.outcomes["fail"] == 1
@@ -0,0 +1,100 @@
+import os
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from baseline_warden.cli import app
+from baseline_warden.config import BaselineWardenConfig
+from baseline_warden.detect import collect_detections
+from baseline_warden.evaluate.resolve import build_index
+from baseline_warden.index.cache import BaselineLock, LockFeature, write_lock
+from baseline_warden.workspace import ConfigResolver, evaluate_workspace, merge_config_data
+
+STICKY = "css.properties.position.sticky"
+
+
+def _lock() -> BaselineLock:
+    return BaselineLock(
+        features=[
+            LockFeature(feature_id="sticky", title="Sticky", status="limited", bcd_keys=[STICKY]),
+            LockFeature(feature_id="dialog", title="Dialog", status="newly", bcd_keys=["html.elements.dialog"]),
+        ]
+    )
+
+
+def _monorepo(tmp_path: Path) -> None:
+    for package in ("app", "legacy", "legacy/nested"):
+        (tmp_path / "packages" / package / "static").mkdir(parents=True)
+        (tmp_path / "packages" / package / "static" / "main.css").write_text("a { position: sticky; }")
+    (tmp_path / "packages" / "legacy" / "static" / "page.html").write_text("<dialog>Hi</dialog>")
+    (tmp_path / "packages" / "legacy" / "baseline-warden.toml").write_text(
+        '[policy]\nrequired_status = "widely"\n\n[allowlist]\nfeature_ids = ["sticky"]\n'
+    )
+    (tmp_path / "packages" / "legacy" / "nested" / "baseline-warden.toml").write_text(
+        '[ignore]\nglobs = ["static/**"]\n'
+    )
+
+
+def test_merge_config_data_merges_tables_and_replaces_lists() -> None:
+    parent = {"policy": {"required_status": "widely", "unknown_behavior": "warn"}, "allowlist": {"bcd_keys": ["a"]}}
+    child = {"policy": {"unknown_behavior": "fail"}, "allowlist": {"bcd_keys": ["b"]}}
+
+    merged = merge_config_data(parent, child)
+
+    assert merged["policy"] == {"required_status": "widely", "unknown_behavior": "fail"}
+    assert merged["allowlist"] == {"bcd_keys": ["b"]}
+
+
+def test_evaluate_workspace_uses_nearest_ancestor_config(tmp_path: Path) -> None:
+    _monorepo(tmp_path)
+    config = BaselineWardenConfig()
+    config.include.paths = ["packages/**/*"]
+    resolver = ConfigResolver(tmp_path, config)
+
+    detections = collect_detections(tmp_path, config)
+    findings, summary = evaluate_workspace(tmp_path, build_index(_lock()), detections, config, resolver=resolver)
+
+    outcomes = {(f.detection.path.as_posix(), f.detection.bcd_key): f.outcome for f in findings}
+    assert outcomes[("packages/app/static/main.css", STICKY)] == "fail"
+    assert outcomes[("packages/legacy/static/main.css", STICKY)] == "pass"  # allowlisted by legacy config
+    assert outcomes[("packages/legacy/static/page.html", "html.elements.dialog")] == "warn"  # requires widely
+    # nested config inherits legacy settings and ignores its own static/ folder
+    assert not any(path.startswith("packages/legacy/nested/") for path, _ in outcomes)
+    assert summary.total == len(findings)
+    assert [scope.directory.as_posix() for scope in resolver.scopes] == [".", "packages/legacy", "packages/legacy/nested"]
+    nested = resolver.for_directory(Path("packages/legacy/nested/static"))
+    assert nested.config.allowlist.feature_ids == ["sticky"]
+
+
+def test_inherited_root_ignore_globs_are_not_reapplied_in_nested_scopes(tmp_path: Path) -> None:
+    (tmp_path / "packages" / "app" / "dist").mkdir(parents=True)
+    (tmp_path / "packages" / "app" / "dist" / "main.css").write_text("a { position: sticky; }")
+    (tmp_path / "packages" / "app" / "baseline-warden.toml").write_text('[policy]\nunknown_behavior = "fail"\n')
+    config = BaselineWardenConfig()
+    config.include.paths = ["packages/**/*"]
+    config.ignore.globs = ["dist/**"]
+
+    detections = collect_detections(tmp_path, config)
+    findings, _ = evaluate_workspace(tmp_path, build_index(_lock()), detections, config)
+
+    assert {f.detection.path.as_posix() for f in findings} == {"packages/app/dist/main.css"}
+
+
+def test_scan_workspace_flag(tmp_path: Path) -> None:
+    _monorepo(tmp_path)
+    config = tmp_path / "baseline-warden.toml"
+    config.write_text('[include]\npaths = ["packages/legacy/**/*"]\n\n[output]\nformats = ["console"]\n')
+    lock_path = tmp_path / "baseline.lock.json"
+    write_lock(lock_path, _lock())
+
+    runner = CliRunner()
+    cwd = os.getcwd()
+    try:
+        os.chdir(tmp_path)
+        flat = runner.invoke(app, ["scan", "--config", str(config), "--lock-path", str(lock_path)])
+        scoped = runner.invoke(app, ["scan", "--config", str(config), "--lock-path", str(lock_path), "--workspace"])
+    finally:
+        os.chdir(cwd)
+
+    assert flat.exit_code == 1
+    assert scoped.exit_code == 0